@@ -0,0 +1,180 @@
+"""Benchmarks of the functions exported by `comchoice.aggregate`."""
+import numpy as np
+import pandas as pd
+
+import comchoice.aggregate as agg
+
+from .common import DENSITY, MAX_COST, N_ALTERNATIVES, N_VOTERS, PARTIAL, TIES, \
+    alternatives_labels, ballots, pairwise, scores, skip_if
+
+# Rules of ranked ballots: (power, max_alternatives). The cost of an election
+# is its number of unique ballots times n_alternatives ** power.
+RANKED = {
+    "ahp": (2, 100),
+    "antiplurality": (1, 1000),
+    "baldwin": (2, 100),
+    "black": (2, 100),
+    "borda": (1, 1000),
+    "bradley_terry": (2, 100),
+    "bucklin_judgment": (1, 1000),
+    "central_judgment": (1, 1000),
+    "condorcet": (2, 100),
+    "coombs": (2, 100),
+    "copeland": (2, 100),
+    "divisiveness": (3, 10),
+    "dodgson": (2, 100),
+    "dodgson_exact": (2, 8),
+    "dodgson_quick": (2, 100),
+    "dowdall": (1, 1000),
+    "elo": (2, 100),
+    "fallback": (1, 1000),
+    "irv": (2, 100),
+    "judgment": (1, 1000),
+    "k_approval": (1, 1000),
+    "kemeny_young": (2, 8),
+    "majority_judgment": (1, 1000),
+    "minimax": (2, 100),
+    "nanson": (2, 100),
+    "nanson_baldwin": (2, 100),
+    "pairwise_matrix": (2, 100),
+    "plurality": (1, 1000),
+    "ranked_pairs": (2, 100),
+    "schulze": (2, 100),
+    "simpson": (2, 100),
+    "smith_set": (2, 100),
+    "stv": (2, 100),
+    "tideman": (2, 100),
+    "typical_judgment": (1, 1000),
+    "usual_judgment": (1, 1000)
+}
+
+# Rules that compare alternatives through `to_pairwise`, which only
+# supports complete ballots without ties.
+TO_PAIRWISE = ["ahp", "divisiveness", "elo"]
+
+APPROVAL = ["approval", "pav", "phragmen", "sav"]
+SCORE = ["cumulative", "negative", "score"]
+PAIRWISE = ["win_rate"]
+QUOTA = ["droop_quota", "hagenbach_bischoff_quota", "hare_quota", "imperiali_quota", "quota"]
+
+KWS = {
+    "divisiveness": dict(dtype="ballot", method=agg.borda, verbose=False),
+    "spatial": dict(showHeatmap=False)
+}
+
+
+class RankedRules:
+    """Rules of ranked ballots over voters, alternatives, ties and partial ballots."""
+    params = [list(RANKED), N_VOTERS, N_ALTERNATIVES, TIES, PARTIAL]
+    param_names = ["rule", "n_voters", "n_alternatives", "ties", "partial"]
+    timeout = 600
+
+    def setup(self, rule, n_voters, n_alternatives, ties, partial):
+        power, max_alternatives = RANKED[rule]
+        skip_if(n_alternatives > max_alternatives, "too many alternatives")
+        skip_if(rule in TO_PAIRWISE and (ties or partial),
+                "ties and partial ballots not supported")
+
+        self.df = ballots(n_voters, n_alternatives, ties, partial)
+        skip_if(len(self.df) * n_alternatives ** power > MAX_COST, "too expensive")
+
+        if rule == "fallback":
+            self.df = self.df.rename(columns={"ballot": "alternatives"})
+        self.function = getattr(agg, rule)
+        self.kws = KWS.get(rule, {})
+
+    def time_rule(self, rule, n_voters, n_alternatives, ties, partial):
+        self.function(self.df.copy(), **self.kws)
+
+    def peakmem_rule(self, rule, n_voters, n_alternatives, ties, partial):
+        self.function(self.df.copy(), **self.kws)
+
+
+class ApprovalRules:
+    """Rules of approval ballots over voters and alternatives."""
+    params = [APPROVAL, N_VOTERS, N_ALTERNATIVES, PARTIAL]
+    param_names = ["rule", "n_voters", "n_alternatives", "partial"]
+    timeout = 600
+
+    def setup(self, rule, n_voters, n_alternatives, partial):
+        self.df = ballots(n_voters, n_alternatives, False, partial, delimiter=",")
+        skip_if(len(self.df) * n_alternatives ** 2 > MAX_COST, "too expensive")
+        self.function = getattr(agg, rule)
+
+    def time_rule(self, rule, n_voters, n_alternatives, partial):
+        self.function(self.df.copy(), delimiter=",")
+
+
+class ScoreRules:
+    """Rules of scores over voters and alternatives."""
+    params = [SCORE, N_VOTERS, N_ALTERNATIVES]
+    param_names = ["rule", "n_voters", "n_alternatives"]
+    timeout = 600
+
+    def setup(self, rule, n_voters, n_alternatives):
+        skip_if(n_voters * n_alternatives > MAX_COST, "too expensive")
+        self.df = scores(n_voters, n_alternatives)
+        self.function = getattr(agg, rule)
+
+    def time_rule(self, rule, n_voters, n_alternatives):
+        self.function(self.df.copy())
+
+
+class PairwiseRules:
+    """Rules of pairwise comparisons over voters, alternatives, ties and density of pairs."""
+    params = [PAIRWISE, N_VOTERS, N_ALTERNATIVES, TIES, DENSITY]
+    param_names = ["rule", "n_voters", "n_alternatives", "ties", "density"]
+    timeout = 600
+
+    def setup(self, rule, n_voters, n_alternatives, ties, density):
+        skip_if(n_voters * density * n_alternatives ** 2 / 2 > MAX_COST, "too expensive")
+        self.df = pairwise(n_voters, n_alternatives, ties, density)
+        self.function = getattr(agg, rule)
+
+    def time_rule(self, rule, n_voters, n_alternatives, ties, density):
+        self.function(self.df.copy())
+
+
+class Dhondt:
+    """D'Hondt method over parties and seats."""
+    params = [N_ALTERNATIVES, [1, 10, 100]]
+    param_names = ["n_parties", "n_seats"]
+
+    def setup(self, n_parties, n_seats):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            "party": alternatives_labels(n_parties),
+            "votes": rng.integers(1, 10 ** 6, size=n_parties)
+        })
+
+    def time_dhondt(self, n_parties, n_seats):
+        agg.dhondt(self.df, n_seats=n_seats)
+
+
+class Quotas:
+    """Electoral quotas."""
+    params = [QUOTA]
+    param_names = ["rule"]
+
+    def time_quota(self, rule):
+        if rule == "quota":
+            agg.quota("droop", n_votes=10 ** 6, n_seats=10)
+        else:
+            getattr(agg, rule)(n_votes=10 ** 6, n_seats=10)
+
+
+class Spatial:
+    """Spatial aggregation over voters and grid cells."""
+    params = [["condorcet", "copeland", "plurality"], N_VOTERS[:4], [1, 100]]
+    param_names = ["method", "n_voters", "n_cells"]
+    timeout = 600
+
+    def setup(self, method, n_voters, n_cells):
+        df = ballots(n_voters, 3)
+        rng = np.random.default_rng(0)
+        df["grid_list"] = [f"{i},{j}" for i, j in rng.integers(
+            0, int(np.sqrt(n_cells)), size=(len(df), 2))]
+        self.df = df
+
+    def time_spatial(self, method, n_voters, n_cells):
+        agg.spatial(self.df, method=method, **KWS["spatial"])
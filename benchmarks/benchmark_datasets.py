@@ -0,0 +1,117 @@
+"""Benchmarks of the functions exported by `comchoice.datasets`."""
+import os
+import shutil
+import tempfile
+
+import comchoice.datasets as ds
+
+from .common import DENSITY, MAX_CELLS, MAX_COST, N_ALTERNATIVES, N_VOTERS, PARTIAL, \
+    profile, skip_if
+
+CULTURES = ["impartial", "mallows", "plackett_luce", "urn", "spatial"]
+MODELS = ["impartial", "bradley_terry", "thurstone"]
+
+
+def write_preflib(path, n_voters, n_alternatives, partial=False):
+    # Writes a PrefLib file ("soc", or "soi" for partial ballots).
+    p = profile(n_voters, n_alternatives, False, partial)
+    data_type = "soi" if partial else "soc"
+    orders = p.orders + 1
+
+    with open(path, "w") as file:
+        file.write(f"# FILE NAME: {os.path.basename(path)}\n")
+        file.write(f"# DATA TYPE: {data_type}\n")
+        file.write(f"# NUMBER ALTERNATIVES: {n_alternatives}\n")
+        file.write(f"# NUMBER VOTERS: {p.n_voters}\n")
+        file.write(f"# NUMBER UNIQUE ORDERS: {p.n_ballots}\n")
+        for i, alternative in enumerate(p.alternatives):
+            file.write(f"# ALTERNATIVE NAME {i + 1}: {alternative}\n")
+        for weight, order in zip(p.weights, orders):
+            file.write(f"{weight}: {','.join(map(str, order[order > 0]))}\n")
+
+
+class SyntheticElection:
+    """Synthetic elections over cultures, voters and alternatives."""
+    params = [CULTURES, N_VOTERS, N_ALTERNATIVES, ["ballot", "profile"]]
+    param_names = ["culture", "n_voters", "n_alternatives", "output"]
+    timeout = 600
+
+    def setup(self, culture, n_voters, n_alternatives, output):
+        skip_if(n_voters * n_alternatives > MAX_CELLS, "input too large")
+        skip_if(output == "ballot" and n_voters * n_alternatives > MAX_COST, "too expensive")
+
+    def time_set_synthetic_election(self, culture, n_voters, n_alternatives, output):
+        ds.set_synthetic_election(
+            n_voters=n_voters,
+            n_alternatives=n_alternatives,
+            culture=culture,
+            output=output,
+            random_state=0
+        )
+
+
+class SyntheticPairwise:
+    """Synthetic pairwise comparisons over models, voters, alternatives and density of pairs."""
+    params = [MODELS, N_VOTERS, N_ALTERNATIVES, DENSITY]
+    param_names = ["model", "n_voters", "n_alternatives", "density"]
+    timeout = 600
+
+    def setup(self, model, n_voters, n_alternatives, density):
+        self.n_pairs = max(int(density * n_alternatives * (n_alternatives - 1) / 2), 1)
+        skip_if(n_voters * self.n_pairs > MAX_COST, "too expensive")
+
+    def time_set_synthetic_pairwise(self, model, n_voters, n_alternatives, density):
+        ds.set_synthetic_pairwise(
+            n_voters=n_voters,
+            n_alternatives=n_alternatives,
+            model=model,
+            n_pairs=self.n_pairs,
+            random_state=0
+        )
+
+
+class Preflib:
+    """Parsers of PrefLib files over voters, alternatives and partial ballots."""
+    params = [N_VOTERS[:5], N_ALTERNATIVES, PARTIAL]
+    param_names = ["n_voters", "n_alternatives", "partial"]
+    timeout = 600
+
+    def setup(self, n_voters, n_alternatives, partial):
+        skip_if(n_voters * n_alternatives > MAX_COST, "too expensive")
+        self.path = tempfile.mkdtemp()
+        self.file = os.path.join(self.path, "election.soi" if partial else "election.soc")
+        write_preflib(self.file, n_voters, n_alternatives, partial)
+
+    def teardown(self, n_voters, n_alternatives, partial):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def time_from_preflib(self, n_voters, n_alternatives, partial):
+        ds.from_preflib(self.file)
+
+    def time_from_preflib_profile(self, n_voters, n_alternatives, partial):
+        ds.from_preflib(self.file, profile=True)
+
+
+class PreflibDir:
+    """Index and bulk loader of directories of PrefLib files over the number of files."""
+    params = [[10, 100, 1000], [1, 4]]
+    param_names = ["n_files", "n_jobs"]
+    timeout = 600
+
+    def setup(self, n_files, n_jobs):
+        self.path = tempfile.mkdtemp()
+        write_preflib(os.path.join(self.path, "00000.soc"), 10 ** 3, 10)
+        for i in range(1, n_files):
+            shutil.copy(
+                os.path.join(self.path, "00000.soc"),
+                os.path.join(self.path, f"{i:05d}.soc")
+            )
+
+    def teardown(self, n_files, n_jobs):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def time_preflib_index(self, n_files, n_jobs):
+        ds.preflib_index(self.path, n_jobs=n_jobs)
+
+    def time_load_preflib_dir(self, n_files, n_jobs):
+        ds.load_preflib_dir(self.path, n_jobs=n_jobs)
@@ -0,0 +1,119 @@
+"""Benchmarks of the functions exported by `comchoice.preprocessing`."""
+import os
+import shutil
+import tempfile
+
+import comchoice.preprocessing as pp
+
+from .common import DENSITY, MAX_COST, N_ALTERNATIVES, N_VOTERS, PARTIAL, TIES, \
+    ballots, pairwise, profile, scores, skip_if
+
+# Conversions of ballots: (power, max_alternatives), as in `RANKED`.
+CONVERSIONS = {
+    "ballot_extend": (1, 1000),
+    "to_individual_voter": (1, 1000),
+    "to_pairwise": (2, 100),
+    "to_profile": (1, 1000),
+    "to_rank": (1, 1000),
+    "unpack_ballot": (1, 1000)
+}
+
+KWS = {
+    "to_pairwise": dict(dtype="ballot", verbose=False)
+}
+
+PROFILE_METHODS = ["compress", "first_preferences", "orders", "pairwise_matrix", "rank_matrix", "to_ballot"]
+
+
+class Conversions:
+    """Conversions of ranked ballots over voters, alternatives, ties and partial ballots."""
+    params = [list(CONVERSIONS), N_VOTERS, N_ALTERNATIVES, TIES, PARTIAL]
+    param_names = ["function", "n_voters", "n_alternatives", "ties", "partial"]
+    timeout = 600
+
+    def setup(self, function, n_voters, n_alternatives, ties, partial):
+        power, max_alternatives = CONVERSIONS[function]
+        skip_if(n_alternatives > max_alternatives, "too many alternatives")
+        skip_if(function == "to_pairwise" and (ties or partial), "ties and partial ballots not supported")
+
+        self.df = ballots(n_voters, n_alternatives, ties, partial)
+        # Individual voters are expanded row by row.
+        n_rows = n_voters if function in ["to_individual_voter", "unpack_ballot"] else len(self.df)
+        skip_if(n_rows * n_alternatives ** power > MAX_COST, "too expensive")
+
+        self.function = getattr(pp, function)
+        self.kws = KWS.get(function, {})
+
+    def time_conversion(self, function, n_voters, n_alternatives, ties, partial):
+        self.function(self.df.copy(), **self.kws)
+
+    def peakmem_conversion(self, function, n_voters, n_alternatives, ties, partial):
+        self.function(self.df.copy(), **self.kws)
+
+
+class ScoreExtend:
+    """Conversion of score ballots (e.g., `a=5;b=3`) over voters and alternatives."""
+    params = [N_VOTERS, N_ALTERNATIVES]
+    param_names = ["n_voters", "n_alternatives"]
+    timeout = 600
+
+    def setup(self, n_voters, n_alternatives):
+        skip_if(n_voters * n_alternatives > MAX_COST, "too expensive")
+        df = scores(n_voters, n_alternatives)
+        items = df["alternative"] + "=" + df["score"].astype(str)
+        self.df = items.groupby(df["voter"]).agg(";".join).to_frame("ballot")
+
+    def time_score_extend(self, n_voters, n_alternatives):
+        pp.score_extend(self.df.copy())
+
+
+class ToBallot:
+    """Conversion of pairwise comparisons into ballots over voters, alternatives and density of pairs."""
+    params = [N_VOTERS, N_ALTERNATIVES, DENSITY]
+    param_names = ["n_voters", "n_alternatives", "density"]
+    timeout = 600
+
+    def setup(self, n_voters, n_alternatives, density):
+        skip_if(n_voters * density * n_alternatives ** 2 / 2 > MAX_COST, "too expensive")
+        self.df = pairwise(n_voters, n_alternatives, False, density)
+
+    def time_to_ballot(self, n_voters, n_alternatives, density):
+        pp.to_ballot(self.df.copy())
+
+
+class ProfileMethods:
+    """Methods of `Profile` over voters, alternatives, ties and partial ballots."""
+    params = [PROFILE_METHODS, N_VOTERS, N_ALTERNATIVES, TIES, PARTIAL]
+    param_names = ["method", "n_voters", "n_alternatives", "ties", "partial"]
+    timeout = 600
+
+    def setup(self, method, n_voters, n_alternatives, ties, partial):
+        self.profile = profile(n_voters, n_alternatives, ties, partial)
+        power = 2 if method == "pairwise_matrix" else 1
+        skip_if(self.profile.n_ballots * n_alternatives ** power > 10 * MAX_COST, "too expensive")
+
+    def time_method(self, method, n_voters, n_alternatives, ties, partial):
+        attr = getattr(self.profile, method)
+        if callable(attr):
+            attr()
+
+
+class ProfileIO:
+    """Binary profile format over voters and alternatives."""
+    params = [N_VOTERS, N_ALTERNATIVES]
+    param_names = ["n_voters", "n_alternatives"]
+    timeout = 600
+
+    def setup(self, n_voters, n_alternatives):
+        self.profile = profile(n_voters, n_alternatives)
+        self.path = tempfile.mkdtemp()
+        pp.save_profile(self.profile, os.path.join(self.path, "saved"))
+
+    def teardown(self, n_voters, n_alternatives):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def time_save_profile(self, n_voters, n_alternatives):
+        pp.save_profile(self.profile, os.path.join(self.path, "profile"))
+
+    def time_load_profile(self, n_voters, n_alternatives):
+        pp.load_profile(os.path.join(self.path, "saved"))
@@ -0,0 +1,112 @@
+"""Seeded synthetic inputs and feasibility limits shared by the benchmarks."""
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+from comchoice.datasets import set_synthetic_election, set_synthetic_pairwise
+from comchoice.preprocessing import Profile
+
+SEED = 20230101
+
+N_VOTERS = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+N_ALTERNATIVES = [3, 10, 100, 1000]
+TIES = [False, True]
+PARTIAL = [False, True]
+DENSITY = [0.1, 1.0]
+
+# Largest input generated at all (voters x alternatives).
+MAX_CELLS = 10 ** 8
+
+# Largest cost a rule is benchmarked with. The cost of an election is the
+# number of cells of its unique ballots, multiplied by the number of
+# alternatives for rules that compare pairs or eliminate alternatives in rounds.
+MAX_COST = 10 ** 7
+
+
+def skip_if(condition, message="infeasible parameters"):
+    # asv skips a parameter combination when `setup` raises NotImplementedError.
+    if condition:
+        raise NotImplementedError(message)
+
+
+def alternatives_labels(n_alternatives):
+    return np.array([f"a{i}" for i in range(n_alternatives)], dtype=object)
+
+
+@lru_cache(maxsize=4)
+def profile(n_voters, n_alternatives, ties=False, partial=False):
+    """Compressed profile of an impartial culture election.
+
+    Ties merge consecutive positions with probability 0.2, and partial ballots
+    keep a uniform number of top positions.
+    """
+    skip_if(n_voters * n_alternatives > MAX_CELLS, "input too large")
+
+    rng = np.random.default_rng(SEED)
+    m = n_alternatives
+    p = set_synthetic_election(
+        n_voters=n_voters,
+        alternatives=alternatives_labels(m),
+        aggregate=False,
+        output="profile",
+        random_state=rng
+    )
+
+    if not (ties or partial):
+        return p.compress()
+
+    orders = p.orders.astype(np.int64)
+    position = np.arange(m)
+    rank = np.broadcast_to(position + 1, orders.shape).copy()
+
+    if ties:
+        tie = rng.random(orders.shape) < 0.2
+        tie[:, 0] = False
+        rank = np.maximum.accumulate(np.where(tie, 0, position), axis=1) + 1
+
+    if partial:
+        length = rng.integers(1, m + 1, size=(len(orders), 1))
+        rank[position >= length] = 0
+
+    ranks = np.zeros_like(p.ranks)
+    np.put_along_axis(ranks, orders, rank.astype(ranks.dtype), axis=1)
+
+    return Profile(ranks, alternatives=p.alternatives).compress()
+
+
+@lru_cache(maxsize=4)
+def ballots(n_voters, n_alternatives, ties=False, partial=False, delimiter=">"):
+    """Ballot DataFrame (`ballot`, `voters`) of `profile`."""
+    return profile(n_voters, n_alternatives, ties, partial)\
+        .to_ballot(delimiter=delimiter)
+
+
+@lru_cache(maxsize=4)
+def pairwise(n_voters, n_alternatives, ties=False, density=1.0):
+    """Pairwise comparisons where each voter compares a share `density` of the pairs."""
+    n_combinations = n_alternatives * (n_alternatives - 1) // 2
+    n_pairs = max(int(round(density * n_combinations)), 1)
+    skip_if(n_voters * n_pairs > MAX_CELLS, "input too large")
+
+    return set_synthetic_pairwise(
+        n_voters=n_voters,
+        alternatives=alternatives_labels(n_alternatives),
+        ties=ties,
+        n_pairs=n_pairs,
+        alternative_a="alternative_a",
+        alternative_b="alternative_b",
+        random_state=SEED
+    )
+
+
+@lru_cache(maxsize=4)
+def scores(n_voters, n_alternatives):
+    """Scores from 0 to 10 in long format (`voter`, `alternative`, `score`)."""
+    skip_if(n_voters * n_alternatives > MAX_CELLS, "input too large")
+    rng = np.random.default_rng(SEED)
+
+    return pd.DataFrame({
+        "voter": np.repeat(np.arange(n_voters), n_alternatives),
+        "alternative": np.tile(alternatives_labels(n_alternatives), n_voters),
+        "score": rng.integers(0, 11, size=n_voters * n_alternatives)
+    })
@@ -0,0 +1,100 @@
+"""Scaling exponents of the benchmarks.
+
+Reads the JSON results written by asv and fits, for each benchmark and each
+combination of the other parameters, the slope of log(time) over log(n) for a
+size parameter (by default `n_voters`). A slope of 1 means linear scaling.
+
+Usage:
+
+    python benchmarks/scaling.py [--results .asv/results] [--param n_voters] [--output scaling.json]
+"""
+import argparse
+import glob
+import itertools
+import json
+import os
+import numpy as np
+import pandas as pd
+
+
+def read_results(path):
+    """Reads asv result files into a DataFrame with one row per measurement."""
+    output = []
+    for file in glob.glob(os.path.join(path, "*", "*.json")):
+        if os.path.basename(file) == "machine.json":
+            continue
+
+        with open(file) as f:
+            data = json.load(f)
+
+        columns = data.get("result_columns", ["result", "params"])
+        for name, values in data.get("results", {}).items():
+            values = dict(zip(columns, values))
+            params = values.get("params") or []
+            results = values.get("result")
+            if results is None:
+                continue
+
+            combinations = list(itertools.product(*params)) if params else [()]
+            for combo, value in zip(combinations, results):
+                output.append({
+                    "commit": data.get("commit_hash"),
+                    "machine": os.path.basename(os.path.dirname(file)),
+                    "benchmark": name,
+                    "params": combo,
+                    "value": value
+                })
+
+    return pd.DataFrame(output, columns=["commit", "machine", "benchmark", "params", "value"])
+
+
+def scaling_exponents(df, benchmarks, param="n_voters"):
+    """Fits log(value) ~ log(param) for each benchmark and combination of the other parameters."""
+    output = []
+    for (commit, machine, name), tmp in df.groupby(["commit", "machine", "benchmark"]):
+        param_names = benchmarks.get(name, {}).get("param_names", [])
+        if param not in param_names:
+            continue
+
+        i = param_names.index(param)
+        tmp = tmp.dropna(subset=["value"])
+        tmp = tmp.assign(
+            x=tmp["params"].apply(lambda p: float(eval(p[i]))),
+            group=tmp["params"].apply(lambda p: p[:i] + p[i + 1:])
+        )
+
+        for group, values in tmp.groupby("group"):
+            values = values[values["value"] > 0]
+            if values["x"].nunique() < 2:
+                continue
+            slope, _ = np.polyfit(np.log(values["x"]), np.log(values["value"].astype(float)), 1)
+            output.append({
+                "commit": commit,
+                "machine": machine,
+                "benchmark": name,
+                "params": dict(zip(param_names[:i] + param_names[i + 1:], group)),
+                "exponent": slope,
+                "n_points": len(values),
+                "max_" + param: values["x"].max()
+            })
+
+    return pd.DataFrame(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--results", default=".asv/results")
+    parser.add_argument("--param", default="n_voters")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    with open(os.path.join(args.results, "benchmarks.json")) as f:
+        benchmarks = json.load(f)
+
+    df = scaling_exponents(read_results(args.results), benchmarks, param=args.param)
+
+    if args.output:
+        df.to_json(args.output, orient="records", indent=2)
+    else:
+        with pd.option_context("display.max_rows", None, "display.width", 200):
+            print(df)
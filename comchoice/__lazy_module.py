@@ -0,0 +1,51 @@
+import importlib
+import sys
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it as an attribute of its package, which
+        # would shadow the function of the same name exported by the package.
+        attributes = self.__dict__.get("_lazy_attributes", {})
+        if isinstance(value, ModuleType) and name in attributes and \
+                value.__name__ == f"{self.__name__}.{attributes[name]}":
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
+
+
+def __lazy_module(name, attributes):
+    """Loads the attributes of a package on first access (PEP 562).
+
+    Parameters
+    ----------
+    name : str
+        Name of the package.
+    attributes : dict
+        Name of the submodule (relative to the package) that defines each attribute.
+
+    Returns
+    -------
+    callable, callable
+        `__getattr__` and `__dir__` functions of the package.
+    """
+    module = sys.modules[name]
+    module.__class__ = _LazyModule
+    module._lazy_attributes = attributes
+
+    def __getattr__(attribute):
+        if attribute not in attributes:
+            raise AttributeError(
+                f"module {name!r} has no attribute {attribute!r}")
+
+        value = getattr(
+            importlib.import_module(f".{attributes[attribute]}", name), attribute)
+        setattr(module, attribute, value)
+
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,7 @@
+from .accumulator import Accumulator
+from .aggregate_file import aggregate_file
+from .elo_accumulator import EloAccumulator
+from .grade_accumulator import GradeAccumulator
+from .pairwise_accumulator import PairwiseAccumulator
+from .plurality_accumulator import PluralityAccumulator
+from .positional_accumulator import PositionalAccumulator
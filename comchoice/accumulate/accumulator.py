@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.aggregate.__set_rank import __set_rank as _set_rank
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.to_profile import to_profile
+
+
+class Accumulator:
+    """Base class of the accumulators.
+
+    An accumulator keeps the tallies of an election that grows over time. Each
+    call to `update` costs O(batch), and `result` only depends on the size of
+    the tallies, not on the number of ballots accumulated. The set of alternatives
+    grows as new alternatives appear in the ballots.
+
+    Parameters
+    ----------
+    alternatives : list, optional
+        Labels of the alternatives known in advance, by default None.
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    """
+
+    def __init__(
+        self,
+        alternatives=None,
+        ballot="ballot",
+        delimiter=">",
+        delimiter_ties="=",
+        voters="voters"
+    ):
+        self.alternatives = pd.Index([])
+        self.ballot = ballot
+        self.delimiter = delimiter
+        self.delimiter_ties = delimiter_ties
+        self.voters = voters
+        self.n_voters = 0
+        self._resize(0)
+        if alternatives is not None:
+            self._index(alternatives)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(n_alternatives={self.n_alternatives}, n_voters={self.n_voters})"
+
+    @property
+    def n_alternatives(self) -> int:
+        return len(self.alternatives)
+
+    def _resize(self, n_alternatives):
+        raise NotImplementedError
+
+    def _add(self, other, index):
+        raise NotImplementedError
+
+    def _index(self, alternatives) -> np.ndarray:
+        # Codes of `alternatives` in the accumulator, adding the new ones.
+        alternatives = pd.Index(alternatives)
+        index = self.alternatives.get_indexer(alternatives)
+        missing = index < 0
+        if missing.any():
+            index[missing] = np.arange(missing.sum()) + self.n_alternatives
+            self.alternatives = self.alternatives.append(alternatives[missing])
+            self._resize(self.n_alternatives)
+
+        return index
+
+    def _profile(self, batch) -> Profile:
+        if isinstance(batch, Profile):
+            return batch
+
+        return to_profile(
+            batch,
+            ballot=self.ballot,
+            delimiter=self.delimiter,
+            delimiter_ties=self.delimiter_ties,
+            voters=self.voters,
+            alternatives=self.alternatives
+        )
+
+    def _result(self, values, alternative="alternative", show_rank=True, ascending=False) -> pd.DataFrame:
+        tmp = pd.DataFrame({
+            alternative: np.asarray(self.alternatives, dtype=object),
+            "value": values
+        })
+
+        if show_rank:
+            tmp = _set_rank(tmp, ascending=ascending)
+
+        return tmp
+
+    def update(self, batch):
+        """Adds a batch of ballots to the tallies.
+
+        Parameters
+        ----------
+        batch : pd.DataFrame or Profile
+            A data set of ballots, or a profile.
+
+        Returns
+        -------
+        Accumulator
+            The accumulator itself.
+        """
+        profile = self._profile(batch)
+        index = self._index(profile.alternatives)
+        self._update(profile, index)
+        self.n_voters += profile.n_voters
+
+        return self
+
+    def merge(self, other):
+        """Adds the tallies of another accumulator of the same type.
+
+        Parameters
+        ----------
+        other : Accumulator
+            An accumulator (e.g., fed by another process).
+
+        Returns
+        -------
+        Accumulator
+            The accumulator itself.
+        """
+        if type(other) is not type(self):
+            raise ValueError(
+                f"Value provided to other parameter not valid. Values accepted are {type(self).__name__} objects")
+
+        index = self._index(other.alternatives)
+        self._add(other, index)
+        self.n_voters += other.n_voters
+
+        return self
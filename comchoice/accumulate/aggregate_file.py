@@ -0,0 +1,125 @@
+import os
+import pandas as pd
+
+from comchoice.accumulate.grade_accumulator import GradeAccumulator
+from comchoice.accumulate.pairwise_accumulator import PairwiseAccumulator, pairwise_rules
+from comchoice.accumulate.plurality_accumulator import PluralityAccumulator
+from comchoice.accumulate.positional_accumulator import PositionalAccumulator
+from comchoice.preprocessing.load_profile import load_profile
+from comchoice.preprocessing.profile import Profile, _chunks
+
+rules = {
+    "antiplurality": (PositionalAccumulator, dict(rule="antiplurality")),
+    "borda": (PositionalAccumulator, dict(rule="borda")),
+    "bucklin_judgment": (GradeAccumulator, dict(rule="bucklin")),
+    "central_judgment": (GradeAccumulator, dict(rule="central")),
+    "dowdall": (PositionalAccumulator, dict(rule="dowdall")),
+    "k_approval": (PositionalAccumulator, dict(rule="k_approval")),
+    "majority_judgment": (GradeAccumulator, dict(rule="majority")),
+    "plurality": (PluralityAccumulator, dict(rule="plurality")),
+    "positional": (PositionalAccumulator, dict(rule="positional")),
+    "typical_judgment": (GradeAccumulator, dict(rule="typical")),
+    "usual_judgment": (GradeAccumulator, dict(rule="usual")),
+    **{x: (PairwiseAccumulator, dict(rule=x)) for x in pairwise_rules}
+}
+
+
+def aggregate_file(
+    path,
+    rule: str = "borda",
+    chunksize: int = 10 ** 6,
+    alternative: str = "alternative",
+    ballot: str = "ballot",
+    delimiter: str = ">",
+    delimiter_ties: str = "=",
+    grade: str = "score",
+    voters: str = "voters",
+    read_csv_kws: dict = dict(),
+    **kws
+) -> pd.DataFrame:
+    """Aggregates a file of ballots larger than memory.
+
+    The file is read in chunks of `chunksize` rows. Each chunk is reduced into
+    additive tallies (first preferences, positional counts, pairwise matrix or
+    grade histograms, depending on the rule), so peak memory is bounded by the
+    chunk size and the number of alternatives.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path of a CSV file, or of a directory with a profile saved with
+        `comchoice.preprocessing.save_profile`.
+    rule : str, optional
+        Voting rule, by default "borda". Values accepted are "antiplurality", "borda",
+        "bucklin_judgment", "central_judgment", "dowdall", "k_approval", "majority_judgment",
+        "plurality", "positional", "typical_judgment", "usual_judgment", and the pairwise-based
+        rules "condorcet", "copeland", "dodgson", "dodgson_quick", "kemeny_young", "minimax",
+        "ranked_pairs", "schulze", "simpson", "smith_set" and "tideman".
+    chunksize : int, optional
+        Number of rows (or ballots of a profile) read at once, by default 10 ** 6.
+    alternative : str, optional
+        Column label of the alternatives in graded data (judgment rules), by default "alternative".
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    grade : str, optional
+        Column label of the grades in graded data (judgment rules), by default "score".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    read_csv_kws : dict, optional
+        Arguments passed to `pd.read_csv` (e.g., `sep`, `compression`), by default dict().
+    **kws
+        Arguments passed to the `result` method of the accumulator (e.g., `k`, `score`, `scores`).
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregation of preferences.
+    """
+    if rule not in rules:
+        raise ValueError(
+            f"Value provided to rule parameter not valid. Values accepted are {', '.join(rules)}")
+
+    Accumulator, result_kws = rules[rule]
+
+    if Accumulator is GradeAccumulator:
+        acc = GradeAccumulator(alternative=alternative, score=grade, voters=voters)
+        columns = [alternative, grade, voters]
+
+    else:
+        acc = Accumulator(
+            ballot=ballot,
+            delimiter=delimiter,
+            delimiter_ties=delimiter_ties,
+            voters=voters
+        )
+        columns = [ballot, voters]
+
+    if os.path.isdir(path):
+        if Accumulator is GradeAccumulator:
+            raise ValueError(
+                "Value provided to path parameter not valid. Judgment rules require a CSV file of grades")
+
+        profile = load_profile(path)
+        for s in _chunks(profile.n_ballots, chunksize):
+            acc.update(Profile(
+                profile.ranks[s],
+                weights=profile.weights[s],
+                alternatives=profile.alternatives
+            ))
+
+    else:
+        reader = pd.read_csv(
+            path,
+            chunksize=chunksize,
+            usecols=lambda x: x in columns,
+            **read_csv_kws
+        )
+        with reader:
+            for chunk in reader:
+                acc.update(chunk)
+
+    return acc.result(**{**result_kws, **kws})
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.accumulate.accumulator import Accumulator
+
+
+class EloAccumulator(Accumulator):
+    """Accumulator of pairwise comparisons.
+
+    It keeps the Elo rating of each alternative, updated comparison by
+    comparison, a matrix where the value in row `a` and column `b` is the
+    number of comparisons in which `a` is selected over `b` (ties add 0.5 to both),
+    and the number of wins of each alternative as counted by
+    `comchoice.aggregate.win_rate` (ties are a win of `alternative_b`).
+
+    Elo ratings depend on the order of the comparisons, so these accumulators
+    cannot be merged.
+
+    Parameters
+    ----------
+    alternatives : list, optional
+        Labels of the alternatives known in advance, by default None.
+    alternative_a : str, optional
+        Column label of the first alternative of a comparison, by default "alternative_a".
+    alternative_b : str, optional
+        Column label of the second alternative of a comparison, by default "alternative_b".
+    selected : str, optional
+        Column label of the selected alternative. Ties are represented with 0, by default "selected".
+    rating : int, optional
+        Initial rating of each alternative, by default 400.
+    K : int, optional
+        Freedom degree in the equation, by default 10.
+
+    Examples
+    --------
+    >>> acc = EloAccumulator()
+    >>> acc.update(df_batch)
+    >>> acc.result("elo")
+    """
+
+    def __init__(
+        self,
+        alternatives=None,
+        alternative_a="alternative_a",
+        alternative_b="alternative_b",
+        selected="selected",
+        rating=400,
+        K=10
+    ):
+        self.alternative_a = alternative_a
+        self.alternative_b = alternative_b
+        self.selected = selected
+        self.rating = rating
+        self.K = K
+        super().__init__(alternatives=alternatives)
+
+    def _resize(self, n_alternatives):
+        ratings = np.full(n_alternatives, float(self.rating))
+        counts = np.zeros((n_alternatives, n_alternatives))
+        wins = np.zeros(n_alternatives)
+        if hasattr(self, "counts"):
+            n = len(self.counts)
+            ratings[:n] = self.ratings
+            counts[:n, :n] = self.counts
+            wins[:n] = self.wins
+        self.ratings = ratings
+        self.counts = counts
+        self.wins = wins
+
+    def update(self, batch):
+        """Adds a batch of pairwise comparisons, in order.
+
+        Parameters
+        ----------
+        batch : pd.DataFrame
+            A data set of pairwise comparisons.
+
+        Returns
+        -------
+        EloAccumulator
+            The accumulator itself.
+        """
+        codes, labels = pd.factorize(pd.concat(
+            [batch[self.alternative_a], batch[self.alternative_b]], ignore_index=True))
+        index = self._index(labels)[codes]
+        n = len(batch)
+        a, b = index[:n], index[n:]
+
+        is_tie = (batch[self.selected] == 0).values
+        is_a_selected = (batch[self.selected] == batch[self.alternative_a]).values
+        s = np.where(is_tie, 0.5, is_a_selected.astype(float))
+
+        np.add.at(self.counts, (a, b), s)
+        np.add.at(self.counts, (b, a), 1 - s)
+        np.add.at(self.wins, np.where(is_a_selected, a, b), 1)
+
+        # Elo ratings depend on the order of the comparisons.
+        ratings, K, rating = self.ratings, self.K, self.rating
+        for i, j, s_a in zip(a.tolist(), b.tolist(), s.tolist()):
+            q_a = K ** (ratings[i] / rating)
+            q_b = K ** (ratings[j] / rating)
+            e_a = q_a / (q_a + q_b)
+            ratings[i] += K * (s_a - e_a)
+            ratings[j] += K * (e_a - s_a)
+
+        self.n_voters += n
+
+        return self
+
+    def merge(self, other):
+        # Raised before the alternatives of `other` are added to the accumulator.
+        raise NotImplementedError(
+            "Elo ratings depend on the order of the comparisons, so they cannot be merged.")
+
+    def result(
+        self,
+        rule="elo",
+        alternative="alternative",
+        show_rank=True
+    ):
+        """Aggregates the comparisons.
+
+        Parameters
+        ----------
+        rule : {"elo", "win_rate", "copeland"}, optional
+            Voting rule, by default "elo". Whether "win_rate", ties are counted as in
+            `comchoice.aggregate.win_rate`, as a win of `alternative_b`. Whether "copeland",
+            ties count half a comparison for each alternative.
+        alternative : str, optional
+            Column label of the alternatives, by default "alternative".
+        show_rank : bool, optional
+            Whether or not to include the ranking of alternatives, by default True.
+
+        Returns
+        -------
+        pd.DataFrame
+            Aggregation of preferences.
+        """
+        total = self.counts + self.counts.T
+
+        if rule == "elo":
+            values = self.ratings
+
+        elif rule == "win_rate":
+            values = self.wins / np.maximum(total.sum(axis=1), 1)
+
+        elif rule == "copeland":
+            with np.errstate(invalid="ignore"):
+                share = self.counts / total
+            wins = np.where(share > 0.5, 1, np.where(share == 0.5, 0.5, 0)).astype(float)
+            np.fill_diagonal(wins, np.nan)
+            values = np.nanmean(wins, axis=1) if self.n_alternatives > 1 else np.zeros(1)
+
+        else:
+            raise ValueError(
+                "Value provided to rule parameter not valid. Values accepted are 'elo', 'win_rate', 'copeland'")
+
+        return self._result(values, alternative=alternative, show_rank=show_rank)
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.accumulate.accumulator import Accumulator, _set_rank
+
+
+class GradeAccumulator(Accumulator):
+    """Accumulator of grade histograms.
+
+    It keeps, for each alternative, the number of voters that assign it each
+    grade. Judgment rules (e.g., Majority Judgment) are computed from the
+    median grade and the share of grades above and below it. Here, `n_voters`
+    is the number of grades of the most graded alternative.
+
+    Parameters
+    ----------
+    alternatives : list, optional
+        Labels of the alternatives known in advance, by default None.
+    alternative : str, optional
+        Column label of the alternatives, by default "alternative".
+    score : str, optional
+        Column label of the grades, by default "score".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+
+    Examples
+    --------
+    >>> acc = GradeAccumulator()
+    >>> acc.update(df_batch)
+    >>> acc.result("majority")
+    """
+
+    def __init__(
+        self,
+        alternatives=None,
+        alternative="alternative",
+        score="score",
+        voters="voters"
+    ):
+        self.alternative = alternative
+        self.score = score
+        self.grades = pd.Index([])
+        super().__init__(alternatives=alternatives, voters=voters)
+
+    def _resize(self, n_alternatives):
+        self._reshape(n_alternatives, len(self.grades))
+
+    def _reshape(self, n_alternatives, n_grades):
+        counts = np.zeros((n_alternatives, n_grades))
+        if hasattr(self, "counts"):
+            n, k = self.counts.shape
+            counts[:n, :k] = self.counts
+        self.counts = counts
+
+    def _grade_index(self, grades) -> np.ndarray:
+        grades = pd.Index(grades)
+        index = self.grades.get_indexer(grades)
+        missing = index < 0
+        if missing.any():
+            index[missing] = np.arange(missing.sum()) + len(self.grades)
+            self.grades = self.grades.append(grades[missing])
+            self._reshape(self.n_alternatives, len(self.grades))
+
+        return index
+
+    def update(self, batch):
+        """Adds a batch of grades to the histograms.
+
+        Parameters
+        ----------
+        batch : pd.DataFrame
+            A data set with one row per alternative graded by a voter (or voters).
+
+        Returns
+        -------
+        GradeAccumulator
+            The accumulator itself.
+        """
+        w = batch[self.voters].values if self.voters in list(batch) else np.ones(len(batch))
+        a_codes, a_labels = pd.factorize(batch[self.alternative])
+        g_codes, g_labels = pd.factorize(batch[self.score])
+
+        a_index = self._index(a_labels)
+        g_index = self._grade_index(g_labels)
+
+        np.add.at(self.counts, (a_index[a_codes], g_index[g_codes]), w)
+        self.n_voters = self.counts.sum(axis=1).max(initial=0)
+
+        return self
+
+    def _add(self, other, index):
+        g_index = self._grade_index(other.grades)
+        self.counts[np.ix_(index, g_index)] += other.counts
+
+    def merge(self, other):
+        super().merge(other)
+        self.n_voters = self.counts.sum(axis=1).max(initial=0)
+
+        return self
+
+    merge.__doc__ = Accumulator.merge.__doc__
+
+    def result(
+        self,
+        rule="typical",
+        e=0,
+        show_rank=True
+    ):
+        """Aggregates the histograms.
+
+        Parameters
+        ----------
+        rule : {"typical", "usual", "central", "bucklin", "majority"}, optional
+            Judgment method to use in case of a tie, by default "typical".
+        e : int, optional
+            Error variable used when `rule = "central"`, by default 0.
+        show_rank : bool, optional
+            Whether or not to include the ranking of alternatives, by default True.
+
+        Returns
+        -------
+        pd.DataFrame
+            Aggregation of preferences using a highest-majority rule.
+        """
+        order = np.argsort(np.asarray(self.grades, dtype=float))
+        grades = np.asarray(self.grades, dtype=float)[order]
+        counts = self.counts[:, order]
+
+        total = counts.sum(axis=1)
+        cum = counts.cumsum(axis=1)
+
+        # Median grade, averaging the two central grades when needed.
+        lo = (cum <= np.floor((total - 1) / 2)[:, None]).sum(axis=1)
+        hi = (cum <= np.ceil((total - 1) / 2)[:, None]).sum(axis=1)
+        k = len(grades) - 1
+        alpha = (grades[np.minimum(lo, k)] + grades[np.minimum(hi, k)]) / 2
+
+        threshold = np.floor(alpha)[:, None]
+        total = np.where(total > 0, total, 1)
+        p = (counts * (grades > threshold)).sum(axis=1) / total
+        q = (counts * (grades < threshold)).sum(axis=1) / total
+
+        if rule == "typical":
+            values = alpha + p - q
+
+        elif rule == "usual":
+            values = alpha + 0.5 * (p - q) / (1 - p - q)
+
+        elif rule == "central":
+            values = alpha + 0.5 * (p - q) / (p + q + e)
+
+        elif rule == "bucklin":
+            values = alpha - q
+
+        elif rule == "majority":
+            values = alpha + np.where(p > q, p, -q)
+
+        else:
+            raise ValueError(
+                "Value provided to rule parameter not valid. Values accepted are 'typical', 'usual', 'central', 'bucklin', 'majority'")
+
+        tmp = self._result(values, alternative=self.alternative, show_rank=False)
+        tmp.insert(1, "alpha", alpha)
+        tmp.insert(2, "p", p)
+        tmp.insert(3, "q", q)
+
+        if show_rank:
+            tmp = _set_rank(tmp)
+
+        return tmp
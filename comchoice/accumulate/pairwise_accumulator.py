@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.accumulate.accumulator import Accumulator
+
+pairwise_rules = [
+    "condorcet",
+    "copeland",
+    "dodgson",
+    "dodgson_quick",
+    "kemeny_young",
+    "minimax",
+    "ranked_pairs",
+    "schulze",
+    "simpson",
+    "smith_set",
+    "tideman"
+]
+
+
+class PairwiseAccumulator(Accumulator):
+    """Accumulator of pairwise comparisons.
+
+    It keeps a matrix where the value in row `a` and column `b` is the number
+    of voters that rank `a` over `b`.
+
+    Examples
+    --------
+    >>> acc = PairwiseAccumulator()
+    >>> acc.update(df_batch)
+    >>> acc.result("copeland")
+    """
+
+    def _resize(self, n_alternatives):
+        counts = np.zeros((n_alternatives, n_alternatives))
+        if hasattr(self, "counts"):
+            n = len(self.counts)
+            counts[:n, :n] = self.counts
+        self.counts = counts
+
+    def _update(self, profile, index):
+        self.counts[np.ix_(index, index)] += profile.pairwise_matrix()
+
+    def _add(self, other, index):
+        self.counts[np.ix_(index, index)] += other.counts
+
+    def pairwise_matrix(self) -> pd.DataFrame:
+        """Pairwise matrix of the accumulated ballots.
+
+        Returns
+        -------
+        pd.DataFrame
+            Pairwise matrix, in the format of `comchoice.aggregate.pairwise_matrix`.
+        """
+        labels = np.asarray(self.alternatives, dtype=object)
+
+        return pd.DataFrame(
+            self.counts,
+            index=pd.Index(labels, name="_winner"),
+            columns=pd.Index(labels, name="_loser")
+        )
+
+    def result(
+        self,
+        rule="copeland",
+        **kws
+    ):
+        """Aggregates the tallies.
+
+        Parameters
+        ----------
+        rule : {"condorcet", "copeland", "dodgson", "dodgson_quick", "kemeny_young", "minimax", "ranked_pairs", "schulze", "simpson", "smith_set", "tideman"}, optional
+            Pairwise-based voting rule, by default "copeland".
+        **kws
+            Arguments passed to the rule (e.g., `alternative`, `show_rank`).
+
+        Returns
+        -------
+        pd.DataFrame or list
+            Aggregation of preferences (a list of alternatives for "smith_set").
+        """
+        import comchoice.aggregate as aggregate
+
+        if rule not in pairwise_rules:
+            raise ValueError(
+                f"Value provided to rule parameter not valid. Values accepted are {', '.join(pairwise_rules)}")
+
+        return getattr(aggregate, rule)(self.pairwise_matrix(), pw_matrix=True, **kws)
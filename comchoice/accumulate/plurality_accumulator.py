@@ -0,0 +1,56 @@
+import numpy as np
+
+from comchoice.accumulate.accumulator import Accumulator
+
+
+class PluralityAccumulator(Accumulator):
+    """Accumulator of first preferences.
+
+    It keeps the number of voters that rank each alternative first.
+
+    Examples
+    --------
+    >>> acc = PluralityAccumulator()
+    >>> acc.update(df_batch)
+    >>> acc.result()
+    """
+
+    def _resize(self, n_alternatives):
+        counts = np.zeros(n_alternatives)
+        if hasattr(self, "counts"):
+            counts[:len(self.counts)] = self.counts
+        self.counts = counts
+
+    def _update(self, profile, index):
+        self.counts[index] += profile.first_preferences()
+
+    def _add(self, other, index):
+        self.counts[index] += other.counts
+
+    def result(
+        self,
+        rule="plurality",
+        alternative="alternative",
+        show_rank=True
+    ):
+        """Aggregates the tallies.
+
+        Parameters
+        ----------
+        rule : {"plurality"}, optional
+            Voting rule, by default "plurality".
+        alternative : str, optional
+            Column label of the alternatives, by default "alternative".
+        show_rank : bool, optional
+            Whether or not to include the ranking of alternatives, by default True.
+
+        Returns
+        -------
+        pd.DataFrame
+            Aggregation of preferences.
+        """
+        if rule != "plurality":
+            raise ValueError(
+                "Value provided to rule parameter not valid. Values accepted are 'plurality'")
+
+        return self._result(self.counts, alternative=alternative, show_rank=show_rank)
@@ -0,0 +1,103 @@
+import numpy as np
+
+from comchoice.accumulate.accumulator import Accumulator
+
+
+class PositionalAccumulator(Accumulator):
+    """Accumulator of positional counts.
+
+    It keeps a matrix where the value in row `a` and column `k` is the number
+    of voters that rank `a` in the position `k + 1`. Any positional scoring rule
+    (e.g., Borda, Dowdall, k-Approval) can be computed from it.
+
+    Examples
+    --------
+    >>> acc = PositionalAccumulator()
+    >>> acc.update(df_batch)
+    >>> acc.result("borda")
+    """
+
+    def _resize(self, n_alternatives):
+        counts = np.zeros((n_alternatives, n_alternatives))
+        if hasattr(self, "counts"):
+            n = len(self.counts)
+            counts[:n, :n] = self.counts
+        self.counts = counts
+
+    def _update(self, profile, index):
+        m = profile.n_alternatives
+        self.counts[index, :m] += profile.rank_matrix()
+
+    def _add(self, other, index):
+        m = other.n_alternatives
+        self.counts[index, :m] += other.counts
+
+    def result(
+        self,
+        rule="borda",
+        alternative="alternative",
+        k=2,
+        score="original",
+        scores=None,
+        show_rank=True
+    ):
+        """Aggregates the tallies.
+
+        Parameters
+        ----------
+        rule : {"borda", "dowdall", "k_approval", "plurality", "antiplurality", "positional"}, optional
+            Voting rule, by default "borda".
+        alternative : str, optional
+            Column label of the alternatives, by default "alternative".
+        k : int, optional
+            Rank threshold of "k_approval", by default 2.
+        score : {"original", "score_n", "dowdall", "weighted"}
+            Specifies the rule to be used to compute Borda, by default "original".
+        scores : array-like, optional
+            Points given to each position when `rule = "positional"`, by default None.
+        show_rank : bool, optional
+            Whether or not to include the ranking of alternatives, by default True.
+
+        Returns
+        -------
+        pd.DataFrame
+            Aggregation of preferences.
+        """
+        N = self.n_alternatives
+        position = np.arange(1, N + 1)
+        ascending = False
+
+        if rule == "borda":
+            if score == "dowdall":
+                scores = 1 / position
+            elif score == "score_n":
+                scores = N - position - 1
+            else:
+                scores = N - position
+
+        elif rule == "dowdall":
+            scores = 1 / position
+
+        elif rule == "k_approval":
+            scores = position <= k
+
+        elif rule == "plurality":
+            scores = position == 1
+
+        elif rule == "antiplurality":
+            scores = position == 1
+            ascending = True
+
+        elif rule == "positional":
+            scores = np.asarray(scores, dtype=float)[:N]
+            scores = np.r_[scores, np.zeros(N - len(scores))]
+
+        else:
+            raise ValueError(
+                "Value provided to rule parameter not valid. Values accepted are 'borda', 'dowdall', 'k_approval', 'plurality', 'antiplurality', 'positional'")
+
+        values = self.counts @ np.asarray(scores, dtype=float)
+        if rule == "borda" and score == "weighted":
+            values = values / (self.n_voters * (N - 1))
+
+        return self._result(values, alternative=alternative, show_rank=show_rank, ascending=ascending)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+
+
+def __get_pairwise_matrix(
+    df,
+    pw_matrix=False,
+    alternatives=None,
+    alternative="alternative",
+    ballot="ballot",
+    delimiter=">",
+    voter="voter",
+    voters="voters",
+    transform_kws=transform_kws
+) -> pd.DataFrame:
+    """Gets the pairwise matrix used by a pairwise-based rule.
+
+    Parameters
+    ----------
+    df : pd.DataFrame, np.ndarray or scipy.sparse matrix
+        A data set to be aggregated, or a pairwise matrix whether `pw_matrix` is True.
+        The value in row `a` and column `b` of a pairwise matrix is the number of voters
+        that rank `a` over `b`.
+    pw_matrix : bool, optional
+        A Pairwise Matrix is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives of a pairwise matrix set as np.ndarray or scipy.sparse matrix,
+        by default their positions. Whether df is a DataFrame, its index is used.
+    alternative : str, optional
+        Column label to get alternatives, by default "alternative".
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    voter : str, optional
+        Column label of voter unique identifier, by default "voter".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    transform_kws : dict, optional
+        Whether or not to process data.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pairwise matrix, in the format of `comchoice.aggregate.pairwise_matrix`.
+    """
+    if not pw_matrix:
+        return pairwise_matrix(
+            df,
+            alternative=alternative,
+            ballot=ballot,
+            delimiter=delimiter,
+            voter=voter,
+            voters=voters,
+            transform_kws=transform_kws
+        )
+
+    if isinstance(df, pd.DataFrame):
+        labels = df.index
+        m = df.reindex(labels, axis=1).values
+    else:
+        # scipy.sparse matrices are densified without importing scipy.
+        m = df.toarray() if hasattr(df, "toarray") else np.asarray(df)
+        labels = alternatives if alternatives is not None else range(m.shape[0])
+
+    if m.ndim != 2 or m.shape[0] != m.shape[1] or m.shape[0] != len(labels):
+        raise ValueError(
+            "Value provided to df parameter not valid. A pairwise matrix must be a square matrix with one row per alternative")
+
+    labels = pd.Index(labels)
+
+    return pd.DataFrame(
+        np.nan_to_num(m.astype(float)),
+        index=labels.rename("_winner"),
+        columns=labels.rename("_loser")
+    )
@@ -1,48 +1,60 @@
-from .ahp import ahp
-from .antiplurality import antiplurality
-from .approval import approval
-from .baldwin import baldwin
-from .black import black
-from .borda import borda
-from .bradley_terry import bradley_terry
-from .bucklin_judgment import bucklin_judgment
-from .central_judgment import central_judgment
-from .condorcet import condorcet
-from .coombs import coombs
-from .copeland import copeland
-from .cumulative import cumulative
-from .dhondt import dhondt
-from .divisiveness import divisiveness
-from .dodgson import dodgson
-from .dodgson_quick import dodgson_quick
-from .dowdall import dowdall
-from .droop_quota import droop_quota
-from .elo import elo
-from .fallback import fallback
-from .hagenbach_bischoff_quota import hagenbach_bischoff_quota
-from .hare_quota import hare_quota
-from .imperiali_quota import imperiali_quota
-from .irv import irv
-from .judgment import judgment
-from .k_approval import k_approval
-from .kemeny_young import kemeny_young
-from .majority_judgment import majority_judgment
-from .minimax import minimax
-from .nanson import nanson
-from .nanson_baldwin import nanson_baldwin
-from .negative import negative
-from .pairwise_matrix import pairwise_matrix
-from .pav import pav
-from .phragmen import phragmen
-from .plurality import plurality
-from .quota import quota
-from .sav import sav
-from .schulze import schulze
-from .score import score
-from .simpson import simpson
-from .smith_set import smith_set
-from .spatial import spatial
-from .tideman import tideman
-from .typical_judgment import typical_judgment
-from .usual_judgment import usual_judgment
-from .win_rate import win_rate
\ No newline at end of file
+# Rules are imported on first access, so importing a single rule does not
+# load the dependencies of the others.
+from comchoice.__lazy_module import __lazy_module
+
+__all__ = [
+    "ahp",
+    "antiplurality",
+    "approval",
+    "baldwin",
+    "black",
+    "borda",
+    "bradley_terry",
+    "bucklin_judgment",
+    "central_judgment",
+    "condorcet",
+    "coombs",
+    "copeland",
+    "cumulative",
+    "dhondt",
+    "divisiveness",
+    "dodgson",
+    "dodgson_exact",
+    "dodgson_quick",
+    "dowdall",
+    "droop_quota",
+    "elo",
+    "fallback",
+    "hagenbach_bischoff_quota",
+    "hare_quota",
+    "imperiali_quota",
+    "irv",
+    "judgment",
+    "k_approval",
+    "kemeny_young",
+    "majority_judgment",
+    "minimax",
+    "nanson",
+    "nanson_baldwin",
+    "negative",
+    "pairwise_matrix",
+    "pav",
+    "phragmen",
+    "plurality",
+    "quota",
+    "ranked_pairs",
+    "sav",
+    "schulze",
+    "score",
+    "simpson",
+    "smith_set",
+    "spatial",
+    "stv",
+    "tideman",
+    "typical_judgment",
+    "usual_judgment",
+    "win_rate"
+]
+
+__getattr__, __dir__ = __lazy_module(
+    __name__, {attribute: attribute for attribute in __all__})
@@ -6,19 +6,18 @@ def __set_card_id(
     df,
     alternative_a="alternative_a",
     alternative_b="alternative_b",
-    selected="selected",
-    concat: str = "_"
+    selected="selected"
 ) -> pd.DataFrame:
     """Creates a unique identifier for alternatives' pair (card_id).
 
+    Alternatives are int-coded in ascending order, and the identifier of a pair is
+    computed from the codes of its alternatives as `lower * n_alternatives + higher`.
+
     Parameters
     ----------
     df : pandas.DataFrame
         Pairwise comparison DataFrame.
 
-    concat : str, default="_"
-        String to concatenate options.
-
     Returns
     -------
     pd.DataFrame
@@ -28,28 +27,33 @@ def __set_card_id(
     alternative_a_sorted = f"{alternative_a}_sorted"
     alternative_b_sorted = f"{alternative_b}_sorted"
 
-    cols = [alternative_a, alternative_b, selected]
-    a = df[cols].values
+    a = df[alternative_a].values
+    b = df[alternative_b].values
+    s = df[selected].values
+    n = len(a)
 
-    # Sorts options, always lower value on left column
-    df[alternative_a_sorted] = np.where(a[:, 0] < a[:, 1], a[:, 0], a[:, 1])
-    df[alternative_b_sorted] = np.where(a[:, 0] >= a[:, 1], a[:, 0], a[:, 1])
+    codes, alternatives = pd.factorize(np.concatenate([a, b]), sort=True)
+    code_a, code_b = codes[:n].astype(np.int64), codes[n:].astype(np.int64)
+    code_s = pd.Index(alternatives).get_indexer(s)
 
-    _a = df[alternative_a_sorted]
-    _b = df[alternative_b_sorted]
+    # Sorts options, always lower value on left column
+    lo = np.minimum(code_a, code_b)
+    hi = np.maximum(code_a, code_b)
+    df[alternative_a_sorted] = np.where(code_a <= code_b, a, b)
+    df[alternative_b_sorted] = np.where(code_a <= code_b, b, a)
 
     df["option_selected"] = np.where(
-        _a[:] == a[:, 2], 1, np.where(_b[:] == a[:, 2], -1, 0))
+        code_s == lo, 1, np.where(code_s == hi, -1, 0))
 
     # Creates card_id
-    df["card_id"] = _a.astype(str) + concat + _b.astype(str)
+    df["card_id"] = lo * len(alternatives) + hi
 
     # Boolean variable, check if a/b was selected
-    df["option_source"] = np.where(a[:, 1] == a[:, 2], a[:, 0], a[:, 1])
-    df["option_target"] = np.where(a[:, 0] == a[:, 2], a[:, 0], a[:, 1])
+    df["option_source"] = np.where(code_b == code_s, a, b)
+    df["option_target"] = np.where(code_a == code_s, a, b)
 
     # Creates option_source / option_target
-    selected_zero = df[selected] == 0
+    selected_zero = s == 0
     df.loc[selected_zero, "option_source"] = df.loc[selected_zero, alternative_a]
     df.loc[selected_zero, "option_target"] = df.loc[selected_zero, alternative_b]
 
@@ -1,6 +1,9 @@
 import pandas as pd
 
+from comchoice.instrument.stage import stage
 
+
+@stage("set_rank")
 def __set_rank(
     df,
     column="value",
@@ -1,14 +1,15 @@
 import numpy as np
 import pandas as pd
-from scipy import linalg
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.__set_card_id import __set_card_id
 from comchoice.aggregate.__set_rank import __set_rank
 from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 
 
+@stage
 def ahp(
     df,
     ppal_eigval="approximation",
@@ -66,14 +67,13 @@ def ahp(
             }
         )
 
-        if "card_id" not in list(df):
-            df = __set_card_id(
-                df.copy(),
-                alternative_a=alternative_a,
-                alternative_b=alternative_b,
-                selected=selected,
-                concat="_"
-            )
+    if "card_id" not in list(df):
+        df = __set_card_id(
+            df.copy(),
+            alternative_a=alternative_a,
+            alternative_b=alternative_b,
+            selected=selected
+        )
 
     alternative_a_sorted = f"{alternative_a}_sorted"
     alternative_b_sorted = f"{alternative_b}_sorted"
@@ -84,8 +84,12 @@ def ahp(
         df["weight_b"] = np.where(
             df[alternative_b_sorted] == df[selected], 1, 0)
 
-        df = df.groupby([alternative_a_sorted, alternative_b_sorted]).agg(
-            {"weight_a": "sum", "weight_b": "sum"}).reset_index()
+        df = df.groupby("card_id").agg({
+            alternative_a_sorted: "first",
+            alternative_b_sorted: "first",
+            "weight_a": "sum",
+            "weight_b": "sum"
+        }).reset_index(drop=True)
 
     def __calc(df, ppal_eigval=ppal_eigval):
         df["value"] = df["weight_b"] / df["weight_a"]
@@ -106,6 +110,8 @@ def ahp(
         priority = weight.mean(axis=1)
 
         if ppal_eigval == "eigval":
+            from scipy import linalg
+
             _lambda = linalg.eigvals(tmp)[0].real
         elif ppal_eigval == "approximation":
             _lambda = np.multiply(sum_cols, priority).sum()
@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.plurality import plurality
+from comchoice.instrument.stage import stage
 
 
+@stage
 def antiplurality(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -2,7 +2,10 @@ import pandas as pd
 
 from itertools import combinations
 
+from comchoice.instrument.stage import stage
 
+
+@stage
 def approval(
     df: pd.DataFrame,
     delimiter: str = ",",
@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.nanson_baldwin import nanson_baldwin
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.instrument.stage import stage
 
 
+@stage
 def baldwin(
     df,
     alternative="alternative",
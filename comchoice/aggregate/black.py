@@ -4,8 +4,10 @@ import pandas as pd
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.borda import borda
 from comchoice.aggregate.condorcet import condorcet
+from comchoice.instrument.stage import stage
 
 
+@stage
 def black(
     df,
     alternative="alternative",
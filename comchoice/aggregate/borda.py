@@ -4,9 +4,11 @@ from comchoice.aggregate.__aggregate import __aggregate
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.__set_rank import __set_rank
 from comchoice.aggregate.__set_voters import __set_voters
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 
 
+@stage
 def borda(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -70,6 +72,7 @@ def borda(
                 ballot=ballot,
                 delimiter=delimiter,
                 voters=voters,
+                rmv=kws.get("rmv", transform_kws.get("rmv", []))
             )
         }
     )
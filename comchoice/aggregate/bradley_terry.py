@@ -4,9 +4,11 @@ import pandas as pd
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.__set_rank import __set_rank
 from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 
 
+@stage
 def bradley_terry(
     df,
     delimiter: str = ">",
@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.copeland import copeland
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.instrument.stage import stage
 
 
+@stage
 def condorcet(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -12,7 +14,9 @@ def condorcet(
     voter: str = "voter",
     voters: str = "voters",
     weak: bool = True,
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ):
     """Condorcet winner (1785).
 
@@ -39,6 +43,10 @@ def condorcet(
         Whether or not returns a weak Condorcet winner, by default True.
     transform_kws : dict, optional
         Attributes to handle the data frame
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
@@ -60,7 +68,9 @@ def condorcet(
         show_rank=True,
         voter=voter,
         voters=voters,
-        transform_kws=transform_kws
+        transform_kws=transform_kws,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives
     )
 
     if weak:
@@ -1,8 +1,10 @@
 import pandas as pd
 
 from comchoice.aggregate.__transform import __transform
+from comchoice.instrument.stage import stage
 
 
+@stage
 def coombs(
     df: pd.DataFrame,
     delimiter: str = ">",
@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
 from comchoice.aggregate.__set_rank import __set_rank
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.instrument.stage import stage
 
 
+@stage
 def copeland(
     df,
     alternative="alternative",
@@ -15,7 +17,8 @@ def copeland(
     show_rank=True,
     voter="voter",
     voters="voters",
-    transform_kws=transform_kws
+    transform_kws=transform_kws,
+    alternatives=None
 ):
     """Copeland voting method (1951).
 
@@ -34,7 +37,7 @@ def copeland(
     delimiter : str, optional
         Delimiter used between alternatives in a `ballot`, by default ">".
     pw_matrix : bool, optional
-        A Pairwise Matrix is set in df, by default False.
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
     ballot : str, optional
         Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
     show_rank : bool, optional
@@ -43,6 +46,10 @@ def copeland(
         Column label of voter unique identifier, by default "voter".
     voters : str, optional
         Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    transform_kws : dict, optional
+        Whether or not to process data.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
@@ -54,21 +61,18 @@ def copeland(
     Copeland, A.H. (1951). A “reasonable” social welfare function, mimeographed. In: Seminar on applications of mathematics to the social sciences. Ann Arbor: Department of Mathematics, University of Michigan.
     """
 
-    if pw_matrix:
-        m = df
-        unique_alternatives = list(df)
-
-    else:
-        m, unique_alternatives = pairwise_matrix(
-            df,
-            alternative=alternative,
-            ballot=ballot,
-            delimiter=delimiter,
-            voter=voter,
-            voters=voters,
-            return_alternatives=True,
-            transform_kws=transform_kws
-        )
+    m = __get_pairwise_matrix(
+        df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
+        alternative=alternative,
+        ballot=ballot,
+        delimiter=delimiter,
+        voter=voter,
+        voters=voters,
+        transform_kws=transform_kws
+    )
+    unique_alternatives = list(m)
 
     r = m + m.T
     m = m / r
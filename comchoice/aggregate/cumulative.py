@@ -1,8 +1,10 @@
 import pandas as pd
 
 from comchoice.aggregate.score import score
+from comchoice.instrument.stage import stage
 
 
+@stage
 def cumulative(
     df,
     alternative: str = "alternative",
@@ -1,15 +1,16 @@
 import numpy as np
 import pandas as pd
 from itertools import combinations
-from tqdm import tqdm
 
 from . import ahp
 from comchoice.aggregate.__set_card_id import __set_card_id
 from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing import unpack_ballot, to_pairwise
 
 
 # TODO: Calculate Divisiveness with the Score
+@stage
 def divisiveness(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -71,14 +72,15 @@ def divisiveness(
             **convert_pairwise_kws,
             dtype=dtype
         )
+        # Voters that tie a pair do not belong to any of its groups.
+        df_pairwise = df_pairwise[df_pairwise[selected] != 0]
 
     if "card_id" not in list(df_pairwise):
         df_pairwise = __set_card_id(
             df_pairwise.copy(),
             alternative_a=alternative_a,
             alternative_b=alternative_b,
-            selected=selected,
-            concat="_"
+            selected=selected
         )
 
     if dtype in ["ballot", "ballot_extended"]:
@@ -111,19 +113,24 @@ def divisiveness(
 
     _data_tmp = dd.groupby(level=[0, 1])
 
-    _iter = tqdm(
-        _data_tmp,
-        position=0,
-        leave=True
-    ) if verbose else _data_tmp
+    _iter = _data_tmp
+    if verbose:
+        from tqdm import tqdm
+
+        _iter = tqdm(
+            _data_tmp,
+            position=0,
+            leave=True
+        )
 
     for idx, df_select in _iter:
         tmp_list.append(_f(idx, df_select))
 
     tmp = pd.concat(tmp_list, ignore_index=True)
 
-    tmp[[f"{alternative_a}_sorted", f"{alternative_b}_sorted"]
-        ] = tmp["card_id"].str.split("_", expand=True)
+    pairs = df_pairwise.drop_duplicates("card_id").set_index("card_id")[
+        [f"{alternative_a}_sorted", f"{alternative_b}_sorted"]]
+    tmp = tmp.join(pairs, on="card_id")
     tmp["group"] = tmp[f"{alternative_a}_sorted"].astype(
         str) == tmp[selected].astype(str)
     tmp["group"] = tmp["group"].replace({True: "A", False: "B"})
@@ -1,10 +1,13 @@
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.dodgson_exact import dodgson_exact
 from comchoice.aggregate.dodgson_quick import dodgson_quick
 from comchoice.aggregate.tideman import tideman
+from comchoice.instrument.stage import stage
 
 
+@stage
 def dodgson(
     df,
     approximation: str = "quick",
@@ -14,9 +17,31 @@ def dodgson(
     show_rank: bool = True,
     voter: str = "voter",
     voters: str = "voters",
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None,
+    time_limit: float = 10
 ):
-    if approximation == "quick":
+    if approximation not in ["exact", "quick", "tideman"]:
+        raise ValueError(
+            "Value provided to approximation parameter not valid. Values accepted are 'exact', 'quick', 'tideman'")
+
+    if approximation == "exact":
+        if pw_matrix:
+            raise ValueError(
+                "Value provided to pw_matrix parameter not valid. Exact Dodgson scores require the ballots")
+
+        return dodgson_exact(
+            df,
+            alternative=alternative,
+            ballot=ballot,
+            delimiter=delimiter,
+            delimiter_ties=transform_kws.get("delimiter_ties", "="),
+            show_rank=show_rank,
+            voters=voters,
+            time_limit=time_limit
+        )
+    elif approximation == "quick":
         return dodgson_quick(
             df,
             alternative=alternative,
@@ -25,7 +50,9 @@ def dodgson(
             show_rank=show_rank,
             voter=voter,
             voters=voters,
-            transform_kws=transform_kws
+            transform_kws=transform_kws,
+            pw_matrix=pw_matrix,
+            alternatives=alternatives
         )
     elif approximation == "tideman":
         return tideman(
@@ -36,5 +63,7 @@ def dodgson(
             show_rank=show_rank,
             voter=voter,
             voters=voters,
-            transform_kws=transform_kws
+            transform_kws=transform_kws,
+            pw_matrix=pw_matrix,
+            alternatives=alternatives
         )
@@ -0,0 +1,229 @@
+import time
+import warnings
+import numpy as np
+import pandas as pd
+
+from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.to_profile import to_profile
+
+
+def __swap_tree(ranks, weights, c):
+    # Prefix tree of the alternatives ranked above `c`, from the closest to the farthest.
+    # A node is a sequence of alternatives that `c` passes when it moves up in a ballot,
+    # and its capacity is the number of voters whose ballot starts with that sequence.
+    n, m = ranks.shape
+    rc = ranks[:, c]
+    above = (ranks > 0) & (ranks < rc[:, np.newaxis])
+    k = above.sum(axis=1)
+    sequence = np.argsort(np.where(above, -ranks, np.iinfo(np.int64).max), axis=1, kind="stable")
+
+    parent, alternative, capacity, depth = [], [], [], []
+    n_nodes = 0
+    node = np.full(n, -1, dtype=np.int64)
+    for j in range(int(k.max(initial=0))):
+        rows = np.flatnonzero(k > j)
+        codes, keys = pd.factorize((node[rows] + 1) * m + sequence[rows, j])
+        first = np.zeros(len(keys), dtype=np.int64)
+        first[codes[::-1]] = rows[::-1]
+
+        parent.append(node[first])
+        alternative.append(sequence[first, j])
+        capacity.append(np.bincount(codes, weights=weights[rows], minlength=len(keys)))
+        depth.append(np.full(len(keys), j))
+        node[rows] = codes + n_nodes
+        n_nodes += len(keys)
+
+    if n_nodes == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0, dtype=np.int64)
+
+    return np.concatenate(parent), np.concatenate(alternative), np.concatenate(capacity), np.concatenate(depth)
+
+
+def __prune(parent, alternative, capacity, depth, targets):
+    # Removes the nodes without targets in their subtree: passing them only adds swaps.
+    keep = targets[alternative]
+    for j in range(int(depth.max(initial=0)), 0, -1):
+        v = np.flatnonzero((depth == j) & keep)
+        keep[parent[v]] = True
+
+    index = np.full(len(parent), -1, dtype=np.int64)
+    index[keep] = np.arange(keep.sum())
+    parent = parent[keep]
+    parent = np.where(parent >= 0, index[parent], -1)
+
+    return parent, alternative[keep], capacity[keep]
+
+
+def __dodgson_score(parent, alternative, capacity, deficit, deadline):
+    # Integer program: y[v] voters move `c` up past the sequence of node v.
+    # A node cannot be passed by more voters than its parent, and `c` must gain
+    # `deficit[a]` comparisons against each alternative `a`.
+    from scipy.optimize import Bounds, LinearConstraint, milp
+    from scipy.sparse import coo_matrix
+
+    n_nodes = len(parent)
+    targets = np.flatnonzero(deficit > 0)
+
+    has_parent = np.flatnonzero(parent >= 0)
+    parents, row_parent = np.unique(parent[has_parent], return_inverse=True)
+    row_target = np.full(len(deficit), -1)
+    row_target[targets] = np.arange(len(targets)) + len(parents)
+    gains = np.flatnonzero(row_target[alternative] >= 0)
+
+    A = coo_matrix((
+        np.r_[np.ones(len(has_parent)), -np.ones(len(parents)), np.ones(len(gains))],
+        (
+            np.r_[row_parent, np.arange(len(parents)), row_target[alternative[gains]]],
+            np.r_[has_parent, parents, gains]
+        )
+    ), shape=(len(parents) + len(targets), n_nodes)).tocsr()
+    constraints = LinearConstraint(
+        A,
+        np.r_[np.full(len(parents), -np.inf), deficit[targets]],
+        np.r_[np.zeros(len(parents)), np.full(len(targets), np.inf)]
+    )
+
+    # The linear relaxation is usually integral, so it is solved first. Whether it is not,
+    # the integer program is solved without a tolerance on the gap.
+    output = deficit.sum(), False
+    for integrality, options in [(0, dict()), (1, dict(mip_rel_gap=0))]:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        res = milp(
+            np.ones(n_nodes),
+            constraints=constraints,
+            integrality=np.full(n_nodes, integrality),
+            bounds=Bounds(0, capacity),
+            options=dict(time_limit=remaining, **options)
+        )
+
+        if res.x is None:
+            continue
+
+        x = np.round(res.x)
+        if res.status == 0 and np.abs(res.x - x).max() < 1e-6:
+            return x.sum(), True
+
+        if integrality:
+            output = x.sum(), False
+        else:
+            output = max(np.ceil(res.fun - 1e-6), output[0]), False
+
+    return output
+
+
+@stage
+def dodgson_exact(
+    df,
+    alternative: str = "alternative",
+    ballot: str = "ballot",
+    delimiter: str = ">",
+    delimiter_ties: str = "=",
+    show_rank: bool = True,
+    voters: str = "voters",
+    time_limit: float = 10
+) -> pd.DataFrame:
+    """Exact Dodgson scores (1876).
+
+    The Dodgson score of an alternative is the minimum number of swaps between adjacent
+    alternatives in the ballots that make it a Condorcet winner (it beats every other
+    alternative in a strict majority of pairwise comparisons).
+
+    Scores are computed as integer programs over the compressed profile of unique ballots
+    (Bartholdi, Tovey and Trick, 1989). Ballots that share the alternatives ranked above an
+    alternative are merged into a prefix tree, so the size of the programs depends on the
+    number of alternatives and unique ballots, and not on the number of voters.
+
+    An alternative only passes the alternatives ranked strictly above it. Tied alternatives
+    are not compared (as in `Profile.pairwise_matrix`), so they are never passed, and an
+    alternative that is not ranked in a ballot cannot be moved up in it. An alternative
+    that cannot become a Condorcet winner has an infinite score.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or Profile
+        A data set to be aggregated, or a `comchoice.preprocessing.Profile`.
+    alternative : str, optional
+        Column label of the alternatives in the output, by default "alternative".
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    show_rank : bool, optional
+        Whether or not to include the ranking of alternatives, by default True.
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    time_limit : float, optional
+        Maximum time in seconds to compute all the scores, by default 10. Whether a score is not
+        proved optimal in time, it falls back to the best number of swaps found (an upper bound),
+        or to a lower bound (the linear relaxation, or the number of comparisons that the
+        alternative needs to gain), and a warning is raised.
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregation of preferences using Dodgson method.
+
+    References
+    ----------
+    Dodgson, C.L. (1876). A method of taking votes on more than two issues. Oxford: Clarendon Press.
+
+    Bartholdi, J., Tovey, C.A., & Trick, M.A. (1989). Voting schemes for which it can be difficult to tell who won the election. Social Choice and Welfare, 6(2), 157-165.
+    """
+    if not isinstance(df, Profile):
+        df = to_profile(
+            df,
+            ballot=ballot,
+            delimiter=delimiter,
+            delimiter_ties=delimiter_ties,
+            voters=voters
+        )
+
+    profile = df.compress()
+    ranks = profile.ranks.astype(np.int64)
+    weights = profile.weights.astype(float)
+    P = profile.pairwise_matrix()
+
+    # Comparisons that each alternative (columns) needs to gain against each alternative (rows).
+    deficit = np.maximum(np.ceil((P - P.T + 1) / 2), 0)
+    np.fill_diagonal(deficit, 0)
+
+    deadline = time.monotonic() + time_limit
+    value = np.zeros(profile.n_alternatives)
+    approximated = []
+    for c in range(profile.n_alternatives):
+        d = deficit[:, c]
+        if d.sum() == 0:
+            continue
+
+        parent, alternatives, capacity, depth = __swap_tree(ranks, weights, c)
+        if (np.bincount(alternatives, weights=capacity, minlength=len(d)) < d).any():
+            value[c] = np.inf
+            continue
+
+        parent, alternatives, capacity = __prune(parent, alternatives, capacity, depth, d > 0)
+
+        value[c], exact = __dodgson_score(parent, alternatives, capacity, d, deadline)
+
+        if not exact:
+            approximated.append(profile.alternatives[c])
+
+    if approximated:
+        warnings.warn(
+            f"Dodgson scores of {', '.join(map(str, approximated))} were not proved optimal within the time limit of {time_limit} seconds")
+
+    tmp = pd.DataFrame({
+        alternative: profile.alternatives,
+        "value": value
+    })
+
+    if show_rank:
+        tmp = __set_rank(tmp, ascending=True)
+
+    return tmp
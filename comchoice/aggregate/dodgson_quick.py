@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
 from comchoice.aggregate.__set_rank import __set_rank
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.instrument.stage import stage
 
 
+@stage
 def dodgson_quick(
     df,
     alternative: str = "alternative",
@@ -14,10 +16,14 @@ def dodgson_quick(
     show_rank: bool = True,
     voter: str = "voter",
     voters: str = "voters",
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ) -> pd.DataFrame:
-    m = pairwise_matrix(
+    m = __get_pairwise_matrix(
         df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
         alternative=alternative,
         ballot=ballot,
         delimiter=delimiter,
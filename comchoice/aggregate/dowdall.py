@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.borda import borda
+from comchoice.instrument.stage import stage
 
 
+@stage
 def dowdall(
     df,
     alternative: str = "alternative",
@@ -2,9 +2,11 @@ import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 
 
+@stage
 def elo(
     df: pd.DataFrame,
     alternative_a: str = "alternative_a",
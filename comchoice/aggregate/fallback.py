@@ -1,8 +1,10 @@
 import pandas as pd
 
 from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
 
 
+@stage
 def fallback(
     df,
     alternatives: str = "alternatives",
@@ -1,6 +1,8 @@
 from comchoice.aggregate.quota import quota
+from comchoice.instrument.stage import stage
 
 
+@stage
 def hare_quota(
     n_votes: int = 1,
     n_seats: int = 1
@@ -3,9 +3,11 @@ import pandas as pd
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.__set_voters import __set_voters
 from comchoice.aggregate.__aggregate import __aggregate
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 
 
+@stage
 def irv(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -4,9 +4,11 @@ import pandas as pd
 from comchoice.aggregate.__aggregate import __aggregate
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 
 
+@stage
 def judgment(
     df,
     alternative: str = "alternative",
@@ -126,8 +128,7 @@ def judgment(
         jdgm["value"] = jdgm["alpha"] - jdgm["q"]
 
     elif method == "majority":
-        jdgm["value"] = jdgm.apply(lambda x: x["p"] if (
-            x["p"] > x["q"]) else -x["q"], axis=1)
+        jdgm["value"] = jdgm["alpha"] + np.where(jdgm["p"] > jdgm["q"], jdgm["p"], -jdgm["q"])
 
     if show_rank:
         jdgm = __set_rank(jdgm, ascending=False)
@@ -2,9 +2,11 @@ import pandas as pd
 from itertools import combinations, permutations
 
 from comchoice.aggregate.__default_parameters import transform_kws
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
+from comchoice.instrument.stage import stage
 
 
+@stage
 def kemeny_young(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -13,7 +15,9 @@ def kemeny_young(
     voter: str = "voter",
     voters: str = "voters",
     score_matrix: bool = False,
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ) -> pd.DataFrame:
     """Kemeny-Young method (1959).
 
@@ -38,6 +42,10 @@ def kemeny_young(
         _description_, by default False.
     transform_kws : dict, optional
         Whether or not to process data.
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
@@ -52,8 +60,10 @@ def kemeny_young(
 
     H. P. Young and A. Levenglick, "A Consistent Extension of Condorcet's Election Principle", SIAM Journal on Applied Mathematics 35, no. 2 (1978), pp. 285-300.
     """
-    m = pairwise_matrix(
+    m = __get_pairwise_matrix(
         df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
         alternative=alternative,
         ballot=ballot,
         delimiter=delimiter,
@@ -78,7 +88,7 @@ def kemeny_young(
         return tmp
 
     tmp_r = pd.DataFrame()
-    tmp_r[alternative] = tmp.loc[0, "rank"]
-    tmp_r[ballot] = range(1, tmp_r.shape[0] + 1)
+    tmp_r[alternative] = tmp.loc[0, ballot]
+    tmp_r["rank"] = range(1, tmp_r.shape[0] + 1)
 
     return tmp_r
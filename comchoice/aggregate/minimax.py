@@ -1,10 +1,12 @@
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
 from comchoice.aggregate.__set_rank import __set_rank
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.instrument.stage import stage
 
 
+@stage
 def minimax(
     df: pd.DataFrame,
     method="winning_votes",
@@ -14,7 +16,9 @@ def minimax(
     show_rank=True,
     voter="voter",
     voters="voters",
-    transform_kws=transform_kws
+    transform_kws=transform_kws,
+    pw_matrix=False,
+    alternatives=None
 ) -> pd.DataFrame:
     """Minimax rule.
 
@@ -36,14 +40,22 @@ def minimax(
         Column label of voter unique identifier, by default "voter".
     voters : str, optional
         Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    transform_kws : dict, optional
+        Whether or not to process data.
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
     pd.DataFrame
         Aggregation of preferences using Minimax.
     """
-    d = pairwise_matrix(
+    d = __get_pairwise_matrix(
         df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
         alternative=alternative,
         ballot=ballot,
         delimiter=delimiter,
@@ -3,8 +3,10 @@ import pandas as pd
 
 from comchoice.aggregate.borda import borda
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.instrument.stage import stage
 
 
+@stage
 def nanson_baldwin(
     df: pd.DataFrame,
     method="nanson",
@@ -36,7 +38,11 @@ def nanson_baldwin(
         if method == "baldwin":
             rmv += list(tmp.tail(1)[alternative].unique())
         elif method == "nanson":
-            rmv += list(tmp[tmp["value"] < mean][alternative].unique())
+            removed = list(tmp[tmp["value"] < mean][alternative].unique())
+            if len(removed) == 0:
+                # All the remaining alternatives are tied.
+                break
+            rmv += removed
 
         tmp = borda(
             df,
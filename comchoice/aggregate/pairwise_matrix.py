@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.transform import transform
 from itertools import combinations
 
 
+@stage
 def pairwise_matrix(
     df,
     alternative="alternative",
@@ -19,6 +21,10 @@ def pairwise_matrix(
 ):
     """Pairwise Matrix.
 
+    The value in row `a` and column `b` is the number of voters that rank `a` over `b`.
+    Tied alternatives, and alternatives that are not ranked in a ballot, are not compared,
+    as in `comchoice.preprocessing.Profile.pairwise_matrix`.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -73,9 +79,12 @@ def pairwise_matrix(
         _voter, _voters = idx
 
         df_tmp = df_tmp.sort_values("rank")
-        items = df_tmp[alternative].values
+        items = zip(df_tmp[alternative].values, df_tmp["rank"].values)
 
-        tmp = pd.DataFrame(list(combinations(items, 2)), columns=cols)
+        # Tied alternatives are not compared.
+        tmp = pd.DataFrame([
+            (a, b) for (a, rank_a), (b, rank_b) in combinations(items, 2) if rank_a < rank_b
+        ], columns=cols)
         tmp["value"] = _voters
         output.append(tmp)
 
@@ -1,7 +1,10 @@
 import numpy as np
 import pandas as pd
 
+from comchoice.instrument.stage import stage
 
+
+@stage
 def phragmen(
     df,
     n_seats: int = 2,
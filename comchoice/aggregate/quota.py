@@ -1,6 +1,9 @@
 from math import floor
 
+from comchoice.instrument.stage import stage
 
+
+@stage
 def quota(
     method: str = "hare",
     n_votes: int = 1,
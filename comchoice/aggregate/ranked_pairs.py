@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
+from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
+
+
+@stage
+def ranked_pairs(
+    df,
+    method: str = "margins",
+    tie_breaking: list = None,
+    alternative: str = "alternative",
+    ballot: str = "ballot",
+    delimiter: str = ">",
+    show_rank: bool = True,
+    voter: str = "voter",
+    voters: str = "voters",
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None,
+    get_pairs: bool = False
+):
+    """Ranked Pairs (Tideman, 1987).
+
+    Majority pairs (a beats b in a majority of comparisons) are sorted by strength, and
+    locked in one by one, unless they create a cycle with the pairs already locked in.
+    Alternatives are ranked by the number of alternatives they beat in the graph of
+    locked pairs, directly or through other alternatives, so the winner beats all of them.
+
+    The graph keeps the set of alternatives reachable from each alternative, so checking
+    whether a pair creates a cycle takes constant time, and locking it in updates the
+    alternatives that reach its winner at once.
+
+    Pairs of the same strength are sorted by a tie-breaking ranking of the alternatives
+    (Zavist and Tideman, 1989): first the pair whose winner ranks higher in it and, for the
+    same winner, the pair whose loser ranks lower in it.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A data set to be aggregated.
+    method : {"margins", "winning_votes"}, optional
+        Strength of a pair, by default "margins". Whether "margins", it is the difference between
+        the voters that prefer its winner and its loser. Whether "winning_votes", it is the number
+        of voters that prefer its winner, and pairs with the same winning votes are sorted by their
+        losing votes in ascending order.
+    tie_breaking : list, optional
+        Ranking of the alternatives used to sort pairs of the same strength, by default the order
+        of the alternatives in the pairwise matrix.
+    alternative : str, optional
+        Column label to get alternatives, by default "alternative".
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    show_rank : bool, optional
+        Whether or not to include the ranking of alternatives, by default True.
+    voter : str, optional
+        Column label of voter unique identifier, by default "voter".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    transform_kws : dict, optional
+        Whether or not to process data.
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
+    get_pairs : bool, optional
+        Whether or not to return the majority pairs in the order in which they were considered, by default False.
+
+    Returns
+    -------
+    pd.DataFrame or (pd.DataFrame, pd.DataFrame)
+        Aggregation of preferences using Ranked Pairs. Whether `get_pairs` is True, a second DataFrame
+        includes the winner, loser, strength (value) of each majority pair and whether or not it was locked in.
+
+    References
+    ----------
+    Tideman, T.N. (1987). Independence of clones as a criterion for voting rules. Social Choice and Welfare, 4(3), 185-206.
+
+    Zavist, T.M., & Tideman, T.N. (1989). Complete independence of clones in the ranked pairs rule. Social Choice and Welfare, 6(2), 167-173.
+    """
+    if method not in ["margins", "winning_votes"]:
+        raise ValueError(
+            "Value provided to method parameter not valid. Values accepted are 'margins', 'winning_votes'")
+
+    d = __get_pairwise_matrix(
+        df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
+        alternative=alternative,
+        ballot=ballot,
+        delimiter=delimiter,
+        voter=voter,
+        voters=voters,
+        transform_kws=transform_kws
+    )
+
+    labels = d.index
+    m = len(labels)
+    P = d.values
+
+    if tie_breaking is None:
+        order = np.arange(m)
+    else:
+        tie_breaking = list(tie_breaking) + [x for x in labels if x not in tie_breaking]
+        order = pd.Index(tie_breaking).get_indexer(labels)
+
+    winners, losers = np.nonzero(P > P.T)
+    votes, against = P[winners, losers], P[losers, winners]
+    if method == "margins":
+        keys = (order[losers] * -1, order[winners], -(votes - against))
+    else:
+        keys = (order[losers] * -1, order[winners], against, -votes)
+    index = np.lexsort(keys)
+    winners, losers = winners[index], losers[index]
+
+    # reach[a, b]: b is reachable from a through locked pairs.
+    reach = np.eye(m, dtype=bool)
+    locked = np.zeros(len(index), dtype=bool)
+    for i, (a, b) in enumerate(zip(winners, losers)):
+        if reach[b, a]:
+            continue
+
+        locked[i] = True
+        reach[reach[:, a]] |= reach[b]
+
+    tmp = pd.DataFrame({
+        alternative: np.asarray(labels, dtype=object),
+        "value": reach.sum(axis=1) - 1
+    })
+
+    if show_rank:
+        tmp = __set_rank(tmp)
+
+    if get_pairs:
+        pairs = pd.DataFrame({
+            "winner": np.asarray(labels[winners], dtype=object),
+            "loser": np.asarray(labels[losers], dtype=object),
+            "value": (votes - against)[index] if method == "margins" else votes[index],
+            "locked": locked
+        })
+
+        return tmp, pairs
+
+    return tmp
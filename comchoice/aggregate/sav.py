@@ -1,8 +1,10 @@
 import pandas as pd
 
 from comchoice.aggregate.approval import approval
+from comchoice.instrument.stage import stage
 
 
+@stage
 def sav(
     df,
     delimiter: str = ",",
@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
 from comchoice.aggregate.__set_rank import __set_rank
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.instrument.stage import stage
 
 
+@stage
 def schulze(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -14,7 +16,9 @@ def schulze(
     show_rank: bool = True,
     voter: str = "voter",
     voters: str = "voters",
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ):
     """Schulze method (2011)
 
@@ -36,6 +40,10 @@ def schulze(
         Whether the number of voters is defined in the data, it represents its column label, by default "voters".
     transform_kws : dict, optional
         Whether or not to process data.
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
@@ -47,8 +55,10 @@ def schulze(
     Schulze, M. (2011). A new monotonic, clone-independent, reversal symmetric, and condorcet-consistent single-winner election method. Social choice and Welfare, 36(2), 267-303.
 
     """
-    d = pairwise_matrix(
+    d = __get_pairwise_matrix(
         df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
         alternative=alternative,
         ballot=ballot,
         delimiter=delimiter,
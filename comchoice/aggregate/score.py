@@ -4,8 +4,10 @@ from comchoice.aggregate.__aggregate import __aggregate
 from comchoice.aggregate.__set_rank import __set_rank
 from comchoice.aggregate.__set_voters import __set_voters
 from comchoice.aggregate.__transform import __transform
+from comchoice.instrument.stage import stage
 
 
+@stage
 def score(
     df,
     aggregation: str = "mean",
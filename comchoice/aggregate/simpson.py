@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.minimax import minimax
+from comchoice.instrument.stage import stage
 
 
+@stage
 def simpson(
     df: pd.DataFrame,
     method: str = "winning_votes",
@@ -13,7 +15,9 @@ def simpson(
     show_rank: bool = True,
     voter: str = "voter",
     voters: str = "voters",
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ):
     return minimax(
         df,
@@ -24,5 +28,7 @@ def simpson(
         show_rank=show_rank,
         voter=voter,
         voters=voters,
-        transform_kws=transform_kws
+        transform_kws=transform_kws,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives
     )
@@ -2,9 +2,11 @@ import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
+from comchoice.instrument.stage import stage
 
 
+@stage
 def smith_set(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -12,7 +14,9 @@ def smith_set(
     delimiter: str = ">",
     voter: str = "voter",
     voters: str = "voters",
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ) -> list:
     """Smith Set.
 
@@ -36,6 +40,10 @@ def smith_set(
         Whether the number of voters is defined in the data, it represents its column label, by default "voters".
     transform_kws : dict, optional
         Whether or not to process data.
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
@@ -43,8 +51,10 @@ def smith_set(
         Alternatives that are part of the Smith Set.
     """
 
-    m = pairwise_matrix(
+    m = __get_pairwise_matrix(
         df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
         alternative=alternative,
         ballot=ballot,
         delimiter=delimiter,
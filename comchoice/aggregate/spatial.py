@@ -1,28 +1,60 @@
-from math import floor
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-from comchoice.aggregate import elo,condorcet, copeland, plurality
 
+from comchoice.aggregate.condorcet import condorcet
+from comchoice.aggregate.copeland import copeland
+from comchoice.aggregate.elo import elo
+from comchoice.aggregate.plurality import plurality
+from comchoice.instrument.stage import stage
+
+methods = dict(
+    condorcet=condorcet,
+    copeland=copeland,
+    elo=elo,
+    plurality=plurality
+)
+
+
+def __spatial_winner(args):
+    method, df, kwargs = args
+    winner = method(df, **kwargs)
+    if len(winner) > 0:
+        return winner.sort_values(by="rank")["alternative"].values[0]
+    return None
+
+
+@stage
 def spatial(
     data,
     method: str = "condorcet",
     column_group: str = "grid_list",
     delimiter: str = ",",
     showHeatmap: bool = True,
+    n_jobs: int = 1,
     **kwargs
-) -> int:
+):
     """Computes Spatial aggregation.
 
+    The data is partitioned once by the codes of `column_group`, and the
+    aggregation rule runs on each cell of the grid.
+
     Parameters
     ----------
-    method : {"elo", "copeland", "condorcet", "plurality"}
+    method : {"elo", "copeland", "condorcet", "plurality"} or callable
         Specifies the method to compute the spatial aggregation, by default "condorcet".
+        A comchoice function can be given as well.
     column_group : int
         Specifies the column which has the spatial xy information, by default grid_list.
     delimiter : int
         Split the column_group using an element, by default ","
+    showHeatmap : bool, optional
+        Whether or not to plot the winners over the space, by default True.
+        When it is `False`, plotting libraries are not imported.
+    n_jobs : int, optional
+        Number of worker processes used to aggregate the cells, by default 1.
+    **kwargs
+        Arguments passed to the aggregation method.
 
     Returns
     -------
@@ -31,51 +63,40 @@ def spatial(
     plot
         Heatmap showing the winners distributed over the space
     """
+    title = method if isinstance(method, str) else method.__name__
+    if isinstance(method, str):
+        if method not in methods:
+            raise ValueError(
+                f"Value provided to method parameter not valid. Values accepted are {', '.join(methods)}")
+        method = methods[method]
+
+    codes, grids = pd.factorize(data[column_group])
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    bounds = np.cumsum(np.bincount(codes[order], minlength=len(grids)))[:-1]
+
+    tasks = (
+        (method, data.take(idx), kwargs)
+        for idx in np.split(order, bounds)
+    )
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            output = list(executor.map(__spatial_winner, tasks))
+    else:
+        output = [__spatial_winner(task) for task in tasks]
+
+    winners = pd.DataFrame({"winner": output, column_group: list(grids)})
 
-    winners = []
-    for grid in data[column_group].unique():
-        winner =  []
-        if method == "elo":
-            winner  =  elo(data[data[column_group]==grid]).sort_values(by='rank').head(1)
-        elif method == "copeland":
-            winner  =  copeland(data[data[column_group]==grid]).sort_values(by='rank').head(1)
-        elif method == "condorcet":
-            winner  =  condorcet(data[data[column_group]==grid]).sort_values(by='rank').head(1)
-        elif method == "plurality":
-            winner  =  plurality(data[data[column_group]==grid]).sort_values(by='rank').head(1)
-        
-        if len(winner) > 0:
-            winners.append([winner['alternative'].values[0], grid])
-        else:
-            winners.append([None, grid])
-        
-    winners = pd.DataFrame(winners, columns=["winner",column_group])
-    
     if showHeatmap:
-        fig, ax = plt.subplots(figsize=(8,6))
-        if column_group == "grid_list":
-            winners['x'] = winners[column_group].apply(lambda x: x[0])
-            winners['y'] = winners[column_group].apply(lambda x: x[1])
-        elif column_group == "grid_split":
-            winners['x'] = winners[column_group].apply(str).str.split(delimiter, expand=True)[0]
-            winners['y'] = winners[column_group].apply(str).str.split(delimiter, expand=True)[1]
-        winners = winners.sort_values(by="winner", ascending=False)
-        winners['cat'] = pd.Categorical(winners["winner"]).codes
-        winners
-        
-        value_to_int = {j:i for i,j in enumerate(pd.unique(winners["winner"].ravel()))}
-        n = len(value_to_int)     
-        cmap = sns.color_palette("hsv", n)
-        sns.heatmap(winners.pivot_table(index="y",columns="x",values='cat', \
-            aggfunc=np.unique), cmap=cmap, ax=ax)
-        colorbar = ax.collections[0].colorbar 
-        r = colorbar.vmax - colorbar.vmin 
-        colorbar.set_ticks([colorbar.vmin + r / n * (0.5 + i) for i in range(n)])
-        colorbar.set_ticklabels(list(value_to_int.keys())) 
-        ax.invert_yaxis()
-        ax.set_title(method)
-        fig.data = winners
-        plt.ioff()
-        return winners[["winner",column_group]], fig
-
-    return winners[["winner",column_group]]
+        from comchoice.analyzer.plot_spatial import plot_spatial
+
+        fig = plot_spatial(
+            winners,
+            column_group=column_group,
+            delimiter=delimiter,
+            title=title
+        )
+        return winners, fig
+
+    return winners
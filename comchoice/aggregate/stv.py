@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.aggregate.quota import quota as get_quota
+from comchoice.instrument.stage import stage
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.to_profile import to_profile
+
+stv_quotas = ["droop", "hagenbach-bischoff", "hare", "imperiali"]
+
+
+def __advance(order, head, current, continuing, rows):
+    # Moves the head of the ballots to their next continuing alternative.
+    while rows.size > 0:
+        head[rows] += 1
+        current[rows] = order[rows, head[rows]]
+        moved = current[rows] >= 0
+        moved[moved] = ~continuing[current[rows[moved]]]
+        rows = rows[moved]
+
+
+def __lowest(tally, history, continuing, labels, tol):
+    # Alternative to exclude: the lowest tally, ties are broken by the tallies of the
+    # previous rounds (from the latest to the earliest), and then by the last label.
+    candidates = np.flatnonzero(continuing & (tally <= tally[continuing].min() + tol))
+    for previous in history[::-1]:
+        if len(candidates) == 1:
+            break
+        candidates = candidates[previous[candidates] <= previous[candidates].min() + tol]
+
+    return candidates[np.argmax(labels[candidates])]
+
+
+@stage
+def stv(
+    df,
+    n_seats: int = 1,
+    quota="droop",
+    transfer: str = "wig",
+    alternative: str = "alternative",
+    ballot: str = "ballot",
+    delimiter: str = ">",
+    delimiter_ties: str = "=",
+    voters: str = "voters",
+    get_rounds: bool = False
+):
+    """Single Transferable Vote (STV).
+
+    In each round, the alternatives whose votes reach the quota are elected, and their surplus
+    (votes over the quota) is transferred to the next continuing alternative of their ballots.
+    Whether no alternative reaches the quota, the alternative with the fewest votes is excluded,
+    and its ballots are transferred at their current value. Whether the continuing alternatives
+    are not more than the remaining seats, all of them are elected.
+
+    The count runs on the compressed profile of unique ballots. Each ballot keeps a pointer to
+    its current alternative and a fractional value, so the votes of a round are a weighted
+    count of the current alternatives, and all the ballots of the elected or excluded
+    alternatives are transferred at once.
+
+    Ties in a ballot are ordered by the labels of the alternatives. Ties between the
+    alternatives with the fewest votes are broken by their votes in the previous rounds,
+    from the latest to the earliest, and then by excluding the last label in ascending order.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or Profile
+        A data set to be aggregated, or a `comchoice.preprocessing.Profile`.
+    n_seats : int, optional
+        Number of seats to elect, by default 1.
+    quota : {"droop", "hagenbach-bischoff", "hare", "imperiali"} or callable, optional
+        Quota computed with `comchoice.aggregate.quota` from the number of valid votes, by default "droop".
+        It also accepts a function of `n_votes` and `n_seats`, such as `comchoice.aggregate.droop_quota`.
+        Alternatives are elected when their votes reach the quota, or exceed it for "hagenbach-bischoff".
+    transfer : {"wig", "gregory"}, optional
+        Method to transfer surpluses, by default "wig". Whether "wig" (Weighted Inclusive Gregory),
+        every ballot of an elected alternative is transferred at its current value times the surplus
+        divided by the votes of the alternative. Whether "gregory" (Inclusive Gregory), every ballot
+        is transferred at the surplus divided by the number of ballots of the alternative.
+    alternative : str, optional
+        Column label of the alternatives in the output, by default "alternative".
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    get_rounds : bool, optional
+        Whether or not to return the transcript of the count, by default False.
+
+    Returns
+    -------
+    pd.DataFrame or (pd.DataFrame, pd.DataFrame)
+        Elected alternatives with their votes (value) and round in which they were elected, ranked
+        by order of election. Whether `get_rounds` is True, a second DataFrame includes the votes
+        (value) and status ("elected", "excluded" or "continuing") of the continuing alternatives in
+        each round, the votes of exhausted ballots and the quota.
+    """
+    if not callable(quota) and quota not in stv_quotas:
+        raise ValueError(
+            f"Value provided to quota parameter not valid. Values accepted are {', '.join(stv_quotas)}")
+
+    if transfer not in ["wig", "gregory"]:
+        raise ValueError(
+            "Value provided to transfer parameter not valid. Values accepted are 'wig', 'gregory'")
+
+    if not isinstance(df, Profile):
+        df = to_profile(
+            df,
+            ballot=ballot,
+            delimiter=delimiter,
+            delimiter_ties=delimiter_ties,
+            voters=voters
+        )
+
+    profile = df.compress()
+    ranks = profile.ranks.astype(np.int64)
+    n, m = ranks.shape
+
+    # Position of each alternative in the ascending order of labels, used to break ties.
+    labels = np.argsort(np.argsort(profile.alternatives.astype(str), kind="stable"))
+
+    # Alternatives of each ballot in order of preference, padded with -1.
+    ranked = ranks > 0
+    order = np.argsort(np.where(ranked, ranks * m + labels, (m + 1) * m), axis=1)
+    order = np.where(np.arange(m) < ranked.sum(axis=1, keepdims=True), order, -1)
+    order = np.hstack([order, np.full((n, 1), -1)])
+
+    counts = profile.weights.astype(float)
+    value = counts.copy()
+    head = np.zeros(n, dtype=np.int64)
+    current = order[:, 0].copy()
+
+    n_votes = value[order[:, 0] >= 0].sum()
+    if callable(quota):
+        threshold = quota(n_votes=n_votes, n_seats=n_seats)
+    else:
+        threshold = get_quota(method=quota, n_votes=n_votes, n_seats=n_seats)
+
+    # Fractional votes are compared with a tolerance for rounding errors.
+    tol = 1e-10 * max(n_votes, 1)
+
+    continuing = np.ones(m, dtype=bool)
+    elected, history, transcript = [], [], []
+    while len(elected) < n_seats and continuing.any():
+        valid = current >= 0
+        tally = np.bincount(current[valid], weights=value[valid], minlength=m)
+        remaining = n_seats - len(elected)
+
+        if quota == "hagenbach-bischoff":
+            reached = continuing & (tally > threshold + tol)
+        else:
+            reached = continuing & (tally >= threshold - tol)
+
+        index = np.flatnonzero(continuing)
+        status = np.full(m, "continuing", dtype=object)
+        if continuing.sum() <= remaining:
+            winners = np.flatnonzero(continuing)
+        elif reached.any():
+            winners = np.flatnonzero(reached)
+        else:
+            winners = np.zeros(0, dtype=np.int64)
+
+        if len(winners) > 0:
+            winners = winners[np.lexsort((labels[winners], -tally[winners]))][:remaining]
+            status[winners] = "elected"
+            elected += [(x, tally[x], len(history) + 1) for x in winners]
+
+            # Surpluses of the alternatives elected in the same round are transferred at once.
+            surplus = np.maximum(tally - threshold, 0)
+            moving = np.isin(current, winners)
+            if transfer == "wig":
+                ratio = np.divide(surplus, tally, out=np.zeros(m), where=tally > 0)
+                value[moving] *= ratio[current[moving]]
+            else:
+                papers = np.bincount(current[valid], weights=counts[valid], minlength=m)
+                ratio = np.divide(surplus, papers, out=np.zeros(m), where=papers > 0)
+                value[moving] = counts[moving] * ratio[current[moving]]
+            continuing[winners] = False
+
+        else:
+            loser = __lowest(tally, history, continuing, labels, tol)
+            status[loser] = "excluded"
+            moving = current == loser
+            continuing[loser] = False
+
+        __advance(order, head, current, continuing, np.flatnonzero(moving))
+
+        transcript.append(pd.DataFrame({
+            "round": len(history) + 1,
+            alternative: profile.alternatives[index],
+            "value": tally[index],
+            "status": status[index],
+            "exhausted": value[~valid].sum(),
+            "quota": threshold
+        }))
+        history.append(tally)
+
+    tmp = pd.DataFrame(
+        [(profile.alternatives[x], v, r) for x, v, r in elected],
+        columns=[alternative, "value", "round"]
+    )
+    tmp["rank"] = range(1, tmp.shape[0] + 1)
+
+    if get_rounds:
+        rounds = pd.concat(transcript, ignore_index=True) if transcript else pd.DataFrame(
+            columns=["round", alternative, "value", "status", "exhausted", "quota"])
+        return tmp, rounds
+
+    return tmp
@@ -2,10 +2,12 @@ import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
-from comchoice.aggregate.pairwise_matrix import pairwise_matrix
+from comchoice.aggregate.__get_pairwise_matrix import __get_pairwise_matrix
 from comchoice.aggregate.__set_rank import __set_rank
+from comchoice.instrument.stage import stage
 
 
+@stage
 def tideman(
     df: pd.DataFrame,
     alternative: str = "alternative",
@@ -14,9 +16,15 @@ def tideman(
     show_rank: bool = True,
     voter: str = "voter",
     voters: str = "voters",
-    transform_kws: dict = transform_kws
+    transform_kws: dict = transform_kws,
+    pw_matrix: bool = False,
+    alternatives: list = None
 ):
-    """Tideman.
+    """Tideman's approximation of Dodgson scores (2006).
+
+    The score of an alternative is the sum of the margins by which the other alternatives
+    beat it in pairwise comparisons, and the alternative with the lowest score wins.
+    This is not Tideman's Ranked Pairs procedure, see `comchoice.aggregate.ranked_pairs`.
 
     Parameters
     ----------
@@ -36,14 +44,24 @@ def tideman(
         Whether the number of voters is defined in the data, it represents its column label, by default "voters".
     transform_kws : dict, optional
         Whether or not to process data.
+    pw_matrix : bool, optional
+        A Pairwise Matrix (pd.DataFrame, np.ndarray or scipy.sparse matrix) is set in df, by default False.
+    alternatives : list, optional
+        Labels of the alternatives whether the Pairwise Matrix is a np.ndarray or scipy.sparse matrix, by default their positions.
 
     Returns
     -------
     pd.DataFrame
         Aggregation of preferences using Tideman.
+
+    References
+    ----------
+    Tideman, T.N. (2006). Collective Decisions and Voting: The Potential for Public Choice. Aldershot: Ashgate.
     """
-    m = pairwise_matrix(
+    m = __get_pairwise_matrix(
         df,
+        pw_matrix=pw_matrix,
+        alternatives=alternatives,
         alternative=alternative,
         ballot=ballot,
         delimiter=delimiter,
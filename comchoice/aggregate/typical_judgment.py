@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.judgment import judgment
+from comchoice.instrument.stage import stage
 
 
+@stage
 def typical_judgment(
     df: pd.DataFrame,
     alternative: str = "alternative",
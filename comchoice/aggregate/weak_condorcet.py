@@ -2,8 +2,10 @@ import pandas as pd
 
 from comchoice.aggregate.__default_parameters import transform_kws
 from comchoice.aggregate.condorcet import condorcet
+from comchoice.instrument.stage import stage
 
 
+@stage
 def weak_condorcet(
     df: pd.DataFrame,
     alternative: str = "alternative",
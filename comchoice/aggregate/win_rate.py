@@ -1,11 +1,11 @@
+import numpy as np
 import pandas as pd
 
 from comchoice.aggregate.__set_rank import __set_rank
-from comchoice.aggregate.__set_card_id import __set_card_id
-
-# TODO use the algorithm implemented in Borda
+from comchoice.instrument.stage import stage
 
 
+@stage
 def win_rate(
     df: pd.DataFrame,
     alternative="alternative",
@@ -17,32 +17,25 @@ def win_rate(
     **kws
 ):
 
-    df = __set_card_id(
-        df.copy(),
-        alternative_a=alternative_a,
-        alternative_b=alternative_b,
-        selected=selected,
-        concat="_"
-    )
-    dd = df.groupby(["option_source", "option_target"])\
-        .agg({voter: "count"}).reset_index()
-
-    m = dd.pivot(
-        index="option_source",
-        columns="option_target",
-        values=voter
-    ).fillna(0)
-
-    ids = set(df["option_source"]) | set(df["option_target"])
-    m = m.reindex(ids)
-    m = m.reindex(ids, axis=1)
-    m = m.fillna(0)
-
-    r = m + m.T
-    values = m.sum() / r.sum()
-
-    output = pd.DataFrame(values).reset_index().rename(
-        columns={"option_target": alternative, 0: "value"})
+    a = df[alternative_a].values
+    b = df[alternative_b].values
+    s = df[selected].values
+    n = len(a)
+
+    # The selected alternative is the target of a comparison, and in ties
+    # (selected equals 0), the alternative b.
+    target = np.where(a == s, a, b)
+    source = np.where((b == s) | (s == 0), a, b)
+
+    codes, alternatives = pd.factorize(np.concatenate([source, target]))
+    k = len(alternatives)
+    wins = np.bincount(codes[n:], minlength=k)
+    total = wins + np.bincount(codes[:n], minlength=k)
+
+    output = pd.DataFrame({
+        alternative: alternatives,
+        "value": wins / total
+    })
 
     if show_rank:
         output = __set_rank(output)
@@ -1,4 +1,5 @@
+from .aggregate_spatially_grids import aggregate_spatially_grids
+from .bootstrap import bootstrap
 from .create_random_spread import create_random_spread
+from .plot_spatial import plot_spatial
 from .plot_states import plot_states
-from .aggregate_spatially_grids import aggregate_spatially_grids
-from .aggregate_spatially_grids import aggregate_spatially_grids
\ No newline at end of file
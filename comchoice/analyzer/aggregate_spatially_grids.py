@@ -1,38 +1,102 @@
-import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
+from collections.abc import Mapping
+
+
+def __block_shape(rows, cols, new_size=10, block_size=None):
+    if block_size is None:
+        n_rows, n_cols = np.broadcast_to(new_size, 2)
+        block_rows, block_cols = rows // n_rows, cols // n_cols
+    else:
+        block_rows, block_cols = np.broadcast_to(block_size, 2)
+        n_rows, n_cols = rows // block_rows, cols // block_cols
+
+    if min(block_rows, block_cols, n_rows, n_cols) < 1:
+        raise ValueError(
+            "The aggregated grid must be smaller than the state and larger than 0.")
+
+    return n_rows, n_cols, block_rows, block_cols
+
+
+def __coarse_grain(states, n_rows, n_cols, block_rows, block_cols):
+    # Mean of the non-overlapping blocks of a stack of states.
+    return states[:, :n_rows * block_rows, :n_cols * block_cols]\
+        .reshape(-1, n_rows, block_rows, n_cols, block_cols)\
+        .mean(axis=(2, 4), dtype=np.float64)
+
 
 def aggregate_spatially_grids(
     mystate,
-    new_size = 10,
-    methods="win_rate"
+    new_size=10,
+    block_size=None,
+    threshold=0.5,
+    plot=False
 ):
     """
     Aggregate grids
+
+    Coarse-grains a state (or a stack of states over time) by averaging
+    non-overlapping blocks of cells. Cells that do not fill a complete block
+    on the bottom/right edges are dropped.
+
+    Parameters
+    ----------
+    mystate : np.ndarray or dict
+        A 2D state, a 3D array of states with shape (time, rows, columns),
+        or a dict of 2D states such as the output of `create_random_spread`.
+    new_size : int or tuple, optional
+        Number of rows and columns of the aggregated grid, by default 10.
+    block_size : int or tuple, optional
+        Number of rows and columns of each block. When it is defined,
+        `new_size` is ignored, by default None.
+    threshold : float or None, optional
+        Whether it is a float, blocks with a mean value greater than the threshold
+        are set to 1, otherwise 0. Whether it is None, it returns the mean value
+        of each block, by default 0.5.
+    plot : bool, optional
+        Whether or not to plot the aggregated grids, by default False.
+
+    Returns
+    -------
+    np.ndarray
+        Aggregated grid, with one grid per time step when a stack of states is given.
     """
+    if isinstance(mystate, Mapping):
+        # States are coarse-grained one at a time, so lazy mappings such as
+        # `RandomSpread` are never stored as a full stack of states.
+        frames = mystate.frames() if hasattr(mystate, "frames") else mystate.values()
+        is_stack = True
+        newstate, shape = [], None
+        for state in frames:
+            state = np.asarray(state)[np.newaxis]
+            if shape is None:
+                shape = __block_shape(*state.shape[1:], new_size=new_size, block_size=block_size)
+            newstate.append(__coarse_grain(state, *shape)[0])
+
+        newstate = np.stack(newstate)
+
+    else:
+        mystate = np.asarray(mystate)
+        is_stack = mystate.ndim == 3
+        states = mystate if is_stack else mystate[np.newaxis]
+        shape = __block_shape(*states.shape[1:], new_size=new_size, block_size=block_size)
+        newstate = __coarse_grain(states, *shape)
+
+    if threshold is not None:
+        newstate = (newstate > threshold).astype(np.float64)
+
+    if not is_stack:
+        newstate = newstate[0]
+
+    if plot:
+        from comchoice.analyzer.plot_states import plot_states
+
+        if is_stack:
+            plot_states(dict(enumerate(newstate)))
+        else:
+            import seaborn as sns
 
-    size_space = len(mystate)
-
-    number_polls = int((size_space)/new_size)
-    newstate =  np.zeros((new_size,new_size))
-
-    print(size_space, new_size, number_polls, np.shape(newstate))
-    from_ = 0
-    to_ = 0
-    for r,row in enumerate(newstate):
-        for c,col in enumerate(row): 
-            newValue = np.sum(np.sum(mystate[from_:from_+number_polls,to_:to_+number_polls]))/(number_polls*number_polls)
-            if newValue > 0.5:
-                newstate[r][c] = 1
-            else:
-                newstate[r][c] = 0
-            to_ = to_ + number_polls
-        from_ = from_ + number_polls
-        to_ = 0
-    
-    sns.heatmap(newstate, vmin=0, vmax=1, 
-            cbar= False, cmap='Blues', linewidth=.5,
-            xticklabels=False, yticklabels=False)
-    return newstate 
+            sns.heatmap(newstate, vmin=0, vmax=1,
+                        cbar=False, cmap="Blues", linewidth=.5,
+                        xticklabels=False, yticklabels=False)
 
+    return newstate
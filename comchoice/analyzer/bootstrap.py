@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.to_profile import to_profile
+
+
+def __positional_features(scores):
+    def features(ranks):
+        m = ranks.shape[1]
+        return np.where(ranks > 0, scores(ranks, m), 0).astype(float)
+
+    return features
+
+
+def __pairwise_features(ranks):
+    # Per-ballot indicators of the pairwise matrix (row a, column b: a is ranked over b)
+    ranked = ranks > 0
+    output = (ranks[:, :, np.newaxis] < ranks[:, np.newaxis, :]) & \
+        ranked[:, :, np.newaxis] & ranked[:, np.newaxis, :]
+    return output.reshape(ranks.shape[0], -1).astype(float)
+
+
+def __identity(values, m):
+    return values
+
+
+def __copeland(values, m):
+    P = values.reshape(-1, m, m)
+    total = P + P.transpose(0, 2, 1)
+    share = np.divide(P, total, out=np.full(P.shape, np.nan), where=total > 0)
+    points = np.where(share > 0.5, 1, np.where(share == 0.5, 0.5, 0))
+    compared = ~np.isnan(share) & ~np.eye(m, dtype=bool)
+
+    return np.divide(
+        (points * compared).sum(axis=2),
+        compared.sum(axis=2),
+        out=np.full(P.shape[:2], np.nan),
+        where=compared.any(axis=2)
+    )
+
+
+def __schulze(values, m):
+    P = values.reshape(-1, m, m)
+    d = np.where(P > P.transpose(0, 2, 1), P, 0)
+    for k in range(m):
+        d = np.maximum(d, np.minimum(d[:, :, k, np.newaxis], d[:, np.newaxis, k, :]))
+
+    return (d > d.transpose(0, 2, 1)).sum(axis=2).astype(float)
+
+
+# Rules: per-ballot features, which are added up weighted by the number of
+# voters, and the function that computes scores from the added features.
+bootstrap_rules = dict(
+    borda=(__positional_features(lambda r, m: m - r), __identity),
+    copeland=(__pairwise_features, __copeland),
+    dowdall=(__positional_features(lambda r, m: 1 / np.maximum(r, 1)), __identity),
+    plurality=(__positional_features(lambda r, m: r == 1), __identity),
+    schulze=(__pairwise_features, __schulze)
+)
+
+
+def __rank(scores):
+    # Ranks alternatives by descending score, tied alternatives share the lowest rank.
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    return 1 + (scores[:, np.newaxis, :] > scores[:, :, np.newaxis]).sum(axis=2)
+
+
+def bootstrap(
+    data,
+    rule: str = "borda",
+    n_resamples: int = 1000,
+    method: str = "multinomial",
+    random_state: int = None,
+    alternative: str = "alternative",
+    ballot: str = "ballot",
+    delimiter: str = ">",
+    delimiter_ties: str = "=",
+    voters: str = "voters",
+    confidence: float = 0.95,
+    batch_size: int = None,
+    get_distribution: bool = False
+):
+    """Bootstrap analysis of the stability of a ranking.
+
+    Voters are resampled by drawing the number of voters of each unique ballot, and the
+    rule is recomputed for every resample. Rules are computed from per-ballot features
+    (positional scores or pairwise indicators), so the features of all the resamples are
+    obtained at once as the product of the resampled weights and the per-ballot features.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Profile
+        A data set of ballots, or a `comchoice.preprocessing.Profile`.
+    rule : {"borda", "copeland", "dowdall", "plurality", "schulze"}, optional
+        Rule used to rank the alternatives, by default "borda".
+    n_resamples : int, optional
+        Number of resamples, by default 1000.
+    method : {"multinomial", "poisson"}, optional
+        Resampling method, by default "multinomial". Whether "multinomial", the total number of
+        voters is kept in every resample. Whether "poisson", the number of voters of each
+        unique ballot is drawn from a Poisson distribution.
+    random_state : int, np.random.Generator, None, optional
+        Random state, by default None.
+    alternative : str, optional
+        Column label of the alternatives in the output, by default "alternative".
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    confidence : float, optional
+        Coverage of the interval of ranks, by default 0.95.
+    batch_size : int, optional
+        Number of resamples computed at once, by default it is chosen from the number of unique ballots.
+    get_distribution : bool, optional
+        Whether or not to return the distribution of ranks of each alternative, by default False.
+
+    Returns
+    -------
+    pd.DataFrame or (pd.DataFrame, pd.DataFrame)
+        A DataFrame with the value and rank of each alternative in the data, its mean rank,
+        the interval of ranks (lower, upper) and the probability of winning (tied winners
+        share the probability). Whether `get_distribution` is True, a second DataFrame
+        includes the probability of each alternative (rows) to be ranked in each position (columns).
+    """
+    if rule not in bootstrap_rules:
+        raise ValueError(
+            f"Value provided to rule parameter not valid. Values accepted are {', '.join(bootstrap_rules)}")
+
+    if method not in ["multinomial", "poisson"]:
+        raise ValueError(
+            "Value provided to method parameter not valid. Values accepted are 'multinomial', 'poisson'")
+
+    if not isinstance(data, Profile):
+        data = to_profile(
+            data,
+            ballot=ballot,
+            delimiter=delimiter,
+            delimiter_ties=delimiter_ties,
+            voters=voters
+        )
+
+    profile = data.compress()
+    ranks = profile.ranks.astype(np.int64)
+    weights = profile.weights
+    n_ballots, m = ranks.shape
+    features, scores = bootstrap_rules[rule]
+
+    K = m * m if features is __pairwise_features else m
+    chunksize = max(2 ** 22 // K, 1)
+    chunks = [slice(start, min(start + chunksize, n_ballots))
+              for start in range(0, n_ballots, chunksize)]
+    cache = [features(ranks[s]) for s in chunks] if n_ballots * K <= 2 ** 24 else None
+
+    def aggregate(w):
+        output = np.zeros((w.shape[0], K))
+        for i, s in enumerate(chunks):
+            f = cache[i] if cache is not None else features(ranks[s])
+            output += w[:, s] @ f
+        return scores(output, m)
+
+    value = aggregate(weights[np.newaxis, :].astype(float))[0]
+
+    rng = np.random.default_rng(random_state)
+    n_voters = int(round(weights.sum()))
+    p = weights / weights.sum()
+    if batch_size is None:
+        batch_size = max(2 ** 22 // max(n_ballots, K), 1)
+
+    distribution = np.zeros((m, m))
+    wins = np.zeros(m)
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        if method == "multinomial":
+            w = rng.multinomial(n_voters, p, size=size)
+        else:
+            w = rng.poisson(weights, size=(size, n_ballots))
+
+        r = __rank(aggregate(w.astype(float)))
+        distribution += np.bincount(
+            (np.arange(m) * m + r - 1).ravel(), minlength=m * m).reshape(m, m)
+        first = r == 1
+        wins += (first / first.sum(axis=1, keepdims=True)).sum(axis=0)
+
+    distribution /= n_resamples
+    cdf = distribution.cumsum(axis=1)
+    alpha = (1 - confidence) / 2
+
+    tmp = pd.DataFrame({
+        alternative: profile.alternatives,
+        "value": value,
+        "rank": __rank(value[np.newaxis, :])[0],
+        "mean_rank": distribution @ np.arange(1, m + 1),
+        "lower": (cdf < alpha - 1e-12).sum(axis=1) + 1,
+        "upper": np.minimum((cdf < 1 - alpha - 1e-12).sum(axis=1) + 1, m),
+        "winner_probability": wins / n_resamples
+    }).sort_values(["rank", "mean_rank"]).reset_index(drop=True)
+
+    if get_distribution:
+        df_distribution = pd.DataFrame(
+            distribution,
+            index=pd.Index(profile.alternatives, name=alternative),
+            columns=pd.Index(np.arange(1, m + 1), name="rank")
+        ).reindex(tmp[alternative])
+
+        return tmp, df_distribution
+
+    return tmp
@@ -1,32 +1,100 @@
-import pandas as pd
 import numpy as np
+from collections.abc import Mapping
+
+
+class RandomSpread(Mapping):
+    """Random spread over a grid.
+
+    The spread is stored as a single random order of the cells and the
+    number of cells colored at each time step. States are built lazily,
+    so the object behaves like a read-only dict of 2D matrices
+    `{time: state}` without keeping every state in memory.
+
+    Parameters
+    ----------
+    order : np.ndarray
+        Flat indices of the cells, in the order they are colored.
+    offsets : np.ndarray
+        Number of cells colored up to each time step.
+    number_grids : int
+        Number of rows (and columns) of the grid.
+    """
+
+    def __init__(self, order, offsets, number_grids):
+        self.order = order
+        self.offsets = offsets
+        self.number_grids = number_grids
+
+    def __getitem__(self, time):
+        if not 0 <= time < len(self.offsets):
+            raise KeyError(time)
+        population = np.zeros(self.number_grids * self.number_grids)
+        population[self.order[:self.offsets[time]]] = 1
+        return population.reshape(self.number_grids, self.number_grids)
+
+    def __iter__(self):
+        return iter(range(len(self.offsets)))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def frames(self):
+        """Yields the state of each time step.
+
+        The same matrix is updated in place between steps, so only one
+        state is kept in memory. Copy a frame before storing it.
+
+        Yields
+        ------
+        np.ndarray
+            State of the grid at each time step.
+        """
+        population = np.zeros((self.number_grids, self.number_grids))
+        flat = population.reshape(-1)
+        start = 0
+        for end in self.offsets:
+            flat[self.order[start:end]] = 1
+            start = end
+            yield population
+
 
 def create_random_spread(
-    speed = 0.1,
-    number_grids = 100
+    speed=0.1,
+    number_grids=100,
+    random_state=None
 ):
     """
     Create random spread
 
+    Draws a random order of the cells once, and colors `speed` of the grid
+    on each time step following that order.
+
+    Parameters
+    ----------
+    speed : float, optional
+        Share of the grid colored on each time step, by default 0.1.
+    number_grids : int, optional
+        Number of rows (and columns) of the grid, by default 100.
+    random_state : int, np.random.Generator, None, optional
+        Seed or generator used to draw the order of the cells, by default None.
+
     Returns
     -------
-    state: 
-        A dictionary of matrices 2D
+    state: RandomSpread
+        A dictionary of matrices 2D, built lazily for each time step.
     """
-
-    state_per_time = {}
-    population = np.zeros((number_grids,number_grids))
     total_grids = number_grids * number_grids
     color_per_time = int(total_grids * speed)
-    each = 0
-    
-    while np.sum(np.sum(population)) < total_grids:
-        for _ in range(color_per_time):
-            i, j = np.random.randint(number_grids, size=2)
-            while population[i][j] != 0:
-                i, j = np.random.randint(number_grids, size=2)
-            population[i][j] = 1
-
-        state_per_time[each] = np.copy(population)
-        each = each + 1
-    return state_per_time
+
+    if color_per_time < 1:
+        raise ValueError(
+            "speed must color at least one grid on each time step.")
+
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(total_grids)
+    offsets = np.minimum(
+        np.arange(1, -(-total_grids // color_per_time) + 1) * color_per_time,
+        total_grids
+    )
+
+    return RandomSpread(order, offsets, number_grids)
@@ -0,0 +1,59 @@
+import pandas as pd
+
+
+def plot_spatial(
+    winners,
+    column_group="grid_list",
+    delimiter=",",
+    title=None
+):
+    """
+    Plot heatmap of the winners computed by `comchoice.aggregate.spatial`
+
+    Parameters
+    ----------
+    winners : pd.DataFrame
+        Winners groupedby column_group, as returned by `spatial`.
+    column_group : str
+        Column which has the spatial xy information, by default grid_list.
+    delimiter : str
+        Split the column_group using an element, by default ","
+    title : str, optional
+        Title of the plot, by default None.
+
+    Returns
+    -------
+    plot
+        Heatmap showing the winners distributed over the space
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    winners = winners.copy()
+    fig, ax = plt.subplots(figsize=(8, 6))
+    if column_group == "grid_split":
+        xy = winners[column_group].apply(str).str.split(delimiter, expand=True)
+        winners["x"] = xy[0]
+        winners["y"] = xy[1]
+    else:
+        winners["x"] = winners[column_group].apply(lambda x: x[0])
+        winners["y"] = winners[column_group].apply(lambda x: x[1])
+    winners = winners.sort_values(by="winner", ascending=False)
+    winners["cat"] = pd.Categorical(winners["winner"]).codes
+
+    value_to_int = {j: i for i, j in enumerate(
+        pd.unique(winners["winner"].ravel()))}
+    n = len(value_to_int)
+    cmap = sns.color_palette("hsv", n)
+    sns.heatmap(winners.pivot_table(index="y", columns="x", values="cat",
+                                    aggfunc="first"), cmap=cmap, ax=ax)
+    colorbar = ax.collections[0].colorbar
+    r = colorbar.vmax - colorbar.vmin
+    colorbar.set_ticks([colorbar.vmin + r / n * (0.5 + i) for i in range(n)])
+    colorbar.set_ticklabels(list(value_to_int.keys()))
+    ax.invert_yaxis()
+    ax.set_title(title)
+    fig.data = winners
+    plt.ioff()
+
+    return fig
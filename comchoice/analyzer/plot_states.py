@@ -1,7 +1,5 @@
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 def plot_states(
     states,
@@ -10,14 +8,13 @@ def plot_states(
     """
     Plot heatmap states
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
-    ncols = int(len(states)/nrows)
-    fig, ax  = plt.subplots(ncols=ncols, nrows=nrows, figsize=(4*ncols,4*nrows))
-    nrow = 0
-    for x in states:
-        if (x>0) and (x%ncols == 0):
-            nrow = nrow+1
-        c, r = x%ncols, nrow
+    ncols = int(np.ceil(len(states)/nrows))
+    fig, ax  = plt.subplots(ncols=ncols, nrows=nrows, figsize=(4*ncols,4*nrows), squeeze=False)
+    for i, x in enumerate(states):
+        r, c = divmod(i, ncols)
         sns.heatmap(states[x], vmin=0, vmax=1, 
             ax= ax[r][c], cbar= False, cmap='Blues', linewidth=.5,
             xticklabels=False, yticklabels=False)
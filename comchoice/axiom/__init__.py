@@ -1,5 +1,8 @@
+from .audit import audit
 from .cancellation import cancellation
 from .completeness import completeness
+from .condorcet_efficiency import condorcet_efficiency
 from .faithfulness import faithfulness
 from .incompleteness import incompleteness
 from .neutrality import neutrality
+from .pareto import pareto
@@ -0,0 +1,297 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.to_profile import to_profile
+
+audit_axioms = [
+    "cancellation",
+    "completeness",
+    "faithfulness",
+    "incompleteness",
+    "neutrality",
+    "pareto"
+]
+
+
+def __audit_pairwise(
+    df,
+    election=None,
+    alternative_a="alternative_a",
+    alternative_b="alternative_b",
+    selected="selected",
+    voter="voter"
+):
+    n = df.shape[0]
+    if election is None:
+        e, elections = np.zeros(n, dtype=np.int64), np.array([0])
+    else:
+        e, elections = pd.factorize(df[election])
+    n_elections = len(elections)
+
+    # Voters are identified within each election.
+    voter_codes, voter_labels = pd.factorize(df[voter])
+    v, voter_index = pd.factorize(e * len(voter_labels) + voter_codes)
+    n_voters = len(voter_index)
+    ve = (voter_index // max(len(voter_labels), 1)).astype(np.int64)
+
+    codes, alternatives = pd.factorize(
+        np.concatenate([df[alternative_a].values, df[alternative_b].values]))
+    a, b = codes[:n].astype(np.int64), codes[n:].astype(np.int64)
+    M = max(len(alternatives), 1)
+
+    is_a = df[selected].eq(df[alternative_a]).values
+    is_b = df[selected].eq(df[alternative_b]).values & ~is_a
+    valid = (a >= 0) & (b >= 0)
+
+    # Number of alternatives compared in each election
+    keys = np.unique(np.r_[e[valid] * M + a[valid], e[valid] * M + b[valid]])
+    n_alternatives = np.bincount(keys // M, minlength=n_elections)
+
+    # Completeness: every voter compares every pair of alternatives.
+    lo, hi = np.minimum(a, b), np.maximum(a, b)
+    keys = np.unique(v[valid] * (M * M) + lo[valid] * M + hi[valid])
+    n_pairs = np.bincount(keys // (M * M), minlength=n_voters)
+    min_pairs = np.full(n_elections, np.inf)
+    np.minimum.at(min_pairs, ve, n_pairs)
+    completeness = min_pairs == n_alternatives * (n_alternatives - 1) / 2
+
+    # Neutrality: no voter compares the same alternatives twice.
+    keys, counts = np.unique(
+        v[valid] * (M * M) + a[valid] * M + b[valid], return_counts=True)
+    duplicated = ve[keys[counts > 1] // (M * M)]
+    neutrality = np.bincount(duplicated, minlength=n_elections) == 0
+
+    # Faithfulness: every comparison selects one of the alternatives.
+    faithfulness = np.bincount(e[~(is_a | is_b)], minlength=n_elections) == 0
+
+    won = valid & (is_a | is_b)
+    winners = np.where(is_a, a, b)[won]
+    losers = np.where(is_a, b, a)[won]
+
+    # Cancellation: several alternatives share the highest share of
+    # comparisons won by a voter.
+    keys, counts = np.unique(v[won] * M + winners, return_counts=True)
+    kv, kw = keys // M, keys % M
+    share = counts / np.bincount(v, minlength=n_voters)[kv]
+    ke = ve[kv]
+    max_share = np.full(n_elections, -1.0)
+    np.maximum.at(max_share, ke, share)
+    top = share == max_share[ke]
+    keys = np.unique(ke[top] * M + kw[top])
+    cancellation = np.bincount(keys // M, minlength=n_elections) > 1
+
+    # Condorcet winner: an alternative that beats every other alternative
+    # in a majority of their comparisons.
+    keys, counts = np.unique(
+        e[won] * (M * M) + winners * M + losers, return_counts=True)
+    ue, uw, ul = keys // (M * M), keys // M % M, keys % M
+    reverse = ue * (M * M) + ul * M + uw
+    index = np.searchsorted(keys, reverse)
+    found = index < len(keys)
+    found[found] = keys[index[found]] == reverse[found]
+    counts_reverse = np.zeros_like(counts)
+    counts_reverse[found] = counts[index[found]]
+    beats = counts > counts_reverse
+    keys, n_beaten = np.unique(ue[beats] * M + uw[beats], return_counts=True)
+    is_winner = n_beaten == n_alternatives[keys // M] - 1
+    condorcet = np.bincount(keys[is_winner] // M, minlength=n_elections) > 0
+
+    return elections, dict(
+        cancellation=cancellation,
+        completeness=completeness,
+        condorcet=condorcet,
+        faithfulness=faithfulness,
+        neutrality=neutrality
+    )
+
+
+def __audit_profiles(profiles):
+    n_elections = len(profiles)
+    m = np.array([p.n_alternatives for p in profiles], dtype=np.int64)
+    n = np.array([p.n_ballots for p in profiles], dtype=np.int64)
+    M = max(m.max(initial=0), 1)
+
+    ranks = np.zeros((n.sum(), M), dtype=np.int64)
+    offsets = np.r_[0, np.cumsum(n)]
+    for i, p in enumerate(profiles):
+        ranks[offsets[i]:offsets[i + 1], :m[i]] = p.ranks
+    weights = np.concatenate([p.weights for p in profiles]) \
+        if n_elections > 0 else np.zeros(0)
+    e = np.repeat(np.arange(n_elections), n)
+
+    voted = weights > 0
+    ranked = ranks > 0
+
+    # Completeness: every voter ranks every alternative.
+    columns = np.arange(M) < m[e][:, np.newaxis]
+    incomplete = voted & ~(ranked | ~columns).all(axis=1)
+    completeness = np.bincount(e[incomplete], minlength=n_elections) == 0
+
+    # Neutrality: a ballot compares each pair of alternatives once.
+    neutrality = np.ones(n_elections, dtype=bool)
+
+    # Faithfulness: a ballot has no ties between ranked alternatives.
+    s = np.sort(ranks, axis=1)
+    tied = voted & ((s[:, 1:] == s[:, :-1]) & (s[:, 1:] > 0)).any(axis=1)
+    faithfulness = np.bincount(e[tied], minlength=n_elections) == 0
+
+    # Cancellation: the top-ranked alternatives win the highest share of the
+    # comparisons of a ballot.
+    k = ranked.sum(axis=1)
+    first = ranks == 1
+    wins = k - first.sum(axis=1)
+    share = np.where(k > 1, wins / np.maximum(k * (k - 1) / 2, 1), 0)
+    candidate = voted & (wins > 0)
+    max_share = np.full(n_elections, -1.0)
+    np.maximum.at(max_share, e[candidate], share[candidate])
+    top = candidate & (share == max_share[e])
+    rows, cols = np.nonzero(first[top])
+    keys = np.unique(e[top][rows] * M + cols)
+    cancellation = np.bincount(keys // M, minlength=n_elections) > 1
+
+    # Condorcet winner
+    condorcet = np.zeros(n_elections, dtype=bool)
+    for i, p in enumerate(profiles):
+        pw = p.pairwise_matrix()
+        condorcet[i] = ((pw > pw.T).sum(axis=1) == m[i] - 1).any()
+
+    return dict(
+        cancellation=cancellation,
+        completeness=completeness,
+        condorcet=condorcet,
+        faithfulness=faithfulness,
+        neutrality=neutrality
+    )
+
+
+def audit(
+    data,
+    dtype: str = "pairwise",
+    election: str = None,
+    axioms: list = None,
+    alternative_a: str = "alternative_a",
+    alternative_b: str = "alternative_b",
+    ballot: str = "ballot",
+    delimiter: str = ">",
+    delimiter_ties: str = "=",
+    selected: str = "selected",
+    voter: str = "voter",
+    voters: str = "voters"
+) -> pd.DataFrame:
+    """Checks the axioms of one or many elections at once.
+
+    All the elections are int-coded and checked together with array operations.
+
+    - cancellation: several alternatives share the highest share of comparisons won by a voter
+      (ties are not counted as winners).
+    - completeness: every voter compares (or ranks) every alternative of the election.
+    - faithfulness: every comparison selects one of its alternatives, and ballots have no ties.
+    - incompleteness: the election is not complete.
+    - neutrality: no voter compares the same pair of alternatives twice. A ballot compares each
+      pair of alternatives once, so it is always True for ballots and profiles, and it only
+      carries information for pairwise comparisons.
+    - pareto: there is no Condorcet winner, and the election satisfies cancellation.
+
+    Parameters
+    ----------
+    data : pd.DataFrame, Profile, list or dict
+        Elections to check. A DataFrame of pairwise comparisons or ballots (with the `election` column
+        to include many elections), a `comchoice.preprocessing.Profile`, or a list or dict of them.
+        The keys of a dict (or positions of a list) are used as election labels.
+    dtype : {"pairwise", "ballot", "profile"}, optional
+        Format of the data, by default "pairwise".
+    election : str, optional
+        Column label of the election identifier, by default None (a single election).
+    axioms : list, optional
+        Axioms to check, by default all of them.
+    alternative_a : str, optional
+        Column label of the first alternative of a comparison, by default "alternative_a".
+    alternative_b : str, optional
+        Column label of the second alternative of a comparison, by default "alternative_b".
+    ballot : str, optional
+        Column label of the ballots, by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    selected : str, optional
+        Column label of the alternative selected in a comparison, by default "selected".
+    voter : str, optional
+        Column label of the voter unique identifier, by default "voter".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with one row per election and axiom, and columns election, axiom and value.
+        It is empty whether no elections are given.
+    """
+    if axioms is None:
+        axioms = audit_axioms
+
+    if any(x not in audit_axioms for x in axioms):
+        raise ValueError(
+            f"Value provided to axioms parameter not valid. Values accepted are {', '.join(audit_axioms)}")
+
+    if dtype not in ["pairwise", "ballot", "profile"]:
+        raise ValueError(
+            "Value provided to dtype parameter not valid. Values accepted are 'pairwise', 'ballot', 'profile'")
+
+    labels = None
+    if isinstance(data, (Profile, pd.DataFrame)):
+        data = [data]
+    else:
+        labels = list(data.keys()) if isinstance(data, dict) else list(range(len(data)))
+        data = list(data.values()) if isinstance(data, dict) else list(data)
+
+    if len(data) == 0:
+        return pd.DataFrame({
+            "election": np.zeros(0, dtype=object),
+            "axiom": np.zeros(0, dtype=object),
+            "value": np.zeros(0, dtype=bool)
+        })
+
+    if dtype == "pairwise":
+        if labels is not None:
+            df = pd.concat(data, keys=labels, names=["_election"])\
+                .reset_index(level=0)
+            election = "_election"
+        else:
+            df = data[0]
+        elections, output = __audit_pairwise(
+            df,
+            election=election,
+            alternative_a=alternative_a,
+            alternative_b=alternative_b,
+            selected=selected,
+            voter=voter
+        )
+
+    else:
+        if dtype == "ballot":
+            if labels is None and election is not None:
+                groups = list(data[0].groupby(election, sort=False))
+                labels = [x for x, _ in groups]
+                data = [x for _, x in groups]
+            data = [to_profile(
+                df,
+                ballot=ballot,
+                delimiter=delimiter,
+                delimiter_ties=delimiter_ties,
+                voters=voters
+            ) for df in data]
+
+        elections = np.asarray(labels if labels is not None else [0], dtype=object)
+        output = __audit_profiles(data)
+
+    output["incompleteness"] = ~output["completeness"]
+    output["pareto"] = ~output["condorcet"] & output["cancellation"]
+
+    return pd.DataFrame({
+        "election": np.repeat(np.asarray(elections, dtype=object), len(axioms)),
+        "axiom": np.tile(np.asarray(axioms, dtype=object), len(elections)),
+        "value": np.column_stack([output[x] for x in axioms]).ravel()
+        if len(elections) > 0 else np.zeros(0, dtype=bool)
+    })
@@ -1,2 +1,295 @@
-def condorcet_efficiency():
-    return
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+
+from comchoice.datasets.set_synthetic_election import __sample_orders, cultures
+
+# Cultures whose voters are sampled independently, so the voters of many
+# elections can be sampled at once.
+independent_cultures = ["impartial", "mallows", "plackett_luce"]
+
+
+def __argmax_set(scores):
+    return scores == scores.max(axis=1, keepdims=True)
+
+
+def __eliminate(scores, remaining, all_below_mean=False):
+    # Removes the alternatives with the lowest score among the remaining ones
+    # (or all the alternatives below the mean), unless it removes all of them.
+    scores = np.where(remaining, scores, np.inf)
+    if all_below_mean:
+        mean = np.where(remaining, scores, 0).sum(axis=1, keepdims=True) / \
+            remaining.sum(axis=1, keepdims=True)
+        removed = remaining & (scores < mean)
+    else:
+        removed = remaining & (scores == scores.min(axis=1, keepdims=True))
+
+    removed[(removed == remaining).all(axis=1)] = False
+    return remaining & ~removed
+
+
+def __positional(C, weights):
+    return __argmax_set(C @ weights)
+
+
+def __plurality(positions, C, P):
+    m = C.shape[1]
+    return __positional(C, (np.arange(m) == 0).astype(float))
+
+
+def __antiplurality(positions, C, P):
+    m = C.shape[1]
+    return __positional(C, -(np.arange(m) == m - 1).astype(float))
+
+
+def __borda(positions, C, P):
+    m = C.shape[1]
+    return __positional(C, m - 1 - np.arange(m, dtype=float))
+
+
+def __dowdall(positions, C, P):
+    m = C.shape[1]
+    return __positional(C, 1 / np.arange(1, m + 1))
+
+
+def __copeland(positions, C, P):
+    m = P.shape[1]
+    off_diagonal = ~np.eye(m, dtype=bool)
+    scores = (P > P.transpose(0, 2, 1)).sum(axis=2) + \
+        0.5 * ((P == P.transpose(0, 2, 1)) & off_diagonal).sum(axis=2)
+    return __argmax_set(scores)
+
+
+def __minimax(positions, C, P):
+    # Minimizes the largest number of voters that prefer another alternative.
+    return __argmax_set(-P.max(axis=1))
+
+
+def __black(positions, C, P):
+    condorcet = __condorcet_winner(P)
+    output = __borda(positions, C, P)
+    has_winner = condorcet >= 0
+    output[has_winner] = np.arange(P.shape[1]) == condorcet[has_winner, np.newaxis]
+    return output
+
+
+def __schulze(positions, C, P):
+    m = P.shape[1]
+    d = np.where(P > P.transpose(0, 2, 1), P, 0).astype(float)
+    for k in range(m):
+        d = np.maximum(d, np.minimum(d[:, :, k, np.newaxis], d[:, np.newaxis, k, :]))
+    off_diagonal = ~np.eye(m, dtype=bool)
+    return ((d >= d.transpose(0, 2, 1)) | ~off_diagonal).all(axis=2)
+
+
+def __irv(positions, C, P):
+    n_elections, n_voters, m = positions.shape
+    remaining = np.ones((n_elections, m), dtype=bool)
+    for _ in range(m - 1):
+        top = np.where(remaining[:, np.newaxis, :], positions, m).argmin(axis=2)
+        votes = np.bincount(
+            (np.arange(n_elections)[:, np.newaxis] * m + top).ravel(),
+            minlength=n_elections * m
+        ).reshape(n_elections, m)
+        done = (votes * 2 > n_voters).any(axis=1)
+        remaining[done] = votes[done] * 2 > n_voters
+        remaining[~done] = __eliminate(votes[~done], remaining[~done])
+
+    return remaining
+
+
+def __baldwin(positions, C, P, all_below_mean=False):
+    m = P.shape[1]
+    remaining = np.ones(P.shape[:2], dtype=bool)
+    for _ in range(m - 1):
+        # Borda score of the ballots restricted to the remaining alternatives
+        scores = (P * remaining[:, np.newaxis, :]).sum(axis=2)
+        remaining = __eliminate(scores, remaining, all_below_mean=all_below_mean)
+
+    return remaining
+
+
+def __nanson(positions, C, P):
+    return __baldwin(positions, C, P, all_below_mean=True)
+
+
+efficiency_rules = dict(
+    antiplurality=__antiplurality,
+    baldwin=__baldwin,
+    black=__black,
+    borda=__borda,
+    copeland=__copeland,
+    dowdall=__dowdall,
+    irv=__irv,
+    minimax=__minimax,
+    nanson=__nanson,
+    plurality=__plurality,
+    schulze=__schulze
+)
+
+
+def __condorcet_winner(P):
+    m = P.shape[1]
+    beats = (P > P.transpose(0, 2, 1)).sum(axis=2) == m - 1
+    return np.where(beats.any(axis=1), beats.argmax(axis=1), -1)
+
+
+def __sample_positions(rng, culture, n_elections, n_voters, n_alternatives, culture_kws):
+    if culture in independent_cultures:
+        orders = __sample_orders(
+            rng, culture, n_elections * n_voters, n_alternatives, **culture_kws)
+    else:
+        orders = np.concatenate([
+            __sample_orders(rng, culture, n_voters, n_alternatives, **culture_kws)
+            for _ in range(n_elections)
+        ])
+
+    return np.argsort(orders, axis=1).reshape(n_elections, n_voters, n_alternatives)
+
+
+def __simulate(args):
+    seed, n_elections, n_voters, n_alternatives, culture, culture_kws, rule_names = args
+    rng = np.random.default_rng(seed)
+    m = n_alternatives
+
+    positions = __sample_positions(
+        rng, culture, n_elections, n_voters, m, culture_kws)
+
+    # Intermediates shared by the rules: positional counts (C) and pairwise counts (P).
+    index = np.arange(n_elections)[:, np.newaxis, np.newaxis] * m * m + \
+        np.arange(m)[np.newaxis, np.newaxis, :] * m + positions
+    C = np.bincount(index.ravel(), minlength=n_elections * m * m)\
+        .reshape(n_elections, m, m).astype(float)
+
+    P = np.empty((n_elections, m, m))
+    chunksize = max(2 ** 22 // max(n_voters * m * m, 1), 1)
+    for start in range(0, n_elections, chunksize):
+        p = positions[start:start + chunksize]
+        P[start:start + chunksize] = (
+            p[:, :, :, np.newaxis] < p[:, :, np.newaxis, :]).sum(axis=1)
+
+    condorcet = __condorcet_winner(P)
+    has_winner = condorcet >= 0
+    is_condorcet = np.arange(m) == condorcet[has_winner, np.newaxis]
+
+    output = {}
+    for rule in rule_names:
+        winners = efficiency_rules[rule](positions, C, P)[has_winner]
+        # Ties are broken at random, so a tied Condorcet winner counts partially.
+        output[rule] = ((winners & is_condorcet).sum(axis=1) / winners.sum(axis=1)).sum()
+
+    return has_winner.sum(), output
+
+
+def __wilson_interval(successes, n, z):
+    if n == 0:
+        return np.nan, np.nan
+
+    p = successes / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+
+    return max(center - half, 0), min(center + half, 1)
+
+
+def condorcet_efficiency(
+    rules: list = None,
+    n_elections: int = 10000,
+    n_voters: int = 101,
+    n_alternatives: int = 3,
+    culture: str = "impartial",
+    culture_kws: dict = dict(),
+    random_state: int = None,
+    n_jobs: int = 1,
+    batch_size: int = 1000,
+    confidence: float = 0.95
+) -> pd.DataFrame:
+    """Estimates the Condorcet efficiency of voting rules by Monte Carlo simulation.
+
+    The Condorcet efficiency of a rule is the share of elections with a Condorcet winner
+    in which the rule selects it. Elections are simulated in batches under a statistical
+    culture, and the winners of all the rules are computed from the positional and pairwise
+    counts of each batch. Tied winners are broken at random, so a rule that ties the
+    Condorcet winner with k - 1 alternatives counts 1 / k.
+
+    Every batch has its own random seed spawned from `random_state`, so the results
+    do not depend on `n_jobs`.
+
+    Parameters
+    ----------
+    rules : list, optional
+        Rules to evaluate, by default all of them: "antiplurality", "baldwin", "black", "borda",
+        "copeland", "dowdall", "irv", "minimax", "nanson", "plurality" and "schulze".
+    n_elections : int, optional
+        Number of simulated elections, by default 10000.
+    n_voters : int, optional
+        Number of voters of each election, by default 101.
+    n_alternatives : int, optional
+        Number of alternatives of each election, by default 3.
+    culture : {"impartial", "mallows", "plackett_luce", "urn", "spatial"}, optional
+        Statistical culture used to sample the rankings, by default "impartial".
+        See `comchoice.datasets.set_synthetic_election`.
+    culture_kws : dict, optional
+        Parameters of the culture, by default dict().
+    random_state : int, optional
+        Seed of the simulation, by default None.
+    n_jobs : int, optional
+        Number of worker processes, by default 1.
+    batch_size : int, optional
+        Number of elections simulated at once by a worker, by default 1000.
+    confidence : float, optional
+        Confidence level of the Wilson score intervals, by default 0.95.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with one row per rule, and the columns rule, value (efficiency),
+        lower and upper (confidence interval), n_condorcet (elections with a Condorcet winner)
+        and n_elections.
+    """
+    if rules is None:
+        rules = list(efficiency_rules)
+
+    if any(rule not in efficiency_rules for rule in rules):
+        raise ValueError(
+            f"Value provided to rules parameter not valid. Values accepted are {', '.join(efficiency_rules)}")
+
+    if culture not in cultures:
+        raise ValueError(
+            f"Value provided to culture parameter not valid. Values accepted are {', '.join(cultures)}")
+
+    sizes = [min(batch_size, n_elections - start)
+             for start in range(0, n_elections, batch_size)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    tasks = [
+        (seed, size, n_voters, n_alternatives, culture, culture_kws, rules)
+        for seed, size in zip(seeds, sizes)
+    ]
+
+    if n_jobs == 1:
+        results = list(map(__simulate, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(__simulate, tasks))
+
+    n = sum(x for x, _ in results)
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+
+    output = []
+    for rule in rules:
+        successes = sum(x[rule] for _, x in results)
+        lower, upper = __wilson_interval(successes, n, z)
+        output.append({
+            "rule": rule,
+            "value": successes / n if n > 0 else np.nan,
+            "lower": lower,
+            "upper": upper,
+            "n_condorcet": n,
+            "n_elections": n_elections
+        })
+
+    return pd.DataFrame(output)\
+        .sort_values("value", ascending=False, kind="stable")\
+        .reset_index(drop=True)
@@ -1,33 +1,36 @@
 import pandas as pd
 
-# from .comchoice.aggregage.condorcet import condorcet
-
-
-def condorcet():
-    return
+from comchoice.axiom.audit import audit
 
 
 def pareto(
     df,
     selected="selected",
-    voter="voter"
-):
+    voter="voter",
+    alternative_a="alternative_a",
+    alternative_b="alternative_b"
+) -> bool:
     """
     Pareto: Dominated alternatives can not win.
-    There are multiple winners. 
+    There are multiple winners.
     Other utility function should be used to find a unique winner.
 
+    The data satisfies the axiom when there is no Condorcet winner and
+    several alternatives tie in the top-ranked position (see `cancellation`).
+
     Returns
     -------
-    bool: 
-        Boolean variable to indicate if the data is complete.
+    bool:
+        Boolean variable to indicate if the data satisfies the axiom.
     """
-
-    if condorcet(df):
-        return False
-
-    tmp = df.groupby(voter)[selected].value_counts(normalize=True)
-    n_unique_winners = tmp.nlargest(1, keep="all")\
-        .reset_index(drop=True)[selected].nunique()
-
-    return n_unique_winners > 1
+    report = audit(
+        df,
+        dtype="pairwise",
+        axioms=["pareto"],
+        alternative_a=alternative_a,
+        alternative_b=alternative_b,
+        selected=selected,
+        voter=voter
+    )
+
+    return bool(report["value"].iloc[0])
@@ -1,3 +1,5 @@
 from .from_preflib import from_preflib
+from .load_preflib_dir import load_preflib_dir
+from .preflib_index import preflib_index
 from .set_synthetic_election import set_synthetic_election
 from .set_synthetic_pairwise import set_synthetic_pairwise
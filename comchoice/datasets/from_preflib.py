@@ -1,86 +1,181 @@
-import pandas as pd
+from contextlib import contextmanager
+import gzip
+import io
+import os
 import re
-import urllib
+import urllib.request
+import pandas as pd
+
+from comchoice.preprocessing.to_profile import to_profile
+
+
+@contextmanager
+def __open_preflib(path, encoding="utf-8"):
+    if hasattr(path, "read"):
+        if not isinstance(path.read(0), bytes):
+            yield path
+            return
+
+        # The wrapper is detached, so the file object of the caller is not closed with it.
+        file = io.TextIOWrapper(path, encoding=encoding)
+        try:
+            yield file
+        finally:
+            file.detach()
+
+    elif str(path).split("://")[0] in ["http", "https", "ftp"]:
+        with urllib.request.urlopen(path) as file:
+            yield io.TextIOWrapper(file, encoding=encoding)
+
+    elif os.fspath(path).endswith(".gz"):
+        with gzip.open(path, "rt", encoding=encoding) as file:
+            yield file
+
+    else:
+        with open(path, encoding=encoding) as file:
+            yield file
+
+
+def __read_preflib_header(line, header, alternatives):
+    key, _, value = line[1:].strip().partition(": ")
+    if key.startswith("ALTERNATIVE NAME "):
+        alternatives.append([key.replace("ALTERNATIVE NAME ", ""), value])
+    else:
+        header[key] = value
+
+
+def __preflib_metadata(header, path=None):
+    def to_int(key):
+        value = header.get(key)
+        return int(value) if value not in [None, ""] else None
+
+    data_type = header.get("DATA TYPE")
+    if not data_type and isinstance(path, (str, os.PathLike)):
+        data_type = os.fspath(path).replace(".gz", "").split(".")[-1]
+
+    unique_orders = to_int("NUMBER UNIQUE ORDERS")
+    if unique_orders is None:
+        unique_orders = to_int("NUMBER UNIQUE PREFERENCES")
+
+    return {
+        "data_type": data_type,
+        "modification_date": header.get("MODIFICATION DATE"),
+        "modification_type": header.get("MODIFICATION TYPE"),
+        "number_alternatives": to_int("NUMBER ALTERNATIVES"),
+        "number_unique_orders": unique_orders,
+        "number_voters": to_int("NUMBER VOTERS"),
+        "publication_date": header.get("PUBLICATION DATE"),
+        "title": header.get("TITLE")
+    }
+
+
+def __parse_preflib_lines(lines, data_type, delimiter=">", delimiter_ties="="):
+    data = pd.Series(lines, dtype=object).str.replace(" ", "", regex=False)
+
+    if data_type == "wmd":
+        df_edges = data.str.split(",", n=2, expand=True)\
+            .reindex(columns=range(3))
+        df_edges.columns = ["source", "destination", "weight"]
+        df_edges["weight"] = df_edges["weight"].astype(float)
+
+        return df_edges
+
+    df_edges = data.str.split(":", n=1, expand=True)\
+        .reindex(columns=range(2))
+    df_edges.columns = ["voters", "ballot"]
+    df_edges["voters"] = df_edges["voters"].astype(int)
+
+    # Commas outside braces separate alternatives, and inside them, ties.
+    df_edges["ballot"] = df_edges["ballot"]\
+        .str.replace(r"\{\}", "", regex=True)\
+        .str.replace(r",(?![^{]*\})", delimiter, regex=True)\
+        .str.replace(",", delimiter_ties, regex=False)\
+        .str.replace(r"[{}]", "", regex=True)\
+        .str.replace(f"(?:{re.escape(delimiter)})+", delimiter, regex=True)\
+        .str.strip(delimiter)
+
+    return df_edges
 
 
 def from_preflib(
-    path: str,
-    get_dataset_metadata: bool = False
+    path,
+    get_dataset_metadata: bool = False,
+    profile: bool = False,
+    delimiter: str = ">",
+    delimiter_ties: str = "=",
+    encoding: str = "utf-8",
+    chunksize: int = 10 ** 5
 ):
     """Converts Preflib Data
 
+    The file is read in a single pass, and its lines are parsed in chunks of
+    `chunksize` lines, so only a chunk of raw lines is kept in memory besides the
+    parsed data. Data types "soc", "soi", "toc", "toi" and "cat" are converted into
+    ballots, where tied alternatives (and alternatives of the same category) are
+    separated by `delimiter_ties`. Data type "wmd" is converted into weighted edges.
+
     Parameters
     ----------
-    path : str
-        Data set URL
+    path : str, os.PathLike or file object
+        Data set URL, local path (optionally compressed with gzip) or file object.
     get_dataset_metadata : bool
         Whether this value is True, it returns a third dict with metadata included in the dataset, by default False.
-
+    profile : bool
+        Whether this value is True, ballots are returned as a `comchoice.preprocessing.Profile`, by default False.
+    delimiter : str, optional
+        Delimiter used between alternatives in a ballot, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a ballot, by default "=".
+    encoding : str, optional
+        Encoding of the file, by default "utf-8".
+    chunksize : int, optional
+        Number of lines parsed at once, by default 10 ** 5.
 
     Returns
     -------
     pd.DataFrame, pd.DataFrame
         DataFrame objects of nodes and edges.
     """
-    file = urllib.request.urlopen(path)
-    arr = file.read().decode("utf-8").split("\n")
-    alternatives = list(filter(lambda k: "# ALTERNATIVE NAME" in k, arr))
-    alternatives = [x.replace("# ALTERNATIVE NAME ", "").split(": ", 1)
-                    for x in alternatives]
+    header = {}
+    alternatives = []
+    data = []
+    chunks = []
 
-    def get_preflib_info(key, arr=arr):
-        return list(filter(lambda k: f"# {key}: " in k, arr))[0].split(": ", 1)[1]
+    with __open_preflib(path, encoding=encoding) as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith("#"):
+                __read_preflib_header(line, header, alternatives)
+            elif line:
+                data.append(line)
+                if len(data) >= chunksize:
+                    # The header precedes the data, so the data type is already known.
+                    data_type = __preflib_metadata(header, path=path)["data_type"]
+                    chunks.append(__parse_preflib_lines(data, data_type, delimiter, delimiter_ties))
+                    data = []
 
-    unique_orders = get_preflib_info("NUMBER UNIQUE ORDERS")
-    data = list(filter(lambda k: "# " not in k, arr))
-    _ = path.split(".")[-1]
+    metadata = __preflib_metadata(header, path=path)
+    if data or not chunks:
+        chunks.append(__parse_preflib_lines(data, metadata["data_type"], delimiter, delimiter_ties))
 
     df_nodes = pd.DataFrame(
         alternatives,
         columns=["alternative", "name"]
     )
-    df_edges = pd.DataFrame(data).dropna().head(int(unique_orders)).copy()
-    df_edges[["voters", 0]] = df_edges[0].str.split(": ", expand=True)
-    df_edges["voters"] = df_edges["voters"].astype(int)
-
-    def lambda_row(x):
-        row = [item for item in re.split(r",\{(.*?)\}", x[0])[:2]]
-        if len(row) < 2:
-            row.append(None)
-        return row
-
-    if _ in ["toc"]:
-        cols = ["winners", "losers"]
-        df_edges[cols] = df_edges.apply(
-            lambda x: lambda_row(x),
-            axis=1,
-            result_type="expand"
-        )
-        for col in cols:
-            df_edges[col] = df_edges[col].str.replace(
-                "{", "", regex=False).str.replace("}", "", regex=False)
-
-    elif _ in ["soc", "soi"]:
-        df_edges = df_edges.rename(columns={0: "ballot"})
-        df_edges["ballot"] = df_edges["ballot"].str.replace(",", ">")
 
-    else:
-        cols = ["source", "destination"]
-        df_edges[cols] = df_edges[1].str.split(",", expand=True)
+    df_edges = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
 
-    df_edges = df_edges.drop(columns=[0], errors="ignore")
+    if profile and metadata["data_type"] != "wmd":
+        df_edges = to_profile(
+            df_edges,
+            ballot="ballot",
+            delimiter=delimiter,
+            delimiter_ties=delimiter_ties,
+            voters="voters",
+            alternatives=df_nodes["alternative"].values if len(df_nodes) > 0 else None
+        )
 
     if get_dataset_metadata:
-        metadata = {
-            "data_type": get_preflib_info("DATA TYPE"),
-            "modification_date": get_preflib_info("MODIFICATION DATE"),
-            "modification_type": get_preflib_info("MODIFICATION TYPE"),
-            "number_alternatives": int(get_preflib_info("NUMBER ALTERNATIVES")),
-            "number_unique_orders": int(unique_orders),
-            "number_voters": int(get_preflib_info("NUMBER VOTERS")),
-            "publication_date": get_preflib_info("PUBLICATION DATE"),
-            "title": get_preflib_info("TITLE")
-        }
         return df_nodes, df_edges, metadata
 
     return df_nodes, df_edges
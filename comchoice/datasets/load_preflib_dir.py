@@ -0,0 +1,48 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from comchoice.datasets.from_preflib import from_preflib
+from comchoice.datasets.preflib_index import __list_preflib_files, preflib_extensions
+
+
+def load_preflib_dir(
+    path,
+    extensions: list = preflib_extensions,
+    n_jobs: int = 1,
+    recursive: bool = False,
+    **kws
+) -> dict:
+    """Loads a set of PrefLib files.
+
+    Files are parsed with `from_preflib` in a pool of worker processes.
+
+    Parameters
+    ----------
+    path : str, os.PathLike, list or pd.DataFrame
+        Directory with PrefLib files, a list of paths, or an index built with
+        `preflib_index` (e.g., after filtering it).
+    extensions : list, optional
+        Extensions of the files to include when `path` is a directory, by default all PrefLib data types.
+    n_jobs : int, optional
+        Number of worker processes used to parse the files, by default 1.
+    recursive : bool, optional
+        Whether or not to include files in subdirectories, by default False.
+    **kws
+        Arguments passed to `from_preflib` (e.g., `profile=True`).
+
+    Returns
+    -------
+    dict
+        Output of `from_preflib` for each file, indexed by its path.
+    """
+    files = __list_preflib_files(
+        path, extensions=extensions, recursive=recursive)
+    load = partial(from_preflib, **kws)
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            output = list(executor.map(load, files, chunksize=16))
+    else:
+        output = [load(file) for file in files]
+
+    return dict(zip(files, output))
@@ -0,0 +1,82 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import pandas as pd
+
+from comchoice.datasets.from_preflib import __open_preflib, __preflib_metadata, __read_preflib_header
+
+preflib_extensions = ["soc", "soi", "toc", "toi", "cat", "wmd"]
+
+
+def __list_preflib_files(path, extensions=preflib_extensions, recursive=False):
+    if isinstance(path, pd.DataFrame):
+        return list(path["path"])
+
+    if not isinstance(path, (str, os.PathLike)):
+        return [os.fspath(p) for p in path]
+
+    walk = os.walk(path) if recursive else [next(os.walk(path))]
+    return sorted(
+        os.path.join(root, file)
+        for root, _, files in walk
+        for file in files
+        if file.replace(".gz", "").split(".")[-1] in extensions
+    )
+
+
+def __read_preflib_metadata(path):
+    header = {}
+    alternatives = []
+    with __open_preflib(path) as file:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                break
+            if line:
+                __read_preflib_header(line, header, alternatives)
+
+    return {"path": path, **__preflib_metadata(header, path=path)}
+
+
+def preflib_index(
+    path,
+    extensions: list = preflib_extensions,
+    n_jobs: int = 1,
+    recursive: bool = False
+) -> pd.DataFrame:
+    """Builds an index of PrefLib files.
+
+    Only the header of each file is read, so the index can be used to filter
+    instances before loading them with `load_preflib_dir`.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or list
+        Directory with PrefLib files, or a list of paths.
+    extensions : list, optional
+        Extensions of the files to include, by default all PrefLib data types.
+    n_jobs : int, optional
+        Number of worker processes used to read the files, by default 1.
+    recursive : bool, optional
+        Whether or not to include files in subdirectories, by default False.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per file, with its path and the metadata of its header.
+    """
+    files = __list_preflib_files(
+        path, extensions=extensions, recursive=recursive)
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            output = list(executor.map(
+                __read_preflib_metadata, files, chunksize=64))
+    else:
+        output = [__read_preflib_metadata(file) for file in files]
+
+    return pd.DataFrame(
+        output,
+        columns=["path", "data_type", "modification_date", "modification_type",
+                 "number_alternatives", "number_unique_orders", "number_voters",
+                 "publication_date", "title"]
+    )
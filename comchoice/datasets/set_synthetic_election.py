@@ -1,6 +1,94 @@
-from random import choice, sample, seed
 from string import ascii_lowercase
-import pandas as pd
+import numpy as np
+
+from comchoice.preprocessing.profile import Profile, _rank_dtype
+
+cultures = ["impartial", "mallows", "plackett_luce", "urn", "spatial"]
+
+
+def __impartial(rng, n, m, **kws):
+    return rng.permuted(np.broadcast_to(np.arange(m), (n, m)), axis=1)
+
+
+def __mallows(rng, n, m, phi=0.5, **kws):
+    # Repeated insertion model: the i-th alternative of the reference ranking
+    # is inserted at position j with probability proportional to phi ** (i - j).
+    positions = np.zeros((n, m), dtype=np.int64)
+    for i in range(1, m):
+        cdf = np.cumsum(float(phi) ** np.arange(i, -1, -1))
+        j = np.searchsorted(cdf, rng.random(n) * cdf[-1], side="right")
+        j = np.minimum(j, i)
+        positions[:, :i] += positions[:, :i] >= j[:, np.newaxis]
+        positions[:, i] = j
+
+    return np.argsort(positions, axis=1)
+
+
+def __plackett_luce(rng, n, m, weights=None, **kws):
+    weights = np.ones(m) if weights is None else np.asarray(weights, dtype=float)
+    keys = np.log(weights) + rng.gumbel(size=(n, m))
+
+    return np.argsort(-keys, axis=1)
+
+
+def __urn(rng, n, m, alpha=0.1, **kws):
+    # Pólya-Eggenberger urn: the i-th voter draws a new ranking with probability
+    # 1 / (1 + i * alpha), and otherwise copies the ranking of a previous voter.
+    i = np.arange(n)
+    is_new = rng.random(n) * (1 + i * alpha) < 1
+    source = np.where(is_new, i, np.floor(rng.random(n) * i).astype(np.int64))
+
+    while True:
+        _source = source[source]
+        if np.array_equal(_source, source):
+            break
+        source = _source
+
+    new = np.flatnonzero(is_new)
+    index = np.zeros(n, dtype=np.int64)
+    index[new] = np.arange(len(new))
+
+    return __impartial(rng, len(new), m)[index[source]]
+
+
+def __spatial(rng, n, m, dimensions=2, alternative_positions=None, **kws):
+    if alternative_positions is None:
+        alternative_positions = rng.random((m, dimensions))
+    alternative_positions = np.asarray(alternative_positions, dtype=float)\
+        .reshape(m, -1)
+    voter_positions = rng.random((n, alternative_positions.shape[1]))
+    distance = ((voter_positions[:, np.newaxis, :] -
+                alternative_positions[np.newaxis, :, :]) ** 2).sum(axis=2)
+
+    return np.argsort(distance, axis=1)
+
+
+def __sample_orders(rng, culture, n, m, **kws):
+    samplers = dict(
+        impartial=__impartial,
+        mallows=__mallows,
+        plackett_luce=__plackett_luce,
+        urn=__urn,
+        spatial=__spatial
+    )
+
+    if culture not in samplers:
+        raise ValueError(
+            f"Value provided to culture parameter not valid. Values accepted are {', '.join(cultures)}")
+
+    if culture == "urn":
+        return __urn(rng, n, m, **kws).astype(_rank_dtype(m))
+
+    if culture == "spatial" and kws.get("alternative_positions") is None:
+        kws["alternative_positions"] = rng.random((m, kws.get("dimensions", 2)))
+
+    chunksize = max(2 ** 22 // m, 1)
+    orders = np.empty((n, m), dtype=_rank_dtype(m))
+    for start in range(0, n, chunksize):
+        end = min(start + chunksize, n)
+        orders[start:end] = samplers[culture](rng, end - start, m, **kws)
+
+    return orders
 
 
 def set_synthetic_election(
@@ -10,27 +98,53 @@ def set_synthetic_election(
     n_alternatives=3,
     n_voters=4,
     random_state=None,
-    delimiter=">"
-) -> pd.DataFrame:
+    delimiter=">",
+    culture="impartial",
+    culture_kws=dict(),
+    output="ballot",
+    ballot="rank"
+):
     """Generates synthetic voting data.
 
+    Rankings are sampled in bulk for all voters from a statistical culture.
+
     Parameters
     ----------
     alternatives: string list, default=alphabet
         List of the names/alternatives
     full_rank : bool, default=True
         If the value is `true`, every voter assigns a complete ranking of alternatives.
+        Otherwise, every voter selects only their top-ranked alternative.
     n_alternatives : int, default=3
         Number of alternatives. Must be a positive value.
     n_voters : int, default=4
         Number of voters. Must be a positive value.
-    random_state : int, None, default=None
+    random_state : int, np.random.Generator, None, default=None
         Random state
-    rank_separator
+    delimiter : str, default=">"
+        Delimiter used between alternatives in a ballot.
+    culture : {"impartial", "mallows", "plackett_luce", "urn", "spatial"}, default="impartial"
+        Statistical culture used to sample the rankings:
+
+        - "impartial": every ranking has the same probability.
+        - "mallows": rankings concentrate around a reference ranking (the order of `alternatives`).
+          `culture_kws` accepts `phi` (dispersion between 0 and 1, by default 0.5).
+        - "plackett_luce": alternatives are drawn sequentially proportional to their weight.
+          `culture_kws` accepts `weights` (one positive value per alternative, by default 1).
+        - "urn": Pólya-Eggenberger urn model. `culture_kws` accepts `alpha` (contagion, by default 0.1).
+        - "spatial": voters rank alternatives by their Euclidean distance in a unit cube.
+          `culture_kws` accepts `dimensions` (by default 2) and `alternative_positions`.
+    culture_kws : dict, default=dict()
+        Parameters of the culture.
+    output : {"ballot", "profile"}, default="ballot"
+        Whether "ballot", it returns a DataFrame of ballots. Whether "profile", it returns
+        a compact `comchoice.preprocessing.Profile`.
+    ballot : str, default="rank"
+        Column label of the ballots, when `output = "ballot"`.
 
     Returns
     -------
-    pandas.DataFrame
+    pandas.DataFrame or Profile
         A DataFrame of synthetic voting data.
 
     See Also
@@ -38,7 +152,7 @@ def set_synthetic_election(
     load_synthetic_pairwise : Generates synthetic voting data.
     """
 
-    if alternatives == None:
+    if alternatives is None:
         if n_alternatives <= 26:
             alphabet_string = ascii_lowercase
             alternatives = list(alphabet_string[:n_alternatives])
@@ -48,24 +162,33 @@ def set_synthetic_election(
     else:
         n_alternatives = len(alternatives)
 
-    if random_state != None and (type(random_state) == int or float):
-        seed(random_state)
+    rng = np.random.default_rng(random_state)
+    orders = __sample_orders(
+        rng, culture, n_voters, n_alternatives, **culture_kws)
 
-    output = []
+    if not full_rank:
+        orders = orders[:, :1]
+
+    profile = Profile.from_orders(
+        orders,
+        alternatives=alternatives,
+        n_alternatives=n_alternatives
+    )
+
+    if aggregate:
+        profile = profile.compress()
 
-    for voter in range(1, n_voters + 1):
-        voted = sample(
-            alternatives, n_alternatives) if full_rank else choice(alternatives)
-        output.append({
-            "voters": 1,
-            "rank": delimiter.join(voted)
-        })
+    if output == "profile":
+        return profile
 
-    tmp = pd.DataFrame(output)
+    tmp = profile.to_ballot(
+        ballot=ballot,
+        delimiter=delimiter,
+        voters="voters"
+    )
 
     if aggregate:
-        tmp = tmp.groupby("rank").agg(
-            {"voters": "sum"}).reset_index()
+        tmp = tmp.sort_values(ballot).reset_index(drop=True)
     else:
         tmp = tmp.drop(columns=["voters"])
         tmp["voter"] = range(1, tmp.shape[0] + 1)
@@ -1,8 +1,32 @@
-from itertools import combinations
-from random import choices, sample, seed
-from string import ascii_lowercase
+from math import sqrt
+import numpy as np
 import pandas as pd
 
+from comchoice.preprocessing.profile import _rank_dtype
+
+
+def __sample_pairs(rng, n_voters, n_combinations, n_pairs):
+    # Samples, for each voter, `n_pairs` codes of pairs without replacement.
+    if n_pairs * 8 > n_combinations:
+        chunksize = max(2 ** 22 // n_combinations, 1)
+        output = np.empty((n_voters, n_pairs), dtype=np.int64)
+        for start in range(0, n_voters, chunksize):
+            end = min(start + chunksize, n_voters)
+            keys = rng.random((end - start, n_combinations))
+            output[start:end] = np.argpartition(
+                keys, n_pairs - 1, axis=1)[:, :n_pairs]
+        return output
+
+    output = rng.integers(n_combinations, size=(n_voters, n_pairs))
+    while True:
+        output.sort(axis=1)
+        duplicated = np.zeros(output.shape, dtype=bool)
+        duplicated[:, 1:] = output[:, 1:] == output[:, :-1]
+        n_duplicated = duplicated.sum()
+        if n_duplicated == 0:
+            return output
+        output[duplicated] = rng.integers(n_combinations, size=n_duplicated)
+
 
 def set_synthetic_pairwise(
     n_alternatives=3,
@@ -10,10 +34,21 @@ def set_synthetic_pairwise(
     random_state=None,
     ties=False,
     weight_tie=0.1,
-    alternatives=None
+    alternatives=None,
+    model="impartial",
+    utilities=None,
+    noise=1,
+    n_pairs=None,
+    alternative_a="option_a",
+    alternative_b="option_b",
+    selected="selected",
+    voter="voter"
 ) -> pd.DataFrame:
     """Generates synthetic pairwise comparison data.
 
+    All the comparisons are generated at once, by computing voters and pairs of
+    alternatives from the index of each row.
+
     Parameters
     ----------
     alternatives: string list, default=numbers
@@ -22,14 +57,33 @@ def set_synthetic_pairwise(
         Number of alternatives. Must be a positive value.
     n_voters : int, default=10
         Number of voters. Must be a positive value.
-    random_state : int, None, default=None
+    random_state : int, np.random.Generator, None, default=None
         Random state
     ties : bool, default=False
         If the value is `true`, the data will include ties between comparisons.
-    transitive : bool, default=True
-        If the value is `true`, individual preferences are transitives.
     weight_tie : float, default=0.1
         Probability of a tie in a pairwise choice. It works if ties=True.
+    model : {"impartial", "bradley_terry", "thurstone"}, default="impartial"
+        Model used to select an alternative in each comparison:
+
+        - "impartial": each voter has a random ranking of alternatives, so individual preferences are transitive.
+        - "bradley_terry": alternative a is selected over b with probability 1 / (1 + exp(-(u_a - u_b) / noise)).
+        - "thurstone": alternative a is selected over b when u_a - u_b plus a normal error with standard deviation `noise * sqrt(2)` is positive.
+    utilities : array-like, optional
+        Latent utility (u) of each alternative. By default, they are drawn from a standard normal distribution.
+    noise : float, default=1
+        Scale of the noise of the "bradley_terry" and "thurstone" models.
+    n_pairs : int, optional
+        Number of pairs compared by each voter, sampled at random without replacement.
+        By default, each voter compares all the pairs of alternatives.
+    alternative_a : str, default="option_a"
+        Column label of the alternative displayed on the left of a comparison.
+    alternative_b : str, default="option_b"
+        Column label of the alternative displayed on the right of a comparison.
+    selected : str, default="selected"
+        Column label of the alternative selected in a comparison. Ties are represented with 0.
+    voter : str, default="voter"
+        Column label of the voter unique identifier.
 
     Returns
     -------
@@ -40,34 +94,85 @@ def set_synthetic_pairwise(
     --------
     load_synthetic_election : Generates synthetic voting data.
     """
-    if alternatives == None:
-        alternatives = list(range(1, n_alternatives + 1))
+    if alternatives is None:
+        alternatives = np.arange(
+            1, n_alternatives + 1, dtype=_rank_dtype(n_alternatives))
     else:
         n_alternatives = len(alternatives)
+    alternatives = np.asarray(alternatives)
+
+    rng = np.random.default_rng(random_state)
+
+    i_a, i_b = np.triu_indices(n_alternatives, 1)
+    n_combinations = len(i_a)
+    dtype = _rank_dtype(n_alternatives)
+    i_a, i_b = i_a.astype(dtype), i_b.astype(dtype)
+
+    if n_pairs is None or n_pairs >= n_combinations:
+        n_pairs = n_combinations
+
+    if model in ["bradley_terry", "thurstone"]:
+        if utilities is None:
+            utilities = rng.standard_normal(n_alternatives)
+        utilities = np.asarray(utilities, dtype=float)
+
+    elif model != "impartial":
+        raise ValueError(
+            "Value provided to model parameter not valid. Values accepted are 'impartial', 'bradley_terry', 'thurstone'")
+
+    n_rows = n_voters * n_pairs
+    voters = np.repeat(
+        np.arange(1, n_voters + 1, dtype=np.min_scalar_type(-n_voters - 1)), n_pairs)
+    option_a = np.empty(n_rows, dtype=dtype)
+    option_b = np.empty(n_rows, dtype=dtype)
+    winner = np.empty(n_rows, dtype=dtype)
+    is_tie = np.zeros(n_rows, dtype=bool)
+
+    chunksize = max(2 ** 22 // n_pairs, 1)
+    for start in range(0, n_voters, chunksize):
+        end = min(start + chunksize, n_voters)
+        n = end - start
+        rows = slice(start * n_pairs, end * n_pairs)
+
+        if n_pairs == n_combinations:
+            pairs = np.tile(np.arange(n_combinations), n)
+        else:
+            pairs = __sample_pairs(rng, n, n_combinations, n_pairs).ravel()
+        a = i_a[pairs]
+        b = i_b[pairs]
 
-    if random_state != None and (type(random_state) == int or float):
-        seed(random_state)
+        if model == "impartial":
+            keys = rng.random((n, n_alternatives))
+            voter_index = np.repeat(np.arange(n), n_pairs)
+            is_a_selected = keys[voter_index, a] < keys[voter_index, b]
 
-    voters = list(range(1, n_voters + 1))
+        elif model == "bradley_terry":
+            is_a_selected = rng.random(len(pairs)) * \
+                (1 + np.exp(-(utilities[a] - utilities[b]) / noise)) < 1
 
-    output = []
+        else:
+            is_a_selected = utilities[a] - utilities[b] + noise * sqrt(2) * \
+                rng.standard_normal(len(pairs)) > 0
 
-    for voter in voters:
-        rank_order = combinations(sample(alternatives, n_alternatives), 2)
-        for alternative_a, alternative_b in rank_order:
+        winner[rows] = np.where(is_a_selected, a, b)
 
-            options = sample([alternative_a, alternative_b], 2)
-            option_a = options[0]
-            option_b = options[1]
+        # Shuffles the order in which the alternatives are displayed
+        swap = rng.random(len(pairs)) < 0.5
+        option_a[rows] = np.where(swap, b, a)
+        option_b[rows] = np.where(swap, a, b)
 
-            selected = choices([alternative_a, 0], weights=[
-                               1 - weight_tie, weight_tie])[0] if ties else alternative_a
+        if ties:
+            is_tie[rows] = rng.random(len(pairs)) < weight_tie
 
-            output.append({
-                "voter": voter,
-                "option_a": option_a,
-                "option_b": option_b,
-                "selected": selected
-            })
+    output = alternatives[winner]
+    if ties:
+        if not np.issubdtype(output.dtype, np.number):
+            output = output.astype(object)
+        output[is_tie] = 0
 
-    return pd.DataFrame(output)
+    return pd.DataFrame({
+        voter: voters,
+        alternative_a: alternatives[option_a],
+        alternative_b: alternatives[option_b],
+        selected: output
+    })
@@ -1,9 +1,25 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import io
 import json
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import threading
+import uuid
+import numpy as np
 import pandas as pd
 from typing import Union
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 import comchoice.aggregate as agg
+from comchoice.accumulate import EloAccumulator, GradeAccumulator, PairwiseAccumulator, \
+    PluralityAccumulator, PositionalAccumulator
+from comchoice.accumulate.aggregate_file import rules
+from comchoice.preprocessing.to_profile import to_profile
 
 app = FastAPI()
 
@@ -14,6 +30,509 @@ fake_df = pd.DataFrame([
     {"voters": 4, "ballot": "C>D>A>B"}
 ])
 
+ARROW_CONTENT_TYPES = [
+    "application/vnd.apache.arrow.stream",
+    "application/vnd.apache.arrow.file"
+]
+MSGPACK_CONTENT_TYPES = [
+    "application/msgpack",
+    "application/x-msgpack",
+    "application/vnd.msgpack"
+]
+
+# Settings of the workers, defined with environment variables.
+CACHE_SIZE = int(os.environ.get("COMCHOICE_CACHE_SIZE", 128))
+EXECUTOR = os.environ.get("COMCHOICE_EXECUTOR", "process")
+TIMEOUT = float(os.environ.get("COMCHOICE_TIMEOUT", 30))
+WORKERS = int(os.environ.get("COMCHOICE_WORKERS", os.cpu_count() or 1))
+SESSIONS_DB = os.environ.get("COMCHOICE_SESSIONS_DB")
+
+# Methods of ranked ballots that can be computed from shared intermediates.
+shared_rules = {k: v for k, v in rules.items() if v[0] is not GradeAccumulator}
+
+# Each thread of the pool runs a job, or waits for the process that runs it.
+# Processes are forked from a server that imports this module once.
+executor = ThreadPoolExecutor(max_workers=WORKERS)
+context = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+if context.get_start_method() == "forkserver":
+    context.set_forkserver_preload([__name__])
+
+
+class ProfileCache:
+    """LRU cache of parsed elections.
+
+    Elections are indexed by the SHA-256 hash of the request body, and
+    optionally by a dataset id defined by the client.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of elections kept in memory, by default 128.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.aliases = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            key = self.aliases.get(key, key)
+            if key not in self.data:
+                return None
+            self.data.move_to_end(key)
+            return self.data[key]
+
+    def set(self, key, value, dataset_id=None):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if dataset_id is not None:
+                self.aliases[dataset_id] = key
+
+            while len(self.data) > self.maxsize:
+                old, _ = self.data.popitem(last=False)
+                self.aliases = {k: v for k, v in self.aliases.items() if v != old}
+
+
+cache = ProfileCache(maxsize=CACHE_SIZE)
+
+
+class Session:
+    """Election that receives votes over time.
+
+    Votes are added to tallies held in memory (first preferences, positional
+    counts and pairwise matrix for ballots, and Elo ratings for pairwise
+    comparisons), so results are computed in constant time with respect to
+    the number of votes. Sessions of ballots support the rules of
+    `comchoice.accumulate.aggregate_file` that do not use grades, including
+    every rule computed from the pairwise matrix (e.g., Schulze, Minimax).
+
+    Parameters
+    ----------
+    dtype : {"ballot", "pairwise"}, optional
+        Type of the votes, by default "ballot".
+    alternatives : list, optional
+        Labels of the alternatives known in advance, by default None.
+    **kws
+        Arguments passed to the accumulators (e.g., `ballot`, `delimiter`,
+        `voters` for ballots, or `alternative_a`, `alternative_b`, `selected`, `K`
+        for pairwise comparisons).
+    """
+
+    def __init__(self, dtype="ballot", alternatives=None, **kws):
+        if dtype == "ballot":
+            accumulators = [PluralityAccumulator, PositionalAccumulator, PairwiseAccumulator]
+
+        elif dtype == "pairwise":
+            accumulators = [EloAccumulator]
+
+        else:
+            raise ValueError(
+                "Value provided to dtype parameter not valid. Values accepted are 'ballot', 'pairwise'")
+
+        self.dtype = dtype
+        self.accumulators = {
+            Accumulator: Accumulator(alternatives=alternatives, **kws)
+            for Accumulator in accumulators
+        }
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        return {k: v for k, v in self.__dict__.items() if k != "lock"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @property
+    def n_voters(self):
+        return np.asarray(next(iter(self.accumulators.values())).n_voters).item()
+
+    def append(self, df):
+        with self.lock:
+            if self.dtype == "ballot":
+                # Ballots are parsed once and shared by the accumulators.
+                df = self.accumulators[PluralityAccumulator]._profile(df)
+
+            for acc in self.accumulators.values():
+                acc.update(df)
+
+        return self
+
+    def result(self, method, params=dict()):
+        with self.lock:
+            if self.dtype == "pairwise" and method in ["elo", "win_rate", "copeland"]:
+                return self.accumulators[EloAccumulator].result(rule=method, **params)
+
+            if self.dtype == "ballot" and method in shared_rules:
+                Accumulator, kws = shared_rules[method]
+                return self.accumulators[Accumulator].result(**{**kws, **params})
+
+        raise ValueError(
+            f"Aggregation method not valid for {self.dtype} sessions. Pleasy try another option.")
+
+    def pairwise_matrix(self):
+        with self.lock:
+            acc = self.accumulators.get(
+                PairwiseAccumulator, self.accumulators.get(EloAccumulator))
+            return list(acc.alternatives), acc.counts.copy()
+
+
+sessions = {}
+
+
+def __save_session(session_id, session):
+    with sqlite3.connect(SESSIONS_DB) as con:
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, data BLOB)")
+        con.execute(
+            "INSERT OR REPLACE INTO sessions VALUES (?, ?)",
+            (session_id, pickle.dumps(session))
+        )
+
+
+def __get_session(session_id):
+    if session_id not in sessions and SESSIONS_DB and os.path.exists(SESSIONS_DB):
+        with sqlite3.connect(SESSIONS_DB) as con:
+            row = con.execute(
+                "SELECT data FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is not None:
+            sessions[session_id] = pickle.loads(row[0])
+
+    if session_id not in sessions:
+        raise HTTPException(
+            status_code=404, detail=f"Session {session_id} not found.")
+
+    return sessions[session_id]
+
+
+def __get_method(method):
+    if method.startswith("_") or not callable(getattr(agg, method, None)):
+        raise HTTPException(
+            status_code=404,
+            detail="Aggregation method not valid. Pleasy try another option."
+        )
+
+    return getattr(agg, method)
+
+
+def __parse_body(body, content_type):
+    if content_type in ARROW_CONTENT_TYPES:
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise HTTPException(
+                status_code=415, detail="Arrow bodies require pyarrow.")
+
+        reader = pa.ipc.open_stream if content_type.endswith("stream") else pa.ipc.open_file
+        return reader(io.BytesIO(body)).read_all().to_pandas(), {}
+
+    payload = json.loads(body)
+    if isinstance(payload, list):
+        return pd.DataFrame(payload), {}
+
+    return pd.DataFrame(payload.pop("data", [])), payload
+
+
+async def __load_election(request, dataset_id=None):
+    # Parses the body of a request, or gets it from the cache.
+    body = await request.body()
+
+    if body:
+        key = hashlib.sha256(body).hexdigest()
+        cached = cache.get(key)
+        if cached is None:
+            content_type = request.headers.get("content-type", "").split(";")[0].strip()
+            try:
+                cached = __parse_body(body, content_type)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        cache.set(key, cached, dataset_id=dataset_id)
+
+    elif dataset_id is not None:
+        key = dataset_id
+        cached = cache.get(dataset_id)
+        if cached is None:
+            raise HTTPException(
+                status_code=404, detail=f"Dataset {dataset_id} not found.")
+
+    else:
+        raise HTTPException(status_code=400, detail="Request body is empty.")
+
+    df, payload = cached
+
+    return key, df, payload
+
+
+def __accept(request):
+    # Content type requested by the client, by default JSON.
+    for item in request.headers.get("accept", "").split(","):
+        content_type = item.split(";")[0].strip()
+        if content_type in ARROW_CONTENT_TYPES:
+            return "arrow"
+        if content_type in MSGPACK_CONTENT_TYPES:
+            return "msgpack"
+
+    return "json"
+
+
+def __to_arrow(tmp, meta):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPException(
+            status_code=406, detail="Arrow responses require pyarrow.")
+
+    table = pa.Table.from_pandas(tmp, preserve_index=False)\
+        .replace_schema_metadata({"comchoice": json.dumps(meta)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=2 ** 16)
+
+    return Response(sink.getvalue().to_pybytes(), media_type=ARROW_CONTENT_TYPES[0])
+
+
+def __to_msgpack(payload):
+    try:
+        import msgpack
+    except ImportError:
+        raise HTTPException(
+            status_code=406, detail="MessagePack responses require msgpack.")
+
+    return Response(msgpack.packb(payload), media_type=MSGPACK_CONTENT_TYPES[0])
+
+
+def __encode(request, data, meta=dict(), offset=0, limit=None):
+    # Serializes a response in the content type requested by the client.
+    # DataFrames are paginated with `offset` and `limit`.
+    fmt = __accept(request)
+
+    if isinstance(data, pd.DataFrame):
+        meta = {**meta, "offset": offset, "total": len(data)}
+        data = data.iloc[offset:None if limit is None else offset + limit]
+
+        if fmt == "arrow":
+            return __to_arrow(data, meta)
+
+        if fmt == "msgpack":
+            # Columns are sent as arrays, which are smaller than records.
+            return __to_msgpack({**meta, "data": {
+                str(col): data[col].tolist() for col in data
+            }})
+
+        return {**meta, "data": data.to_dict(orient="records")}
+
+    if fmt == "arrow":
+        raise HTTPException(
+            status_code=406, detail="This response is not available as Arrow.")
+
+    if fmt == "msgpack":
+        return __to_msgpack({**meta, "data": data})
+
+    return {**meta, "data": data}
+
+
+def __encode_matrix(request, alternatives, matrix, meta=dict()):
+    # Serializes a pairwise matrix. Binary formats send it as a dense buffer.
+    fmt = __accept(request)
+    alternatives = [a.item() if hasattr(a, "item") else a for a in alternatives]
+
+    if fmt == "arrow":
+        tmp = pd.DataFrame(matrix, columns=[str(a) for a in alternatives])
+        tmp.insert(0, "_winner", [str(a) for a in alternatives])
+        return __to_arrow(tmp, {**meta, "alternatives": alternatives})
+
+    if fmt == "msgpack":
+        matrix = np.ascontiguousarray(matrix, dtype="<f8")
+        return __to_msgpack({
+            **meta,
+            "alternatives": alternatives,
+            "dtype": matrix.dtype.str,
+            "shape": list(matrix.shape),
+            "data": matrix.tobytes()
+        })
+
+    return {**meta, "alternatives": alternatives, "data": matrix.tolist()}
+
+
+def run_method(method, df, params=dict()) -> pd.DataFrame:
+    """Runs an aggregation method in a worker.
+
+    Parameters
+    ----------
+    method : str
+        Comchoice method.
+    df : pd.DataFrame
+        A data set to be aggregated.
+    params : dict, optional
+        Arguments passed to the method, by default dict().
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregation of preferences.
+    """
+    return getattr(agg, method)(df, **params)
+
+
+def run_pairwise_matrix(df, params=dict()):
+    """Computes the pairwise matrix of an election in a worker.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A data set of ballots.
+    params : dict, optional
+        Arguments passed to `to_profile` (e.g., `ballot`, `delimiter`), by default dict().
+
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        Labels of the alternatives, and the pairwise matrix.
+    """
+    profile = to_profile(df, **params)
+
+    return profile.alternatives, profile.pairwise_matrix()
+
+
+def run_batch(df, methods) -> list:
+    """Runs several aggregation methods on the same election in a worker.
+
+    Ballots are parsed once into a profile, and positional counts, first
+    preferences and the pairwise matrix are computed once and shared by the
+    methods that only depend on them (e.g., Borda, Plurality, and pairwise-based
+    rules such as Copeland, Schulze or Ranked Pairs). Other methods run on the
+    DataFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A data set to be aggregated.
+    methods : list
+        Methods to run. Each item is either the name of a method or a dict
+        `{"method": ..., "params": {...}}`.
+
+    Returns
+    -------
+    list
+        Records of each aggregation, or the error raised by the method.
+    """
+    profile_kws = ["ballot", "delimiter", "delimiter_ties", "voters"]
+    result_kws = ["alternative", "k", "score", "scores", "show_rank"]
+    pairwise_kws = ["method", "tie_breaking", "weak"]
+
+    profiles = {}
+    accumulators = {}
+    output = []
+    for item in methods:
+        if isinstance(item, str):
+            item = dict(method=item)
+        method, params = item["method"], item.get("params", {})
+
+        try:
+            if method.startswith("_") or not callable(getattr(agg, method, None)):
+                raise ValueError(
+                    "Aggregation method not valid. Pleasy try another option.")
+
+            Accumulator, kws = shared_rules.get(method, (None, {}))
+            _result_kws = result_kws + (pairwise_kws if Accumulator is PairwiseAccumulator else [])
+
+            if Accumulator is not None and set(params) <= set(profile_kws + _result_kws):
+                _profile_kws = {k: v for k, v in params.items() if k in profile_kws}
+                key = tuple(sorted(_profile_kws.items()))
+
+                if (Accumulator, key) not in accumulators:
+                    if key not in profiles:
+                        profiles[key] = to_profile(df, **_profile_kws)
+                    accumulators[(Accumulator, key)] = Accumulator().update(profiles[key])
+
+                data = accumulators[(Accumulator, key)].result(**{
+                    **kws,
+                    **{k: v for k, v in params.items() if k in _result_kws}
+                })
+
+            else:
+                data = run_method(method, df, params)
+
+            # Some methods return a list of alternatives (e.g., smith_set).
+            if isinstance(data, pd.DataFrame):
+                data = data.to_dict(orient="records")
+
+            output.append(dict(method=method, params=params, data=data))
+
+        except Exception as e:
+            output.append(dict(method=method, params=params, error=str(e)))
+
+    return output
+
+
+def __target(sender, function, args):
+    try:
+        output = (True, function(*args))
+    except Exception as e:
+        output = (False, e)
+
+    try:
+        sender.send(output)
+    except Exception as e:
+        # The exception raised by the job cannot be pickled.
+        sender.send((False, RuntimeError(str(e))))
+    finally:
+        sender.close()
+
+
+def __run_process(function, *args):
+    # Runs a job in a new process, which is terminated whether it takes
+    # longer than TIMEOUT seconds, so the worker is freed.
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=__target, args=(sender, function, args), daemon=True)
+    process.start()
+    sender.close()
+
+    try:
+        if not receiver.poll(TIMEOUT):
+            raise TimeoutError
+        ok, output = receiver.recv()
+    except EOFError:
+        process.join()
+        raise RuntimeError(f"Aggregation worker exited with code {process.exitcode}.")
+    finally:
+        receiver.close()
+        process.terminate()
+        process.join()
+
+    if not ok:
+        raise output
+
+    return output
+
+
+async def __run(function, *args):
+    loop = asyncio.get_running_loop()
+    try:
+        if EXECUTOR == "process":
+            return await loop.run_in_executor(executor, __run_process, function, *args)
+
+        # Threads cannot be stopped: the request returns 504, but the job keeps
+        # its worker until it finishes.
+        return await asyncio.wait_for(
+            loop.run_in_executor(executor, function, *args),
+            timeout=TIMEOUT
+        )
+    except (asyncio.TimeoutError, TimeoutError):
+        raise HTTPException(
+            status_code=504,
+            detail=f"Aggregation took longer than {TIMEOUT} seconds."
+        )
+    except KeyError as e:
+        raise HTTPException(
+            status_code=422, detail=f"Column {e} not found in the data.")
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
 
 @app.get("/")
 def read_root():
@@ -21,10 +540,13 @@ def read_root():
 
 
 @app.get("/api/aggregate/{method}")
-def aggregate_data(
+async def aggregate_data(
     method: str,
     data: str,
-    q: Union[str, None] = None
+    request: Request,
+    q: Union[str, None] = None,
+    offset: int = 0,
+    limit: Union[int, None] = None
 ) -> dict:
     """API to aggregate preferences by using comchoice methods.
 
@@ -32,25 +554,317 @@ def aggregate_data(
     ----------
     method : str
         Comchoice method.
+    data : str
+        Election as JSON records.
+    request : Request
+        Request, whose `Accept` header defines the format of the response
+        (JSON, Arrow IPC stream or MessagePack).
     q : Union[str, None], optional
         Query, by default None
+    offset : int, optional
+        Index of the first alternative returned, by default 0.
+    limit : Union[int, None], optional
+        Maximum number of alternatives returned, by default None.
 
     Returns
     -------
-    _type_
-        _description_
+    dict
+        Aggregation of preferences.
     """
-    valid_methods = ["borda", "condorcet", "copeland", "plurality"]
-
+    __get_method(method)
     df = pd.DataFrame(json.loads(data))
 
-    if True:  # method in valid_methods:
-        return {
-            "data": getattr(agg, method)(df).to_dict(orient="records"),
-            "q": q
-        }
+    return __encode(
+        request,
+        await __run(run_method, method, df, {}),
+        meta={"q": q},
+        offset=offset,
+        limit=limit
+    )
+
+
+@app.post("/api/aggregate")
+async def aggregate_batch(
+    request: Request,
+    dataset_id: Union[str, None] = None,
+    methods: Union[str, None] = None
+) -> dict:
+    """API to aggregate an election with several methods at once.
+
+    The body is a JSON object `{"data": [...], "methods": [...]}`, where each
+    method is either its name or `{"method": ..., "params": {...}}`, or an Arrow
+    IPC stream/file (methods are then defined in the query). The election is
+    parsed once, and intermediates shared by the methods are computed once.
+
+    Parameters
+    ----------
+    request : Request
+        Request with the election in its body.
+    dataset_id : Union[str, None], optional
+        Identifier of the election defined by the client, by default None.
+    methods : Union[str, None], optional
+        Methods as a JSON list (they replace those included in a JSON body), by default None.
+
+    Returns
+    -------
+    dict
+        Aggregation of preferences of each method, and the key of the cached election.
+    """
+    key, df, payload = await __load_election(request, dataset_id=dataset_id)
+    methods = json.loads(methods) if methods else payload.get("methods", [])
+
+    return __encode(
+        request,
+        await __run(run_batch, df, methods),
+        meta={"key": key}
+    )
+
+
+@app.post("/api/aggregate/{method}")
+async def aggregate_body(
+    method: str,
+    request: Request,
+    dataset_id: Union[str, None] = None,
+    params: Union[str, None] = None,
+    offset: int = 0,
+    limit: Union[int, None] = None
+) -> dict:
+    """API to aggregate preferences sent in the body of the request.
+
+    The body is either a JSON object `{"data": [...], "params": {...}}` (or a list
+    of records), or an Arrow IPC stream/file. Parsed elections are cached by the
+    hash of the body, and by `dataset_id` when it is defined, so later requests
+    can send an empty body with the same `dataset_id`. Methods run in a bounded
+    pool of workers, each job in its own process, and return 504 after
+    `COMCHOICE_TIMEOUT` seconds, when the process is terminated and its worker freed.
+
+    Parameters
+    ----------
+    method : str
+        Comchoice method.
+    request : Request
+        Request with the election in its body.
+    dataset_id : Union[str, None], optional
+        Identifier of the election defined by the client, by default None.
+    params : Union[str, None], optional
+        Arguments of the method as a JSON object (they replace those included in
+        a JSON body), by default None.
+    offset : int, optional
+        Index of the first alternative returned, by default 0.
+    limit : Union[int, None], optional
+        Maximum number of alternatives returned, by default None.
+
+    Returns
+    -------
+    dict
+        Aggregation of preferences, and the key of the cached election.
+    """
+    __get_method(method)
+    key, df, payload = await __load_election(request, dataset_id=dataset_id)
+    params = {**payload.get("params", {}), **(json.loads(params) if params else {})}
+
+    return __encode(
+        request,
+        await __run(run_method, method, df, params),
+        meta={"key": key},
+        offset=offset,
+        limit=limit
+    )
+
+
+@app.post("/api/pairwise_matrix")
+async def pairwise_matrix_body(
+    request: Request,
+    dataset_id: Union[str, None] = None,
+    params: Union[str, None] = None
+) -> dict:
+    """API to compute the pairwise matrix of an election.
+
+    The value in row `a` and column `b` is the number of voters that rank `a`
+    over `b`. MessagePack responses include the matrix as a dense buffer of
+    little-endian float64, with its `shape`.
+
+    Parameters
+    ----------
+    request : Request
+        Request with the election in its body.
+    dataset_id : Union[str, None], optional
+        Identifier of the election defined by the client, by default None.
+    params : Union[str, None], optional
+        Column label and delimiters of the ballots as a JSON object, by default None.
+
+    Returns
+    -------
+    dict
+        Labels of the alternatives and pairwise matrix.
+    """
+    key, df, payload = await __load_election(request, dataset_id=dataset_id)
+    params = {**payload.get("params", {}), **(json.loads(params) if params else {})}
+    alternatives, matrix = await __run(run_pairwise_matrix, df, params)
+
+    return __encode_matrix(request, alternatives, matrix, meta={"key": key})
+
+
+@app.post("/api/sessions")
+async def create_session(request: Request) -> dict:
+    """API to create an election that receives votes over time.
+
+    The body is an optional JSON object `{"dtype": "ballot", "alternatives": [...], "options": {...}}`,
+    where `dtype` is either "ballot" or "pairwise", and `options` are the
+    column labels and delimiters of the votes.
+
+    Parameters
+    ----------
+    request : Request
+        Request with the settings of the election in its body.
+
+    Returns
+    -------
+    dict
+        Identifier of the session.
+    """
+    body = await request.body()
+    payload = json.loads(body) if body else {}
+
+    try:
+        session = Session(
+            dtype=payload.get("dtype", "ballot"),
+            alternatives=payload.get("alternatives"),
+            **payload.get("options", {})
+        )
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    session_id = uuid.uuid4().hex
+    sessions[session_id] = session
+    if SESSIONS_DB:
+        await asyncio.to_thread(__save_session, session_id, session)
+
+    return {"session_id": session_id, "dtype": session.dtype}
+
+
+@app.post("/api/sessions/{session_id}/votes")
+async def append_votes(session_id: str, request: Request) -> dict:
+    """API to add a batch of votes to a session.
+
+    The body is either a JSON object `{"data": [...]}` (or a list of records), or
+    an Arrow IPC stream/file. When `COMCHOICE_SESSIONS_DB` is defined, the session
+    is saved in that SQLite file after each batch.
+
+    Parameters
+    ----------
+    session_id : str
+        Identifier of the session.
+    request : Request
+        Request with the votes in its body.
+
+    Returns
+    -------
+    dict
+        Number of votes of the session.
+    """
+    session = __get_session(session_id)
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    try:
+        df, _ = __parse_body(await request.body(), content_type)
+        await asyncio.to_thread(session.append, df)
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if SESSIONS_DB:
+        await asyncio.to_thread(__save_session, session_id, session)
+
+    return {"session_id": session_id, "n_voters": session.n_voters}
+
+
+@app.get("/api/sessions/{session_id}/results/{method}")
+async def session_results(
+    session_id: str,
+    method: str,
+    request: Request,
+    params: Union[str, None] = None,
+    offset: int = 0,
+    limit: Union[int, None] = None
+) -> dict:
+    """API to aggregate the votes of a session.
+
+    Parameters
+    ----------
+    session_id : str
+        Identifier of the session.
+    method : str
+        Comchoice method.
+    request : Request
+        Request, whose `Accept` header defines the format of the response.
+    params : Union[str, None], optional
+        Arguments of the method as a JSON object, by default None.
+    offset : int, optional
+        Index of the first alternative returned, by default 0.
+    limit : Union[int, None], optional
+        Maximum number of alternatives returned, by default None.
+
+    Returns
+    -------
+    dict
+        Aggregation of preferences.
+    """
+    session = __get_session(session_id)
+    try:
+        tmp = await asyncio.to_thread(
+            session.result, method, json.loads(params) if params else {})
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return __encode(
+        request,
+        tmp,
+        meta={"session_id": session_id},
+        offset=offset,
+        limit=limit
+    )
+
+
+@app.get("/api/sessions/{session_id}/pairwise_matrix")
+async def session_pairwise_matrix(session_id: str, request: Request) -> dict:
+    """API to get the pairwise matrix of a session.
+
+    Parameters
+    ----------
+    session_id : str
+        Identifier of the session.
+    request : Request
+        Request, whose `Accept` header defines the format of the response.
+
+    Returns
+    -------
+    dict
+        Labels of the alternatives and pairwise matrix.
+    """
+    session = __get_session(session_id)
+    alternatives, matrix = await asyncio.to_thread(session.pairwise_matrix)
+
+    return __encode_matrix(
+        request, alternatives, matrix, meta={"session_id": session_id})
+
+
+@app.delete("/api/sessions/{session_id}")
+async def delete_session(session_id: str) -> dict:
+    """API to delete a session.
+
+    Parameters
+    ----------
+    session_id : str
+        Identifier of the session.
+
+    Returns
+    -------
+    dict
+        Identifier of the deleted session.
+    """
+    __get_session(session_id)
+    sessions.pop(session_id)
+    if SESSIONS_DB:
+        with sqlite3.connect(SESSIONS_DB) as con:
+            con.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
 
-    return {
-        "data": [],
-        "message": "Aggregation method not valid. Pleasy try another option."
-    }
+    return {"session_id": session_id}
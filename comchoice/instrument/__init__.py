@@ -0,0 +1,4 @@
+from .add_hook import add_hook
+from .record import Recording, record
+from .remove_hook import remove_hook
+from .stage import Span, stage
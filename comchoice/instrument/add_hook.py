@@ -0,0 +1,25 @@
+from comchoice.instrument.stage import _set_hooks
+
+
+def add_hook(hook):
+    """Registers a function that is called with every finished stage.
+
+    Parameters
+    ----------
+    hook : callable
+        Function that receives a `comchoice.instrument.stage.Span`. It is called
+        in the thread that ran the stage, after the stage has finished. Hooks are
+        global to the process, so it receives the stages of every thread.
+
+    Returns
+    -------
+    callable
+        The registered hook, so it can be used as a decorator.
+    """
+    if not callable(hook):
+        raise ValueError(
+            "Value provided to hook parameter not valid. Values accepted are callable objects")
+
+    _set_hooks(lambda hooks: hooks + (hook,))
+
+    return hook
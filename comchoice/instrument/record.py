@@ -0,0 +1,225 @@
+from contextlib import contextmanager
+import os
+import threading
+import tracemalloc
+import pandas as pd
+
+from comchoice.instrument.stage import _recordings
+
+# tracemalloc is process-wide: it is stopped when the last recording that
+# needs it ends, and only if a recording started it.
+_tracing = {"recordings": 0, "started": False}
+_tracing_lock = threading.Lock()
+
+
+class Recording:
+    """Stages measured by `comchoice.instrument.record`.
+
+    Attributes
+    ----------
+    spans : list
+        List of `comchoice.instrument.stage.Span` objects, in the order in which the stages finished.
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    def __repr__(self):
+        return f"Recording(n_spans={len(self.spans)})"
+
+    def __len__(self):
+        return len(self.spans)
+
+    @staticmethod
+    def _attributes(span):
+        attributes = {
+            "comchoice.rows_in": span.rows_in,
+            "comchoice.rows_out": span.rows_out,
+            "comchoice.memory_peak": span.memory_peak,
+            "comchoice.self_duration": span.self_duration,
+            **{f"comchoice.{key}": value for key, value in span.attributes.items()}
+        }
+
+        return {key: value for key, value in attributes.items() if value is not None}
+
+    def to_frame(self, aggregate: bool = False) -> pd.DataFrame:
+        """Converts the stages into a DataFrame.
+
+        Parameters
+        ----------
+        aggregate : bool, optional
+            Whether or not to summarize the stages by name, by default False. Whether True,
+            it returns the number of calls, the total and self durations, the maximum
+            peak of memory and the total number of input rows of each stage.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per stage (or per name of stage), sorted by start time.
+        """
+        df = pd.DataFrame([{
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start": span.start,
+            "end": span.end,
+            "duration": span.duration,
+            "self_duration": span.self_duration,
+            "memory_peak": span.memory_peak,
+            "rows_in": span.rows_in,
+            "rows_out": span.rows_out,
+            "error": span.error,
+            "attributes": span.attributes
+        } for span in self.spans], columns=[
+            "span_id", "parent_id", "name", "start", "end", "duration", "self_duration",
+            "memory_peak", "rows_in", "rows_out", "error", "attributes"
+        ])
+
+        df = df.astype({
+            "parent_id": "Int64",
+            "memory_peak": "Int64",
+            "rows_in": "Int64",
+            "rows_out": "Int64"
+        }).sort_values(["start", "span_id"]).reset_index(drop=True)
+
+        if aggregate:
+            df = df.groupby("name", sort=False).agg(
+                calls=("span_id", "count"),
+                duration=("duration", "sum"),
+                self_duration=("self_duration", "sum"),
+                memory_peak=("memory_peak", "max"),
+                rows_in=("rows_in", "sum")
+            ).sort_values("self_duration", ascending=False).reset_index()
+
+        return df
+
+    def to_spans(self, trace_id: str = None) -> list:
+        """Converts the stages into OpenTelemetry spans.
+
+        Spans follow the OTLP/JSON encoding, so they can be sent to an OpenTelemetry
+        collector inside `{"resourceSpans": [{"scopeSpans": [{"spans": spans}]}]}`.
+
+        Parameters
+        ----------
+        trace_id : str, optional
+            Trace identifier as 32 hexadecimal characters, by default a random identifier.
+
+        Returns
+        -------
+        list
+            List of dict objects, one per stage.
+        """
+        if trace_id is None:
+            trace_id = os.urandom(16).hex()
+
+        def encode(value):
+            if isinstance(value, bool):
+                return {"boolValue": value}
+            if isinstance(value, int):
+                return {"intValue": str(value)}
+            if isinstance(value, float):
+                return {"doubleValue": value}
+            return {"stringValue": str(value)}
+
+        output = []
+        for span in self.spans:
+            output.append({
+                "traceId": trace_id,
+                "spanId": f"{span.span_id:016x}",
+                "parentSpanId": f"{span.parent_id:016x}" if span.parent_id is not None else "",
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start),
+                "endTimeUnixNano": str(span.end),
+                "attributes": [
+                    {"key": key, "value": encode(value)}
+                    for key, value in self._attributes(span).items()
+                ],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+            })
+
+        return output
+
+    def to_opentelemetry(self, tracer) -> None:
+        """Exports the stages to an OpenTelemetry tracer.
+
+        Stages keep their start and end times, and nested stages are exported
+        as children of the stage in which they were called. It requires the
+        `opentelemetry-api` package.
+
+        Parameters
+        ----------
+        tracer : opentelemetry.trace.Tracer
+            Tracer that receives the spans.
+        """
+        from opentelemetry import trace
+        from opentelemetry.trace import Status, StatusCode
+
+        exported = {}
+        for span in sorted(self.spans, key=lambda x: (x.start, x.span_id)):
+            parent = exported.get(span.parent_id)
+            output = tracer.start_span(
+                span.name,
+                context=trace.set_span_in_context(parent) if parent is not None else None,
+                attributes=self._attributes(span),
+                start_time=span.start
+            )
+            if span.error:
+                output.set_status(Status(StatusCode.ERROR, span.error))
+            exported[span.span_id] = output
+
+        for span in self.spans:
+            exported[span.span_id].end(end_time=span.end)
+
+
+@contextmanager
+def record(memory: bool = True):
+    """Records the stages of the pipeline called inside the context.
+
+    Only the stages of the current thread (or asyncio task, and the tasks created
+    from it) are recorded, so concurrent recordings do not receive each other's stages.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Whether or not to measure the peak of memory of each stage with `tracemalloc`,
+        by default True. Tracing memory allocations slows down the stages.
+
+    Returns
+    -------
+    Recording
+        Stages measured inside the context.
+
+    Examples
+    --------
+    >>> from comchoice.aggregate import borda
+    >>> from comchoice.instrument import record
+    >>> with record() as recording:
+    ...     borda(df)
+    >>> recording.to_frame(aggregate=True)
+    """
+    recording = Recording()
+
+    if memory:
+        with _tracing_lock:
+            if _tracing["recordings"] == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracing["started"] = True
+            _tracing["recordings"] += 1
+
+    token = _recordings.set(_recordings.get() + (recording,))
+    try:
+        yield recording
+    finally:
+        try:
+            _recordings.reset(token)
+        except ValueError:
+            # The recording ended in another context (e.g., a generator resumed elsewhere).
+            _recordings.set(tuple(x for x in _recordings.get() if x is not recording))
+
+        if memory:
+            with _tracing_lock:
+                _tracing["recordings"] -= 1
+                if _tracing["recordings"] == 0 and _tracing["started"]:
+                    tracemalloc.stop()
+                    _tracing["started"] = False
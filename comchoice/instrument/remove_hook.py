@@ -0,0 +1,18 @@
+from comchoice.instrument.stage import _set_hooks
+
+
+def remove_hook(hook) -> None:
+    """Unregisters a function added with `comchoice.instrument.add_hook`.
+
+    Parameters
+    ----------
+    hook : callable
+        Registered function.
+    """
+    def remove(hooks):
+        hooks = list(hooks)
+        if hook in hooks:
+            hooks.remove(hook)
+        return hooks
+
+    _set_hooks(remove)
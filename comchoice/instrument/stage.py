@@ -0,0 +1,224 @@
+from contextvars import ContextVar
+from functools import wraps
+from itertools import count
+import threading
+from time import perf_counter, time_ns
+import tracemalloc
+
+# Hooks and recordings that receive finished spans. Hooks are global to the
+# process: the tuple is replaced under a lock when a hook is added or removed.
+# Recordings are kept per context (thread or asyncio task), so concurrent
+# pipelines do not record each other's spans. Stages are not measured while
+# both are empty, so the instrumentation costs a single check.
+_hooks = ()
+_hooks_lock = threading.Lock()
+_recordings = ContextVar("comchoice_recordings", default=())
+
+_current = ContextVar("comchoice_stage", default=None)
+_ids = count(1)
+
+
+def _set_hooks(function):
+    # Replaces the tuple of hooks with `function(hooks)`, so stages running in
+    # other threads keep iterating over the previous tuple.
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(function(_hooks))
+
+
+class Span:
+    """Measurement of a stage.
+
+    Attributes
+    ----------
+    name : str
+        Name of the stage.
+    span_id : int
+        Unique identifier of the span.
+    parent_id : int or None
+        Identifier of the span in which the stage was called, None for top-level stages.
+    start : int
+        Start time in nanoseconds since the epoch.
+    end : int
+        End time in nanoseconds since the epoch.
+    duration : float
+        Wall time in seconds.
+    children_duration : float
+        Wall time in seconds spent in nested stages.
+    memory_peak : int or None
+        Peak of memory allocated during the stage, in bytes. It is None when
+        `tracemalloc` is not tracing.
+    rows_in : int or None
+        Number of rows of the input data.
+    rows_out : int or None
+        Number of rows of the output data.
+    attributes : dict
+        Additional attributes of the stage.
+    error : str or None
+        Name of the exception raised in the stage.
+    """
+
+    def __init__(self, name, parent=None, rows_in=None, attributes=dict()):
+        self.name = name
+        self.parent = parent
+        self.span_id = next(_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.attributes = dict(attributes)
+        self.error = None
+        self.children_duration = 0.0
+        self.memory_peak = None
+        self.start = None
+        self.end = None
+        self.duration = None
+        self._memory = None
+        self._peak = 0
+        self._token = None
+        self._t0 = None
+
+    def __repr__(self):
+        return f"Span(name={self.name!r}, duration={self.duration}, memory_peak={self.memory_peak})"
+
+    @property
+    def self_duration(self) -> float:
+        """Wall time in seconds spent in the stage, excluding nested stages."""
+        return self.duration - self.children_duration
+
+    def _start(self):
+        if tracemalloc.is_tracing():
+            # tracemalloc keeps a single peak, so the peak reached so far is
+            # passed to the parent before it is reset for this stage.
+            current, peak = tracemalloc.get_traced_memory()
+            if self.parent is not None:
+                self.parent._peak = max(self.parent._peak, peak)
+            tracemalloc.reset_peak()
+            self._memory = self._peak = current
+
+        self._token = _current.set(self)
+        self.start = time_ns()
+        self._t0 = perf_counter()
+
+    def _end(self, exception=None):
+        self.duration = perf_counter() - self._t0
+        self.end = self.start + int(self.duration * 1e9)
+
+        try:
+            _current.reset(self._token)
+        except ValueError:
+            _current.set(self.parent)
+
+        if exception is not None:
+            self.error = type(exception).__name__
+
+        if self._memory is not None and tracemalloc.is_tracing():
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            self.memory_peak = peak - self._memory
+            if self.parent is not None:
+                self.parent._peak = max(self.parent._peak, peak)
+
+        if self.parent is not None:
+            self.parent.children_duration += self.duration
+
+        for recording in _recordings.get():
+            recording.spans.append(self)
+
+        for hook in _hooks:
+            hook(self)
+
+
+class _Stage:
+    def __init__(self, name=None, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self.span = None
+
+    @staticmethod
+    def _rows(data):
+        shape = getattr(data, "shape", None)
+        if shape is not None and len(shape) > 0:
+            return int(shape[0])
+
+        return None
+
+    def __enter__(self):
+        if not _hooks and not _recordings.get():
+            return None
+
+        attributes = dict(self.attributes)
+        self.span = Span(
+            self.name,
+            parent=_current.get(),
+            rows_in=attributes.pop("rows", None),
+            attributes=attributes
+        )
+        self.span._start()
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.span is not None:
+            self.span._end(exc_value)
+            self.span = None
+        return False
+
+    def __call__(self, function):
+        name = self.name if self.name is not None else function.__name__
+        attributes = self.attributes
+
+        @wraps(function)
+        def wrapper(*args, **kws):
+            if not _hooks and not _recordings.get():
+                return function(*args, **kws)
+
+            data = args[0] if len(args) > 0 else next(iter(kws.values()), None)
+            span = Span(
+                name,
+                parent=_current.get(),
+                rows_in=self._rows(data),
+                attributes=attributes
+            )
+            span._start()
+            try:
+                output = function(*args, **kws)
+            except BaseException as e:
+                span._end(e)
+                raise
+
+            span.rows_out = self._rows(output[0] if isinstance(output, tuple) else output)
+            span._end()
+            return output
+
+        return wrapper
+
+
+def stage(name=None, **attributes):
+    """Marks a stage of the pipeline to be measured.
+
+    It works as a decorator of functions (`@stage` or `@stage("name")`) and as a
+    context manager (`with stage("name", rows=n):`). Stages are only measured while
+    a hook (`comchoice.instrument.add_hook`) is registered, or a recording
+    (`comchoice.instrument.record`) is active in the current context (thread or asyncio
+    task), and otherwise the function is called directly.
+
+    For every call, it measures the wall time, the peak of memory allocated
+    (when `tracemalloc` is tracing) and the number of rows of the input and
+    output data. Stages called inside another stage are recorded as its children.
+
+    Parameters
+    ----------
+    name : str or callable, optional
+        Name of the stage, by default the name of the decorated function.
+    **attributes
+        Additional attributes of the stage. In the context manager, `rows`
+        defines the number of rows of the input data.
+
+    Returns
+    -------
+    callable or context manager
+        A decorated function, or a context manager that returns the `Span` of the
+        stage (None when the instrumentation is not active).
+    """
+    if callable(name):
+        return _Stage()(name)
+
+    return _Stage(name, **attributes)
@@ -1,7 +1,20 @@
-from .ballot_extend import ballot_extend
-from .score_extend import score_extend
-from .to_ballot import to_ballot
-from .to_individual_voter import to_individual_voter
-from .to_pairwise import to_pairwise
-from .to_rank import to_rank
-from .unpack_ballot import unpack_ballot
+# Functions are imported on first access, so importing a single function does
+# not load the dependencies of the others.
+from comchoice.__lazy_module import __lazy_module
+
+__all__ = [
+    "ballot_extend",
+    "load_profile",
+    "Profile",
+    "save_profile",
+    "score_extend",
+    "to_ballot",
+    "to_individual_voter",
+    "to_pairwise",
+    "to_profile",
+    "to_rank",
+    "unpack_ballot"
+]
+
+__getattr__, __dir__ = __lazy_module(
+    __name__, {attribute: attribute.lower() for attribute in __all__})
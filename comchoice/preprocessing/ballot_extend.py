@@ -1,6 +1,9 @@
 import pandas as pd
 
+from comchoice.instrument.stage import stage
 
+
+@stage
 def ballot_extend(
     df,
     ballot="ballot",
@@ -14,20 +17,19 @@ def ballot_extend(
     df = df.explode(ballot)
 
     df = df.rename(columns={ballot: "alternative"})
+    df["alternative"] = df["alternative"].str.split(delimiter_ties)
     if len(rmv) > 0:
-        df = df[~df["alternative"].isin(rmv)].copy()
-
-    df["rank_a"] = df.groupby("voter").cumcount() + 1
+        # Tied alternatives are removed individually.
+        df["alternative"] = df["alternative"].apply(
+            lambda x: [a for a in x if a not in rmv])
+        df = df[df["alternative"].map(len) > 0].copy()
 
-    df["alternative"] = df["alternative"].str.split(delimiter_ties)
+    # Tied alternatives share the position of the first of them (e.g., `a>b=c>d` is 1, 2, 2, 4).
     df["rank_b"] = df["alternative"].map(len)
-    df["rank_b"] = df.groupby("voter")["rank_b"].cumsum()
-
-    df["rank"] = df.apply(lambda x: x["rank_a"] if len(
-        x["alternative"]) > 1 else x["rank_b"], axis=1)
+    df["rank"] = df.groupby("voter")["rank_b"].cumsum() - df["rank_b"] + 1
     df = df.explode("alternative")
 
-    df = df.drop(columns=["rank_a", "rank_b"])
+    df = df.drop(columns=["rank_b"])
 
     if not unique_id:
         df = df.drop(columns=["voter"])
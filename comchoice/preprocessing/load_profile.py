@@ -0,0 +1,51 @@
+import json
+import os
+import numpy as np
+
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.save_profile import profile_format_version
+
+
+def load_profile(
+    path,
+    mmap_mode: str = "r",
+    get_metadata: bool = False
+):
+    """Loads a profile saved with `save_profile`.
+
+    By default, `ranks` and `weights` are memory-mapped, so opening a profile
+    does not read (nor copy) the ballots, and processes that load the same
+    profile share its pages.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Directory where the profile was saved.
+    mmap_mode : {"r", "r+", "c", None}, optional
+        Mode used to memory-map the arrays (see `np.load`). Whether None, the arrays
+        are read into memory, by default "r".
+    get_metadata : bool, optional
+        Whether this value is True, it returns a second dict with the metadata of the profile, by default False.
+
+    Returns
+    -------
+    Profile
+        Profile of preferences.
+    """
+    with open(os.path.join(path, "metadata.json")) as file:
+        metadata = json.load(file)
+
+    if metadata.get("format_version", 0) > profile_format_version:
+        raise ValueError(
+            f"Profile format version {metadata['format_version']} is not supported. Versions accepted are up to {profile_format_version}")
+
+    profile = Profile(
+        np.load(os.path.join(path, "ranks.npy"), mmap_mode=mmap_mode),
+        weights=np.load(os.path.join(path, "weights.npy"), mmap_mode=mmap_mode),
+        alternatives=np.load(os.path.join(path, "alternatives.npy"))
+    )
+
+    if get_metadata:
+        return profile, metadata
+
+    return profile
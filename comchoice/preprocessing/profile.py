@@ -0,0 +1,265 @@
+import numpy as np
+import pandas as pd
+
+
+def _rank_dtype(n_alternatives):
+    return np.min_scalar_type(-(n_alternatives + 1))
+
+
+def _unique_rows(ranks):
+    n, m = ranks.shape
+    if m * np.log2(m + 2) < 62:
+        keys = np.zeros(n, dtype=np.int64)
+        for j in range(m):
+            keys = keys * (m + 2) + ranks[:, j]
+        inverse, _ = pd.factorize(keys)
+        index = np.empty(inverse.max() + 1 if n > 0 else 0, dtype=np.int64)
+        index[inverse[::-1]] = np.arange(n - 1, -1, -1)
+        return index, inverse
+
+    ranks = np.ascontiguousarray(ranks)
+    rows = ranks.view(np.dtype((np.void, ranks.dtype.itemsize * m)))
+    _, index, inverse = np.unique(
+        rows.ravel(), return_index=True, return_inverse=True)
+    return index, inverse.ravel()
+
+
+def _chunks(n, size):
+    for start in range(0, n, max(size, 1)):
+        yield slice(start, min(start + size, n))
+
+
+class Profile:
+    """Profile of preferences.
+
+    The class `Profile` is a compact, int-coded representation of a set of
+    ballots. Each row of `ranks` represents a ballot (or a group of voters with
+    the same ballot, whose size is given by `weights`), and each column an
+    alternative.
+
+    Parameters
+    ----------
+    ranks : np.ndarray
+        Matrix of shape (n_ballots, n_alternatives) with the position of each alternative
+        in each ballot, starting at 1. Tied alternatives share the same position
+        (e.g., `a>b=c>d` is coded as 1, 2, 2, 4), and 0 means that the alternative is not ranked.
+    weights : np.ndarray, optional
+        Number of voters of each ballot, by default 1.
+    alternatives : array-like, optional
+        Labels of the alternatives, by default 0, 1, ..., n_alternatives - 1.
+    """
+
+    def __init__(self, ranks, weights=None, alternatives=None):
+        self.ranks = np.asarray(ranks)
+        self.weights = np.ones(self.ranks.shape[0], dtype=np.int64) \
+            if weights is None else np.asarray(weights)
+        self.alternatives = np.arange(self.ranks.shape[1]) \
+            if alternatives is None else np.asarray(alternatives)
+
+    def __repr__(self):
+        return f"Profile(n_ballots={self.n_ballots}, n_alternatives={self.n_alternatives}, n_voters={self.n_voters})"
+
+    def __len__(self):
+        return self.n_ballots
+
+    @property
+    def n_alternatives(self) -> int:
+        return self.ranks.shape[1]
+
+    @property
+    def n_ballots(self) -> int:
+        return self.ranks.shape[0]
+
+    @property
+    def n_voters(self):
+        return self.weights.sum()
+
+    @classmethod
+    def from_orders(
+        cls,
+        orders,
+        weights=None,
+        alternatives=None,
+        n_alternatives=None
+    ):
+        """Creates a profile from orders of alternatives.
+
+        Parameters
+        ----------
+        orders : np.ndarray
+            Matrix of shape (n_ballots, k) with the index of the alternatives sorted
+            from the most to the least preferred. Ballots with less than k alternatives
+            are padded with -1.
+        weights : np.ndarray, optional
+            Number of voters of each ballot, by default 1.
+        alternatives : array-like, optional
+            Labels of the alternatives, by default None.
+        n_alternatives : int, optional
+            Number of alternatives, by default the length of `alternatives`,
+            or k when `alternatives` is not defined.
+
+        Returns
+        -------
+        Profile
+            Profile of preferences.
+        """
+        orders = np.asarray(orders)
+        n, k = orders.shape
+        if n_alternatives is None:
+            n_alternatives = k if alternatives is None else len(alternatives)
+
+        ranks = np.zeros((n, n_alternatives + 1), dtype=_rank_dtype(n_alternatives))
+        positions = np.arange(1, k + 1, dtype=ranks.dtype)
+        for s in _chunks(n, 2 ** 20):
+            _orders = orders[s]
+            np.put_along_axis(
+                ranks[s],
+                np.where(_orders < 0, n_alternatives, _orders),
+                np.broadcast_to(positions, _orders.shape),
+                axis=1
+            )
+
+        return cls(
+            np.ascontiguousarray(ranks[:, :n_alternatives]),
+            weights=weights,
+            alternatives=alternatives
+        )
+
+    @property
+    def orders(self) -> np.ndarray:
+        """Index of the alternatives sorted from the most to the least preferred.
+
+        Tied alternatives are sorted by their index, and ballots are padded with -1
+        after the last ranked alternative.
+        """
+        m = self.n_alternatives
+        key = np.where(self.ranks > 0, self.ranks, m + 1)
+        orders = np.argsort(key, axis=1, kind="stable").astype(_rank_dtype(m))
+        orders[np.take_along_axis(key, orders, axis=1) > m] = -1
+
+        return orders
+
+    def compress(self):
+        """Merges identical ballots, adding up their weights.
+
+        Returns
+        -------
+        Profile
+            Profile of unique ballots.
+        """
+        index, inverse = _unique_rows(self.ranks)
+
+        weights = np.bincount(inverse, weights=self.weights)
+        if np.issubdtype(self.weights.dtype, np.integer):
+            weights = weights.astype(self.weights.dtype)
+
+        return Profile(self.ranks[index], weights=weights, alternatives=self.alternatives)
+
+    def to_ballot(
+        self,
+        ballot="ballot",
+        delimiter=">",
+        delimiter_ties="=",
+        voters="voters"
+    ) -> pd.DataFrame:
+        """Converts the profile into a ballot DataFrame.
+
+        Parameters
+        ----------
+        ballot : str, optional
+            Column label of the ballots, by default "ballot".
+        delimiter : str, optional
+            Delimiter used between alternatives in a `ballot`, by default ">".
+        delimiter_ties : str, optional
+            Delimiter used between tied alternatives in a `ballot`, by default "=".
+        voters : str, optional
+            Column label of the number of voters of each ballot, by default "voters".
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per ballot.
+        """
+        index, inverse = _unique_rows(self.ranks)
+
+        unique = Profile(self.ranks[index], alternatives=self.alternatives)
+        orders = unique.orders
+        sorted_ranks = np.take_along_axis(unique.ranks, np.maximum(orders, 0), axis=1)
+        separators = np.where(
+            sorted_ranks[:, 1:] == sorted_ranks[:, :-1], delimiter_ties, delimiter)
+        labels = self.alternatives.astype(str)
+
+        output = []
+        for order, separator in zip(orders, separators):
+            n = (order >= 0).sum()
+            items = labels[order[:n]]
+            output.append(
+                "".join(a + s for a, s in zip(items, separator[:n - 1])) + (items[-1] if n > 0 else ""))
+
+        return pd.DataFrame({
+            ballot: np.asarray(output, dtype=object)[inverse],
+            voters: self.weights
+        })
+
+    def pairwise_matrix(self) -> np.ndarray:
+        """Computes the pairwise matrix of the profile.
+
+        The value in row `a` and column `b` is the number of voters that rank
+        `a` over `b`. Tied alternatives, and alternatives that are not ranked in a ballot,
+        are not compared, as in `comchoice.aggregate.pairwise_matrix`.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of shape (n_alternatives, n_alternatives).
+        """
+        m = self.n_alternatives
+        output = np.zeros((m, m))
+        for s in _chunks(self.n_ballots, 2 ** 22 // max(m * m, 1)):
+            r = self.ranks[s]
+            ranked = r > 0
+            wins = (r[:, :, None] < r[:, None, :]) & ranked[:, :, None] & ranked[:, None, :]
+            output += np.tensordot(self.weights[s], wins, axes=1)
+
+        return output
+
+    def rank_matrix(self) -> np.ndarray:
+        """Computes the positional matrix of the profile.
+
+        The value in row `a` and column `k` is the number of voters that rank
+        `a` in the position `k + 1`.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of shape (n_alternatives, n_alternatives).
+        """
+        m = self.n_alternatives
+        output = np.zeros(m * m + 1)
+        offset = np.arange(m) * m - 1
+        for s in _chunks(self.n_ballots, 2 ** 22 // max(m, 1)):
+            r = self.ranks[s].astype(np.int64)
+            idx = np.where(r > 0, r + offset, m * m)
+            output += np.bincount(
+                idx.ravel(),
+                weights=np.repeat(self.weights[s], m),
+                minlength=m * m + 1
+            )
+
+        return output[:-1].reshape(m, m)
+
+    def first_preferences(self) -> np.ndarray:
+        """Computes the number of voters that rank each alternative first.
+
+        Returns
+        -------
+        np.ndarray
+            Array of length n_alternatives.
+        """
+        m = self.n_alternatives
+        output = np.zeros(m)
+        for s in _chunks(self.n_ballots, 2 ** 22 // max(m, 1)):
+            rows, cols = np.nonzero(self.ranks[s] == 1)
+            output += np.bincount(cols, weights=self.weights[s][rows], minlength=m)
+
+        return output
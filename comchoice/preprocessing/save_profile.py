@@ -0,0 +1,60 @@
+import json
+import os
+import numpy as np
+
+from comchoice.preprocessing.profile import Profile
+from comchoice.preprocessing.to_profile import to_profile
+
+profile_format_version = 1
+
+
+def save_profile(
+    data,
+    path,
+    metadata: dict = dict(),
+    **kws
+):
+    """Saves a profile in a binary format.
+
+    The profile is stored in a directory with one `.npy` file for each array
+    (`ranks`, `weights` and `alternatives`) and a `metadata.json` file, so it
+    can be loaded with `load_profile` as memory-mapped arrays.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Profile
+        A data set of ballots, or a profile.
+    path : str or os.PathLike
+        Directory where the profile is saved. It is created if it does not exist.
+    metadata : dict, optional
+        Additional metadata of the election (JSON serializable), by default dict().
+    **kws
+        Arguments passed to `to_profile` when `data` is a DataFrame
+        (e.g., `ballot`, `delimiter`, `delimiter_ties`, `voters`).
+
+    Returns
+    -------
+    Profile
+        Profile that was saved.
+    """
+    profile = data if isinstance(data, Profile) else to_profile(data, **kws)
+
+    alternatives = profile.alternatives
+    if alternatives.dtype == object:
+        alternatives = alternatives.astype(str)
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, "ranks.npy"), np.ascontiguousarray(profile.ranks))
+    np.save(os.path.join(path, "weights.npy"), np.ascontiguousarray(profile.weights))
+    np.save(os.path.join(path, "alternatives.npy"), alternatives)
+
+    with open(os.path.join(path, "metadata.json"), "w") as file:
+        json.dump({
+            "format_version": profile_format_version,
+            "n_alternatives": int(profile.n_alternatives),
+            "n_ballots": int(profile.n_ballots),
+            "n_voters": profile.n_voters.item(),
+            **metadata
+        }, file, indent=2)
+
+    return profile
@@ -1,6 +1,9 @@
 import pandas as pd
 
+from comchoice.instrument.stage import stage
 
+
+@stage
 def score_extend(
     df,
     delimiter=";",
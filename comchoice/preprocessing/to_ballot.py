@@ -1,4 +1,3 @@
-import networkx as nx
 import pandas as pd
 
 
@@ -17,6 +16,8 @@ def to_ballot(
     df["_id"] = range(df.shape[0])
 
     if dtype == "pairwise":
+        import networkx as nx
+
         output = []
         for v, tmp in df.groupby(voter):
             l = tmp.apply(lambda x:
@@ -1,14 +1,17 @@
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 from itertools import combinations
 
+from comchoice.instrument.stage import stage
 
+
+@stage
 def to_pairwise(
     df,
     alternative="alternative",
     ascending=False,
     delimiter=">",
+    delimiter_ties="=",
     alternative_a="alternative_a",
     alternative_b="alternative_b",
     selected="selected",
@@ -27,6 +30,11 @@ def to_pairwise(
         _description_
     alternative : str, optional
         _description_, by default "alternative"
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+        Tied alternatives are comparisons with a tie (`selected` equals 0).
     alternative_a : str, optional
         _description_, by default "alternative_a"
     alternative_b : str, optional
@@ -46,7 +54,6 @@ def to_pairwise(
         _description_
     """
 
-    # TODO: Allow ties
     if dtype in ["ballot", "ballot_extended"]:
         if voters in list(df):
             output = []
@@ -56,23 +63,32 @@ def to_pairwise(
             df = pd.concat(output, ignore_index=True)
             df[voter] = range(df.shape[0])
 
+        # Pairs of tied alternatives are comparisons with a tie (selected equals 0).
         df[ballot] = df[ballot].astype(str).str.split(delimiter).apply(
-            lambda x: list(combinations(x, 2)))
+            lambda x: [
+                (a, b, a if rank_a < rank_b else 0)
+                for (a, rank_a), (b, rank_b) in combinations(
+                    [(a, rank) for rank, group in enumerate(x) for a in group.split(delimiter_ties)], 2)
+            ])
         df = df.explode(ballot)
 
         df[alternative_a] = df[ballot].apply(lambda x: x[0])
         df[alternative_b] = df[ballot].apply(lambda x: x[1])
 
-        df[selected] = df[alternative_a]
+        df[selected] = df[ballot].apply(lambda x: x[2])
 
         return df[[voter, alternative_a, alternative_b, selected]]
 
     _data_tmp = df.groupby(voter)
-    _iter = tqdm(
-        _data_tmp,
-        position=0,
-        leave=True
-    ) if verbose else _data_tmp
+    _iter = _data_tmp
+    if verbose:
+        from tqdm import tqdm
+
+        _iter = tqdm(
+            _data_tmp,
+            position=0,
+            leave=True
+        )
 
     output = []
     for user_id, df_tmp in _iter:
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from comchoice.preprocessing.profile import Profile, _rank_dtype
+
+
+def to_profile(
+    df,
+    ballot="ballot",
+    delimiter=">",
+    delimiter_ties="=",
+    voters="voters",
+    alternatives=None,
+    rmv=[]
+) -> Profile:
+    """Converts a ballot DataFrame into a compact, int-coded profile.
+
+    Identical ballots are parsed once, and their number of voters is added up.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A data set of ballots.
+    ballot : str, optional
+        Column label that includes a set of sorted alternatives for each voter or voters (when is defined in the data set), by default "ballot".
+    delimiter : str, optional
+        Delimiter used between alternatives in a `ballot`, by default ">".
+    delimiter_ties : str, optional
+        Delimiter used between tied alternatives in a `ballot`, by default "=".
+    voters : str, optional
+        Whether the number of voters is defined in the data, it represents its column label, by default "voters".
+    alternatives : list, optional
+        Labels of the alternatives, in the order used to code them. Alternatives
+        that are not included in the list are appended at the end, by default None.
+    rmv : list, optional
+        List of alternatives to exclude from the ballots, by default [].
+
+    Returns
+    -------
+    Profile
+        Profile of unique ballots.
+    """
+    codes, unique_ballots = pd.factorize(df[ballot].astype(str))
+    w = df[voters].values if voters in list(df) else np.ones(len(codes), dtype=np.int64)
+    weights = np.bincount(codes, weights=w, minlength=len(unique_ballots))
+    if np.issubdtype(w.dtype, np.integer):
+        weights = weights.astype(np.int64)
+
+    groups = pd.Series(unique_ballots).str.split(delimiter).explode()
+    items = groups.str.split(delimiter_ties)
+    group_id = np.repeat(np.arange(len(items)), items.str.len().values)
+    items = items.explode()
+
+    keep = (items != "").values & ~items.isin(rmv).values
+    labels = items.values[keep]
+    b = items.index.values[keep]
+    g = group_id[keep]
+
+    n = len(labels)
+    position = np.arange(n)
+    ballot_start = np.r_[True, b[1:] != b[:-1]] if n > 0 else np.zeros(0, dtype=bool)
+    group_start = np.r_[True, g[1:] != g[:-1]] if n > 0 else np.zeros(0, dtype=bool)
+    first_item = np.maximum.accumulate(np.where(ballot_start, position, 0))
+    first_group_item = np.maximum.accumulate(np.where(group_start, position, 0))
+    rank = first_group_item - first_item + 1
+
+    if alternatives is None:
+        alt_codes, alternatives = pd.factorize(labels)
+    else:
+        alternatives = pd.Index(alternatives)
+        alt_codes = alternatives.get_indexer(labels)
+        missing = alt_codes < 0
+        if missing.any():
+            new_codes, new_alternatives = pd.factorize(labels[missing])
+            alt_codes[missing] = new_codes + len(alternatives)
+            alternatives = alternatives.append(pd.Index(new_alternatives))
+
+    m = len(alternatives)
+    ranks = np.zeros((len(unique_ballots), m), dtype=_rank_dtype(m))
+    ranks[b, alt_codes] = rank
+
+    return Profile(ranks, weights=weights, alternatives=np.asarray(alternatives))
@@ -1,12 +1,14 @@
 import numpy as np
 import pandas as pd
 
+from comchoice.instrument.stage import stage
 from comchoice.preprocessing.ballot_extend import ballot_extend
 from comchoice.preprocessing.score_extend import score_extend
 from comchoice.preprocessing.to_ballot import to_ballot
 from comchoice.preprocessing.to_pairwise import to_pairwise
 
 
+@stage
 def transform(
     df,
     dtype_from="ballot",
@@ -74,6 +76,7 @@ def transform(
             alternative=alternative,
             ascending=ascending,
             delimiter=delimiter,
+            delimiter_ties=delimiter_ties,
             alternative_a=alternative_a,
             alternative_b=alternative_b,
             selected=selected,